@@ -0,0 +1,73 @@
+"""
+Wall time of generating many configurations sharing a few translation directories: \
+one `python -m l10n.generator` process per configuration against one `python -m l10n.batch` run.
+
+    python -m benchmarks.bench_batch --services 60 --directories 3 --keys 2000 --locales 10
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.synthetic import write_catalog
+
+
+def write_services(directory: str, services: int, directories: int, keys: int, locales: int) -> list[str]:
+    """
+    Writes `directories` catalogs and `services` configurations using them round-robin, returns the configurations.
+    """
+    shared = [
+        write_catalog(os.path.join(directory, f"shared{i}"), keys, locales, seed=i)
+        for i in range(directories)
+    ]
+    configs = []
+    for i in range(services):
+        with open(shared[i % directories], encoding="utf-8") as file:
+            lines = file.read().splitlines()
+        service = os.path.join(directory, "services", f"service{i:03}")
+        os.makedirs(service)
+        lines = [
+            f"pathToOut: {os.path.join(service, 'app_localization.py')}" if line.startswith("pathToOut:") else line
+            for line in lines
+        ]
+        config = os.path.join(service, "configuration.yml")
+        with open(config, "w", encoding="utf-8") as file:
+            file.write("\n".join(lines) + "\n")
+        configs.append(config)
+    return configs
+
+
+def run(command: list[str]) -> float:
+    start = time.perf_counter()
+    subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--services", type=int, default=60)
+    parser.add_argument("--directories", type=int, default=3)
+    parser.add_argument("--keys", type=int, default=2000)
+    parser.add_argument("--locales", type=int, default=10)
+    parser.add_argument("--jobs", type=int, default=0, help="Workers of the batch run, 0 - one per CPU")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        configs = write_services(directory, args.services, args.directories, args.keys, args.locales)
+        separate = sum(
+            run([sys.executable, "-m", "l10n.generator", f"--config={config}", "--force"])
+            for config in configs
+        )
+        serial = run([sys.executable, "-m", "l10n.batch", "--force", "--jobs", "1", *configs])
+        parallel = run([sys.executable, "-m", "l10n.batch", "--force", "--jobs", str(args.jobs), *configs])
+
+    print(f"{args.services} configurations, {args.directories} translation directories")
+    print(f"{'one process per config':<28}{separate:>10.2f} s")
+    print(f"{'batch, 1 job':<28}{serial:>10.2f} s ({separate / serial:.1f}x)")
+    print(f"{f'batch, --jobs {args.jobs}':<28}{parallel:>10.2f} s ({separate / parallel:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
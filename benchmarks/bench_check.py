@@ -0,0 +1,46 @@
+"""
+Wall time of validating a whole catalog with `python -m l10n.generator --check` (one job and one job per CPU) \
+against a full `--force` generation of the same catalog.
+
+    python -m benchmarks.bench_check --keys 2000 --locales 100
+"""
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.synthetic import write_catalog
+
+
+def run(command: list[str]) -> float:
+    start = time.perf_counter()
+    subprocess.run(command, stdout=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--keys", type=int, default=2000)
+    parser.add_argument("--locales", type=int, default=100)
+    parser.add_argument("--variable-ratio", type=float, default=0.3)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        config = write_catalog(directory, args.keys, args.locales, variable_ratio=args.variable_ratio)
+        generator = [sys.executable, "-m", "l10n.generator", f"--config={config}"]
+        variants = {
+            "--check --jobs 1": generator + ["--check", "--jobs", "1"],
+            "--check": generator + ["--check"],
+            "--force": generator + ["--force"],
+        }
+        results = {name: min(run(command) for _ in range(args.repeat)) for name, command in variants.items()}
+
+    print(f"{args.locales} locales, {args.keys} keys")
+    for name, seconds in results.items():
+        print(f"{name:<20}{seconds:>10.2f} s")
+
+
+if __name__ == "__main__":
+    main()
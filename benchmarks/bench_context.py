@@ -0,0 +1,107 @@
+"""
+Compares the per-request locale bound in a ContextVar (`use_locale()` / `of()` of the generated module) \
+with building `AppLocalization(locale).of()` in the handler and passing it down the call stack.
+Thousands of interleaved asyncio tasks and a thread pool serve requests in mixed locales, \
+every result is checked against the expected locale.
+
+    python -m benchmarks.bench_context --tasks 5000 --locales 20
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.synthetic import language_codes, load_module, write_catalog
+from l10n.generator import Generator
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--keys", type=int, default=200)
+    parser.add_argument("--locales", type=int, default=20)
+    parser.add_argument("--tasks", type=int, default=5000)
+    parser.add_argument("--lookups", type=int, default=50, help="translations rendered per request")
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        config = write_catalog(directory, args.keys, args.locales, missing_ratio=0.0, variable_ratio=0.0)
+        generator = Generator(config)
+        generator.parse_config()
+        generator.unmarshal()
+        generator.generate()
+        module = load_module(generator.configuration.path_to_out)
+
+    codes = language_codes(args.locales)
+    requests = [codes[i % len(codes)] for i in range(args.tasks)]
+    keys = [f"key{i % args.keys}" for i in range(args.lookups)]
+
+    def render_passed(of) -> str:
+        return getattr(of, keys[-1])
+
+    def render_context() -> str:
+        return getattr(module.of(), keys[-1])
+
+    def explicit(locale: str) -> bool:
+        of = module.AppLocalization(locale).of()
+        for key in keys:
+            getattr(of, key)
+        return render_passed(of).startswith(locale)
+
+    def contextual(locale: str) -> bool:
+        with module.use_locale(locale):
+            for key in keys:
+                getattr(module.of(), key)
+            return render_context().startswith(locale)
+
+    async def explicit_task(locale: str) -> bool:
+        of = module.AppLocalization(locale).of()
+        await asyncio.sleep(0)
+        for key in keys:
+            getattr(of, key)
+        await asyncio.sleep(0)
+        return render_passed(of).startswith(locale)
+
+    async def contextual_task(locale: str) -> bool:
+        token = module.set_locale(locale)
+        try:
+            await asyncio.sleep(0)
+            for key in keys:
+                getattr(module.of(), key)
+            await asyncio.sleep(0)
+            return render_context().startswith(locale)
+        finally:
+            module.reset_locale(token)
+
+    async def serve(handler) -> list[bool]:
+        return await asyncio.gather(*(handler(locale) for locale in requests))
+
+    def run_asyncio(handler) -> list[bool]:
+        return asyncio.run(serve(handler))
+
+    def run_threads(handler) -> list[bool]:
+        with ThreadPoolExecutor(max_workers=args.threads) as executor:
+            return list(executor.map(handler, requests, chunksize=64))
+
+    print(f"{args.tasks} requests, {args.locales} locales, {args.lookups} lookups per request")
+    print(f"{'scenario':<24}{'explicit ms':>14}{'context ms':>14}{'errors':>8}")
+    for name, runner, explicit_handler, context_handler in (
+        ("asyncio tasks", run_asyncio, explicit_task, contextual_task),
+        (f"{args.threads} threads", run_threads, explicit, contextual),
+    ):
+        timings = []
+        errors = 0
+        for handler in (explicit_handler, context_handler):
+            best = float("inf")
+            for _ in range(3):
+                start = time.perf_counter()
+                results = runner(handler)
+                best = min(best, time.perf_counter() - start)
+                errors += results.count(False)
+            timings.append(best * 1e3)
+        print(f"{name:<24}{timings[0]:>14.2f}{timings[1]:>14.2f}{errors:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Lookup latency of the generated module with and without `instrumentation: true`: \
+`AppLocalization(locale).of()` followed by a property, a fallback property and a parameterized method.
+The instrumented module is measured with the counters enabled and paused by `enable_counters(False)`.
+
+    python -m benchmarks.bench_instrumentation --keys 1000 --locales 10
+"""
+import argparse
+import os
+import tempfile
+import timeit
+
+from benchmarks.synthetic import language_codes, load_module, write_catalog
+from l10n.generator import Generator
+
+
+def generate(directory: str, keys: int, locales: int, instrumentation: bool):
+    config = write_catalog(directory, keys, locales, missing_ratio=0.2, variable_ratio=0.3)
+    if instrumentation:
+        with open(config, "a", encoding="utf-8") as file:
+            file.write("instrumentation: true\n")
+    generator = Generator(config)
+    generator.parse_config()
+    generator.unmarshal()
+    generator.generate()
+    merged = generator.merged
+    return load_module(generator.configuration.path_to_out, f"bench_instrumentation_{instrumentation}"), merged
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--keys", type=int, default=1000)
+    parser.add_argument("--locales", type=int, default=10)
+    parser.add_argument("--number", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    modules = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for instrumentation in (False, True):
+            path = os.path.join(directory, str(instrumentation))
+            os.makedirs(path)
+            modules[instrumentation], merged = generate(path, args.keys, args.locales, instrumentation)
+
+    locale = language_codes(args.locales)[-1]
+    table = merged.table[locale]
+    missing = set(merged.report[locale].missing)
+    plain = next(val.value for val in table if val.params is None and val.value not in missing)
+    fallback = next(val.value for val in table if val.params is None and val.value in missing)
+    parameterized = next(val.value for val in table if val.params is not None)
+
+    def scenarios(module):
+        localization = module.AppLocalization
+        return {
+            "of() + property": lambda: getattr(localization(locale).of(), plain),
+            "of() + fallback property": lambda: getattr(localization(locale).of(), fallback),
+            "of() + method": lambda: getattr(localization(locale).of(), parameterized)("x", 1),
+        }
+
+    baseline, instrumented = scenarios(modules[False]), scenarios(modules[True])
+    enable_counters = modules[True].enable_counters
+    print(f"{args.keys} keys, {args.locales} locales, lookups in {locale}")
+    print(f"{'lookup':<28}{'off ns':>10}{'paused ns':>11}{'overhead':>10}{'on ns':>10}{'overhead':>10}")
+    for name in baseline:
+        # Many short interleaved runs, so all variants see the same machine noise and the minimum is stable
+        off, paused, on = float("inf"), float("inf"), float("inf")
+        for _ in range(args.repeat):
+            off = min(off, timeit.timeit(baseline[name], number=args.number))
+            enable_counters(False)
+            paused = min(paused, timeit.timeit(instrumented[name], number=args.number))
+            enable_counters(True)
+            on = min(on, timeit.timeit(instrumented[name], number=args.number))
+        off, paused, on = (value / args.number * 1e9 for value in (off, paused, on))
+        print(
+            f"{name:<28}{off:>10.1f}{paused:>11.1f}{(paused / off - 1) * 100:>9.1f}%"
+            f"{on:>10.1f}{(on / off - 1) * 100:>9.1f}%"
+        )
+    snapshot = modules[True].snapshot_counters()
+    print(f"counted hits in {locale}: {sum(snapshot['hits'][locale].values())}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Compares `Generator.merge` with the linear scan `generate` used before it.
+
+    python -m benchmarks.bench_merge --keys 2000 --locales 20
+"""
+import argparse
+import tempfile
+import time
+
+from benchmarks.synthetic import write_catalog
+from l10n.generator import Generator
+
+
+def legacy_merge(generator: Generator) -> dict:
+    default_node = generator.registry.get(generator.default_language_code)
+    table = {}
+    for node in generator.registry:
+        merged = []
+        for default_val in default_node.translate:
+            current_property = next((prop for prop in node.translate if prop.value == default_val.value), None)
+            merged.append(current_property if current_property else default_val)
+        table[node.language_code] = merged
+    return table
+
+
+def rows(table: dict) -> dict:
+    """
+    The merged table as (key, text, params) tuples, params are compared by identity.
+    """
+    return {
+        language_code: [(val.value, val.text, val.params) for val in objects]
+        for language_code, objects in table.items()
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--keys", type=int, default=2000)
+    parser.add_argument("--locales", type=int, default=20)
+    parser.add_argument("--missing-ratio", type=float, default=0.1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        generator = Generator(write_catalog(directory, args.keys, args.locales, args.missing_ratio))
+        generator.parse_config()
+        generator.unmarshal()
+
+        start = time.perf_counter()
+        legacy = legacy_merge(generator)
+        legacy_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        merged = generator.merge()
+        merge_time = time.perf_counter() - start
+
+        assert rows(legacy) == rows(merged.table)
+
+        print(f"keys={args.keys} locales={args.locales}")
+        print(f"linear scan: {legacy_time:.4f}s")
+        print(f"indexed:     {merge_time:.4f}s ({legacy_time / merge_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
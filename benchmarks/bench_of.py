@@ -0,0 +1,57 @@
+"""
+Compares `AppLocalization(locale).of()` of the generated module (a dict lookup of a cached instance) \
+with `of()` as it was generated before: an if/elif chain creating a new instance on every call.
+The last locale is looked up, the worst case of the chain.
+
+    python -m benchmarks.bench_of --locales 40
+"""
+import argparse
+import tempfile
+import timeit
+
+from benchmarks.synthetic import language_codes, load_module, write_catalog
+from l10n.generator import Generator
+
+
+def legacy_of(module, locales: int):
+    """
+    `of()` as it was generated before, compiled in the namespace of the generated module.
+    """
+    source = "def of(locale):\n"
+    for i, code in enumerate(language_codes(locales)):
+        source += f"    {'if' if i == 0 else 'elif'} locale == {code!r}:\n        return AppLocalization{code.capitalize()}()\n"
+    source += "    else:\n        raise ValueError(f'No {locale} localization.')\n"
+    namespace = dict(vars(module))
+    exec(source, namespace)
+    return namespace["of"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--keys", type=int, default=20)
+    parser.add_argument("--locales", type=int, default=40)
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        config = write_catalog(directory, keys=args.keys, locales=args.locales)
+        generator = Generator(config)
+        generator.parse_config()
+        generator.unmarshal()
+        generator.generate()
+        module = load_module(generator.configuration.path_to_out)
+
+        locale = language_codes(args.locales)[-1]
+        localization = module.AppLocalization(locale)
+        of = legacy_of(module, args.locales)
+        assert type(of(locale)) is type(localization.of())
+
+        new = min(timeit.repeat(localization.of, number=args.number, repeat=5)) / args.number * 1e9
+        old = min(timeit.repeat(lambda: of(locale), number=args.number, repeat=5)) / args.number * 1e9
+        print(f"locales={args.locales} locale={locale}")
+        print(f"if/elif + new instance: {old:.0f} ns")
+        print(f"dict + cached instance: {new:.0f} ns ({old / new:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
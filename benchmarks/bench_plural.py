@@ -0,0 +1,92 @@
+"""
+Cost of selecting a plural form: a generated plural method against a single-form method (the lower bound) \
+and against selecting the form in application code, over a range of integers for languages with \
+2 to 6 plural categories. The runtime catalog (`l10n.runtime.Catalog`) is measured as well.
+
+    python -m benchmarks.bench_plural --max 1000
+"""
+import argparse
+import json
+import os
+import tempfile
+import timeit
+
+from benchmarks.synthetic import load_module
+from l10n.generator import Generator
+from l10n.plural import plural_rule
+from l10n.runtime import Catalog, Localization
+
+LOCALES = ("en", "fr", "ru", "pl", "cy", "ar")
+
+
+def write_catalog(directory: str) -> str:
+    """
+    Every locale defines `items` with a form for each of its categories and `itemsSingle` with one form.
+    """
+    translates = os.path.join(directory, "translates")
+    os.makedirs(translates)
+    for locale in LOCALES:
+        meta = {"variables": {"count": {"type": "int"}}}
+        forms = {category: f"{{count}} {locale} {category}" for category in plural_rule(locale).categories}
+        data = {"items": forms, "#items": meta, "itemsSingle": f"{{count}} {locale} other", "#itemsSingle": meta}
+        with open(os.path.join(translates, f"l10n_{locale}.json"), "w", encoding="utf-8") as file:
+            json.dump(data, file)
+    config = os.path.join(directory, "configuration.yml")
+    with open(config, "w", encoding="utf-8") as file:
+        file.write(
+            f"pathToTranslates: {translates}/\n"
+            f"pathToOut: {os.path.join(directory, 'plural_localization.py')}\n"
+            "defaultTranslateFile: l10n_en.json\n"
+            "className: AppLocalization\n"
+        )
+    return config
+
+
+def in_application(of, rule):
+    """
+    What the application does without plural messages: computes the category itself on every call \
+    and formats one of the per-form texts.
+    """
+    categories = rule.categories
+    select = rule.select
+    forms = {category: f"{{}} {of.__class__.__name__} {category}" for category in categories}
+
+    def items(count: int) -> str:
+        return forms[categories[select(count)]].format(count)
+
+    return items
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--max", type=int, default=1000, help="Numbers 0..max-1 are rendered")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        config = write_catalog(directory)
+        generator = Generator(config)
+        generator.build()
+        module = load_module(generator.output_path, "bench_plural_localization")
+        catalog = Catalog.load(generator.configuration.path_to_translates, "en")
+
+    numbers = list(range(args.max))
+    print(f"ns per call, numbers 0..{args.max - 1}")
+    print(f"{'locale':<8}{'forms':>6}{'single':>10}{'plural':>10}{'app code':>10}{'runtime':>10}")
+    for locale in LOCALES:
+        of = module.AppLocalization(locale).of()
+        variants = {
+            "single": of.itemsSingle,
+            "plural": of.items,
+            "app code": in_application(of, plural_rule(locale)),
+            "runtime": Localization(catalog, locale).of().items,
+        }
+        results = []
+        for function in variants.values():
+            seconds = min(timeit.repeat(lambda: list(map(function, numbers)), number=20, repeat=args.repeat))
+            results.append(seconds / 20 / len(numbers) * 1e9)
+        print(f"{locale:<8}{len(plural_rule(locale).categories):>6}" + "".join(f"{ns:>10.1f}" for ns in results))
+
+
+if __name__ == "__main__":
+    main()
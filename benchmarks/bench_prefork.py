@@ -0,0 +1,186 @@
+"""
+Memory of pre-fork worker pools (like gunicorn with preload_app): the parent loads the translations, \
+forks `--workers` workers and every worker looks up `--keys-touched` of the keys in `--locales-touched` locales. \
+Compared modes: no translations (the interpreter baseline), the generated module, the runtime `Catalog`, \
+the `BinaryCatalog` of the `--format binary` file and the `SharedCatalog`. Each mode runs in its own process, optionally with `gc.freeze()` before forking.
+
+Per worker: RSS, PSS (shared pages divided between the processes sharing them) and USS \
+(private pages, what the worker really adds), read from /proc/<pid>/smaps_rollup, so Linux only.
+
+    python -m benchmarks.bench_prefork --keys 5000 --locales 20 --workers 8
+"""
+import argparse
+import gc
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.synthetic import write_catalog
+
+MODES = ("baseline", "generated", "runtime", "binary", "shared")
+
+
+def memory() -> dict[str, int]:
+    """
+    RSS, PSS and USS of the current process in KiB.
+    """
+    values: dict[str, int] = {}
+    with open("/proc/self/smaps_rollup", encoding="utf-8") as file:
+        for line in file:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                values[parts[0].rstrip(":")] = int(parts[1])
+    return {
+        "rss": values["Rss"],
+        "pss": values["Pss"],
+        "uss": values["Private_Clean"] + values["Private_Dirty"],
+    }
+
+
+def load(mode: str, config: str):
+    """
+    Loads the translations like a preloaded application, returns `of(locale)` and the keys.
+    """
+    from l10n.generator import Generator
+
+    generator = Generator(config)
+    generator.parse_config()
+    if mode == "baseline":
+        return None, []
+    if mode == "generated":
+        spec = importlib.util.spec_from_file_location("app_localization", generator.output_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        of = lambda locale: module.AppLocalization(locale).of()
+        keys = [name for name in vars(module.BaseAppLocalization) if not name.startswith("_")]
+        return of, keys
+
+    from l10n.binary import BinaryCatalog, SharedCatalog
+    from l10n.runtime import Catalog, Localization
+
+    if mode == "runtime":
+        catalog = Catalog.from_config(config)
+        keys = list(catalog.messages[catalog.default_locale])
+    else:
+        if mode == "binary":
+            catalog = BinaryCatalog(os.path.splitext(generator.output_path)[0] + ".l10n")
+        else:
+            catalog = SharedCatalog.from_config(config)
+        keys = [catalog.key(position) for position in range(catalog.key_count)]
+    return (lambda locale: Localization(catalog, locale).of()), keys
+
+
+def work(of, keys: list[str], locales: list[str], keys_touched: float) -> None:
+    """
+    Looks up the first `keys_touched` of the keys like request handlers do: properties are read, \
+    methods are only bound, rendering them allocates new strings in every mode alike.
+    """
+    touched = keys[:int(len(keys) * keys_touched)]
+    for _ in range(3):
+        for locale in locales:
+            localization = of(locale)
+            for key in touched:
+                getattr(localization, key)
+
+
+def run_mode(args) -> None:
+    """
+    Runs one mode in this process and prints its JSON result.
+    """
+    of, keys = load(args.mode, args.config)
+    locales = [f"x{i:03d}" for i in range(1, args.locales_touched)] + ["en"]
+    if args.freeze:
+        gc.freeze()
+    parent = memory()
+
+    results, done = os.pipe(), os.pipe()
+    workers = []
+    for _ in range(args.workers):
+        pid = os.fork()
+        if pid == 0:
+            os.close(results[0])
+            os.close(done[1])
+            if of is not None:
+                work(of, keys, locales, args.keys_touched)
+            gc.collect()
+            os.write(results[1], (json.dumps(memory()) + "\n").encode())
+            # Measured while every worker is alive, so PSS divides the shared pages between all of them
+            os.read(done[0], 1)
+            os._exit(0)
+        workers.append(pid)
+    os.close(results[1])
+    os.close(done[0])
+    with os.fdopen(results[0], encoding="utf-8") as file:
+        measured = [json.loads(file.readline()) for _ in workers]
+    os.close(done[1])
+    for pid in workers:
+        os.waitpid(pid, 0)
+
+    print(json.dumps({
+        "mode": args.mode,
+        "parent": parent,
+        "workers": {name: sum(item[name] for item in measured) // len(measured) for name in ("rss", "pss", "uss")},
+    }))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--keys", type=int, default=5000)
+    parser.add_argument("--locales", type=int, default=20)
+    parser.add_argument("--text-length", type=int, default=60)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--keys-touched", type=float, default=0.2, help="Share of the keys every worker looks up")
+    parser.add_argument("--locales-touched", type=int, default=3, help="Number of locales every worker looks up")
+    parser.add_argument("--freeze", action="store_true", help="Call gc.freeze() in the parent before forking")
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--config", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        run_mode(args)
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        config = write_catalog(
+            directory, args.keys, args.locales, missing_ratio=0.1, variable_ratio=0.3, text_length=args.text_length
+        )
+        import py_compile
+        from l10n.generator import Generator
+
+        generator = Generator(config)
+        generator.build()
+        Generator(config, output_format="binary").build()
+        # Deployed applications import the module from its cached bytecode
+        py_compile.compile(generator.output_path, cfile=importlib.util.cache_from_source(generator.output_path))
+        options = [
+            f"--workers={args.workers}",
+            f"--keys-touched={args.keys_touched}",
+            f"--locales-touched={args.locales_touched}",
+        ] + (["--freeze"] if args.freeze else [])
+        results = [
+            json.loads(subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_prefork", f"--mode={mode}", f"--config={config}", *options],
+                check=True, capture_output=True, text=True
+            ).stdout)
+            for mode in MODES
+        ]
+
+    print(
+        f"{args.keys} keys, {args.locales} locales, {args.workers} workers touching {args.keys_touched:.0%} "
+        f"of the keys in {args.locales_touched} locales{', gc.freeze()' if args.freeze else ''}, KiB"
+    )
+    print(f"{'mode':<12}{'parent RSS':>12}{'worker RSS':>12}{'worker PSS':>12}{'worker USS':>12}{'pool PSS':>12}")
+    for result in results:
+        parent, workers = result["parent"], result["workers"]
+        pool = parent["pss"] + workers["pss"] * args.workers
+        print(
+            f"{result['mode']:<12}{parent['rss']:>12}{workers['rss']:>12}{workers['pss']:>12}"
+            f"{workers['uss']:>12}{pool:>12}"
+        )
+
+
+if __name__ == "__main__":
+    main()
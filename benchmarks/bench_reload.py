@@ -0,0 +1,83 @@
+"""
+Measures hot reload of the runtime catalog (l10n.runtime.ReloadingCatalog):
+the latency from writing a translation file to readers seeing the change, \
+the cost of a reload of one locale against a full load, and the lookup overhead of the reloading catalog.
+
+    python -m benchmarks.bench_reload --keys 2000 --locales 20
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+import timeit
+
+from benchmarks.synthetic import language_codes, write_catalog
+from l10n.runtime import Catalog, Localization, ReloadingCatalog
+
+
+def per_call(statement, number: int) -> float:
+    return min(timeit.repeat(statement, number=number, repeat=5)) / number * 1e9
+
+
+def touch_locale(path: str, value: str) -> None:
+    with open(path, encoding="utf-8") as file:
+        data = json.load(file)
+    data["key0"] = value
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(data, file, ensure_ascii=False)
+
+
+def watch_latency(catalog: ReloadingCatalog, path: str, locale: str, rounds: int) -> list[float]:
+    localization = Localization(catalog, locale)
+    latencies = []
+    for round_ in range(rounds):
+        value = f"reloaded {round_}"
+        start = time.perf_counter()
+        touch_locale(path, value)
+        while localization.of().key0 != value:
+            time.sleep(0.0005)
+        latencies.append((time.perf_counter() - start) * 1e3)
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--keys", type=int, default=2000)
+    parser.add_argument("--locales", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--interval", type=float, default=0.1, help="polling interval in seconds")
+    parser.add_argument("--number", type=int, default=200000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        write_catalog(directory, args.keys, args.locales, missing_ratio=0.0, variable_ratio=0.5)
+        translates = os.path.join(directory, "translates")
+        locale = language_codes(args.locales)[-1]
+        path = os.path.join(translates, f"l10n_{locale}.json")
+
+        full = min(timeit.repeat(lambda: Catalog.load(translates), number=1, repeat=3)) * 1e3
+        catalog = ReloadingCatalog(translates, watch=False)
+        single = min(timeit.repeat(lambda: catalog.reload([os.path.basename(path)]), number=1, repeat=3)) * 1e3
+        print(f"{args.keys} keys, {args.locales} locales")
+        print(f"{'full load':<28}{full:>10.2f} ms")
+        print(f"{'reload of one locale':<28}{single:>10.2f} ms")
+
+        static = Catalog.load(translates)
+        rows = [
+            ("of()", lambda: Localization(static, locale).of(), lambda: Localization(catalog, locale).of()),
+            ("of().key0", lambda: Localization(static, locale).of().key0, lambda: Localization(catalog, locale).of().key0),
+        ]
+        print(f"\n{'lookup':<28}{'Catalog ns':>12}{'Reloading ns':>14}")
+        for name, static_call, reloading_call in rows:
+            print(f"{name:<28}{per_call(static_call, args.number):>12.1f}{per_call(reloading_call, args.number):>14.1f}")
+
+        print(f"\n{'watcher':<28}{'median ms':>12}{'max ms':>14}")
+        for use_inotify in (True, False):
+            with ReloadingCatalog(translates, interval=args.interval, use_inotify=use_inotify) as watched:
+                latencies = sorted(watch_latency(watched, path, locale, args.rounds))
+                print(f"{watched.watcher.backend:<28}{latencies[len(latencies) // 2]:>12.2f}{latencies[-1]:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Renders one key for many recipients in mixed locales: a generated method call per recipient, \
+a runtime message call per recipient and the batch `Catalog.render_many` (as a list and in chunks).
+
+    python -m benchmarks.bench_render_many --rows 1000000 --locales 40
+"""
+import argparse
+import random
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.synthetic import language_codes, load_module, write_catalog
+from l10n.generator import Generator
+from l10n.runtime import Catalog
+
+
+def measure(function) -> tuple[float, float]:
+    """
+    Returns (wall time in ms, peak traced memory in MB) of `function()`.
+    """
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    # Traced separately, tracing slows down every allocation
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed * 1e3, peak / 2 ** 20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--keys", type=int, default=200)
+    parser.add_argument("--locales", type=int, default=40)
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        config = write_catalog(directory, args.keys, args.locales, variable_ratio=1.0)
+        generator = Generator(config)
+        generator.parse_config()
+        generator.unmarshal()
+        generator.generate()
+        module = load_module(generator.configuration.path_to_out)
+        catalog = Catalog.from_config(config)
+
+    key = "key0"
+    rnd = random.Random(0)
+    codes = language_codes(args.locales)
+    locales = [rnd.choice(codes) for _ in range(args.rows)]
+    rows = [(f"user{i}", i) for i in range(args.rows)]
+
+    def generated() -> list[str]:
+        return [getattr(module.AppLocalization(locale).of(), key)(*row) for locale, row in zip(locales, rows)]
+
+    def per_call() -> list[str]:
+        return [catalog.message(locale, key)(*row) for locale, row in zip(locales, rows)]
+
+    def batch() -> list[str]:
+        return catalog.render_many(key, locales, rows)
+
+    def chunked() -> int:
+        count = 0
+        for _ in catalog.render_many(key, locales, rows, chunk_size=args.chunk_size):
+            count += 1
+        return count
+
+    expected = generated()
+    assert per_call() == expected and batch() == expected
+
+    print(f"{args.rows} rows, {args.locales} locales")
+    print(f"{'method':<34}{'ms':>10}{'peak MB':>10}")
+    for name, function in (
+        ("generated method per row", generated),
+        ("runtime message per row", per_call),
+        ("render_many", batch),
+        (f"render_many chunk_size={args.chunk_size}", chunked),
+    ):
+        elapsed, peak = min(measure(function) for _ in range(3))
+        print(f"{name:<34}{elapsed:>10.1f}{peak:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
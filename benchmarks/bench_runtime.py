@@ -0,0 +1,61 @@
+"""
+Compares lookups on the runtime catalog (l10n.runtime) with the generated classes.
+
+    python -m benchmarks.bench_runtime --keys 2000 --locales 20
+"""
+import argparse
+import tempfile
+import timeit
+
+from benchmarks.synthetic import language_codes, load_module, write_catalog
+from l10n.generator import Generator
+from l10n.runtime import Catalog, Localization
+
+
+def per_call(statement, number: int) -> float:
+    return min(timeit.repeat(statement, number=number, repeat=5)) / number * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--keys", type=int, default=2000)
+    parser.add_argument("--locales", type=int, default=20)
+    parser.add_argument("--number", type=int, default=200000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        config = write_catalog(directory, args.keys, args.locales, variable_ratio=0.5)
+        generator = Generator(config)
+        generator.parse_config()
+        generator.unmarshal()
+        generator.generate()
+        module = load_module(generator.configuration.path_to_out)
+        catalog = Catalog.from_config(config)
+
+        locale = language_codes(args.locales)[-1]
+        messages = catalog.messages[locale]
+        plain = next(key for key, message in messages.items() if not message.variables)
+        parameterized = next(key for key, message in messages.items() if message.variables)
+
+        generated = module.AppLocalization(locale).of()
+        runtime = Localization(catalog, locale).of()
+        generated_method = getattr(generated, parameterized)
+        runtime_message = getattr(runtime, parameterized)
+
+        rows = [
+            ("of()", lambda: module.AppLocalization(locale).of(), lambda: Localization(catalog, locale).of()),
+            (f"property {plain}", lambda: getattr(generated, plain), lambda: getattr(runtime, plain)),
+            (f"{parameterized}(name, count)", lambda: generated_method("x", 1), lambda: runtime_message("x", 1)),
+            (f"{parameterized}(name=, count=)", lambda: generated_method(name="x", count=1), lambda: runtime_message(name="x", count=1)),
+            (f"{parameterized}() defaults", lambda: generated_method(), lambda: runtime_message()),
+        ]
+
+        print(f"keys={args.keys} locales={args.locales} locale={locale}")
+        print(f"{'lookup':<32}{'generated ns':>14}{'runtime ns':>14}")
+        for name, generated_call, runtime_call in rows:
+            assert generated_call() == runtime_call() or name == "of()"
+            print(f"{name:<32}{per_call(generated_call, args.number):>14.0f}{per_call(runtime_call, args.number):>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Time and peak traced memory of parsing one large translation file with `json.load` + `parse_translations` \
+and with `stream_translations`.
+
+    python -m benchmarks.bench_streaming --keys 300000 --text-length 300
+"""
+import argparse
+import gc
+import os
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.synthetic import write_catalog
+from l10n.generator import load_locale_file
+
+
+def measure(path: str, streaming: bool) -> tuple[float, float, int]:
+    """
+    Returns (seconds, peak traced MB, parsed keys).
+    """
+    gc.collect()
+    start = time.perf_counter()
+    result = load_locale_file(path, streaming=streaming)
+    elapsed = time.perf_counter() - start
+    assert not result.errors, result.errors[:3]
+    del result
+
+    gc.collect()
+    tracemalloc.start()
+    result = load_locale_file(path, streaming=streaming)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2 ** 20, len(result.translate)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--keys", type=int, default=100000)
+    parser.add_argument("--text-length", type=int, default=200)
+    parser.add_argument("--variable-ratio", type=float, default=0.3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        write_catalog(directory, args.keys, 1, variable_ratio=args.variable_ratio, text_length=args.text_length)
+        path = os.path.join(directory, "translates", "l10n_en.json")
+        print(f"{os.path.getsize(path) / 2 ** 20:.1f} MB, {args.keys} keys")
+        print(f"{'parser':<24}{'s':>10}{'peak MB':>10}")
+        for name, streaming in (("json.load", False), ("stream_translations", True)):
+            elapsed, peak, keys = measure(path, streaming)
+            assert keys == args.keys
+            print(f"{name:<24}{elapsed:>10.2f}{peak:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""
+Benchmark suite: generation phases, import of the generated module and lookup latency \
+on a synthetic catalog. Results are printed as JSON so runs can be stored and compared.
+
+    python -m benchmarks.suite --keys 2000 --locales 20 --output run.json
+    python -m benchmarks.suite --keys 2000 --locales 20 --compare run.json
+"""
+import argparse
+import json
+import os
+import platform
+import py_compile
+import shutil
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+from typing import Any, Callable, Optional
+
+from benchmarks.synthetic import language_codes, load_module, write_catalog
+from l10n.generator import GENERATOR_VERSION, Generator
+
+SUITE_FORMAT_VERSION = 1
+
+
+def measure(setup: Callable[[], Any], run: Callable[[Any], Any], repeat: int) -> dict:
+    """
+    Best wall time of `run(setup())` over `repeat` runs, then the peak memory of one more traced run.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        state = setup()
+        start = time.perf_counter()
+        run(state)
+        best = min(best, time.perf_counter() - start)
+
+    state = setup()
+    tracemalloc.start()
+    run(state)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": best, "peakBytes": peak}
+
+
+def per_call(statement: Callable[[], Any], number: int) -> dict:
+    return {"nanoseconds": min(timeit.repeat(statement, number=number, repeat=5)) / number * 1e9}
+
+
+def measure_import(path: str, repeat: int, cold: bool) -> dict:
+    """
+    Import time of the generated module: `cold` compiles the source on every import, \
+    otherwise the bytecode is cached first (also when writing bytecode is disabled).
+    """
+    cache = os.path.join(os.path.dirname(path), "__pycache__")
+    shutil.rmtree(cache, ignore_errors=True)
+    if not cold:
+        py_compile.compile(path, doraise=True)
+    best = float("inf")
+    for attempt in range(repeat):
+        if cold:
+            shutil.rmtree(cache, ignore_errors=True)
+        start = time.perf_counter()
+        load_module(path, f"bench_suite_localization_{attempt}")
+        best = min(best, time.perf_counter() - start)
+    return {"seconds": best}
+
+
+def run_suite(
+    keys: int,
+    locales: int,
+    variable_ratio: float,
+    missing_ratio: float,
+    text_length: int,
+    repeat: int,
+    number: int,
+    seed: int = 0
+) -> dict:
+    parameters = {
+        "keys": keys,
+        "locales": locales,
+        "variableRatio": variable_ratio,
+        "missingRatio": missing_ratio,
+        "textLength": text_length,
+        "repeat": repeat,
+        "number": number,
+        "seed": seed,
+    }
+    results: dict[str, dict] = {}
+
+    with tempfile.TemporaryDirectory() as directory:
+        config = write_catalog(directory, keys, locales, missing_ratio, variable_ratio, seed, text_length)
+        translates = os.path.join(directory, "translates")
+        catalog_bytes = sum(entry.stat().st_size for entry in os.scandir(translates))
+
+        def configured() -> Generator:
+            generator = Generator(config)
+            generator.parse_config()
+            return generator
+
+        def unmarshalled() -> Generator:
+            generator = configured()
+            generator.unmarshal()
+            return generator
+
+        results["parseConfig"] = measure(lambda: Generator(config), Generator.parse_config, repeat)
+        results["unmarshal"] = measure(configured, Generator.unmarshal, repeat)
+        results["generate"] = measure(unmarshalled, Generator.generate, repeat)
+
+        generator = unmarshalled()
+        generator.generate()
+        path = generator.configuration.path_to_out
+        results["generate"]["outputBytes"] = os.path.getsize(path)
+        results["importCold"] = measure_import(path, repeat, cold=True)
+        results["importWarm"] = measure_import(path, repeat, cold=False)
+
+        module = load_module(path, "bench_suite_localization")
+        locale = language_codes(locales)[-1]
+        of = module.AppLocalization(locale).of()
+        default_node = generator.registry.get(generator.default_language_code)
+        plain: Optional[str] = next((val.value for val in default_node.translate if val.params is None), None)
+        parameterized: Optional[str] = next((val.value for val in default_node.translate if val.params is not None), None)
+
+        results["lookupOf"] = per_call(lambda: module.AppLocalization(locale).of(), number)
+        if plain is not None:
+            results["lookupProperty"] = per_call(lambda: getattr(of, plain), number)
+        if parameterized is not None:
+            method = getattr(of, parameterized)
+            results["lookupParameterized"] = per_call(lambda: method("x", 1), number)
+            results["lookupParameterizedKeywords"] = per_call(lambda: method(name="x", count=1), number)
+            results["lookupParameterizedDefaults"] = per_call(method, number)
+
+    return {
+        "suiteFormatVersion": SUITE_FORMAT_VERSION,
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "generatorVersion": GENERATOR_VERSION,
+        },
+        "parameters": parameters,
+        "catalog": {"files": locales, "bytes": catalog_bytes},
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict) -> list[str]:
+    """
+    One line per metric: baseline value, current value and current / baseline.
+    """
+    lines = [f"{'metric':<44}{'baseline':>14}{'current':>14}{'ratio':>8}"]
+    for name, metrics in current["results"].items():
+        for metric, value in metrics.items():
+            old = baseline["results"].get(name, {}).get(metric)
+            ratio = f"{value / old:>8.2f}" if old else f"{'-':>8}"
+            old_value = f"{old:>14.6g}" if old is not None else f"{'-':>14}"
+            lines.append(f"{name + '.' + metric:<44}{old_value}{value:>14.6g}{ratio}")
+    return lines
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--keys", type=int, default=1000)
+    parser.add_argument("--locales", type=int, default=10)
+    parser.add_argument("--variable-ratio", type=float, default=0.3)
+    parser.add_argument("--missing-ratio", type=float, default=0.1)
+    parser.add_argument("--text-length", type=int, default=0, help="minimal length of every text, controls the file size")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--number", type=int, default=100000, help="calls per lookup timing")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=str, help="write the JSON results to this file")
+    parser.add_argument("--compare", type=str, help="JSON results of a previous run to compare with")
+    args = parser.parse_args()
+
+    report = run_suite(
+        args.keys,
+        args.locales,
+        args.variable_ratio,
+        args.missing_ratio,
+        args.text_length,
+        args.repeat,
+        args.number,
+        args.seed,
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            print("\n".join(compare(json.load(file), report)), file=sys.stderr)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
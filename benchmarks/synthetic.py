@@ -0,0 +1,87 @@
+import importlib.util
+import json
+import os
+import random
+from types import ModuleType
+from typing import Optional
+
+
+def language_codes(count: int) -> list[str]:
+    """
+    Returns `count` language codes, the first one is always "en".
+    """
+    return ["en"] + [f"x{i:03d}" for i in range(1, count)]
+
+
+def pad(text: str, length: int) -> str:
+    """
+    Appends filler words to `text` until it is at least `length` characters long.
+    """
+    if len(text) >= length:
+        return text
+    filler = " lorem ipsum dolor sit amet" * (length // 27 + 1)
+    return text + filler[:length - len(text)]
+
+
+def write_catalog(
+    directory: str,
+    keys: int = 1000,
+    locales: int = 10,
+    missing_ratio: float = 0.1,
+    variable_ratio: float = 0.3,
+    seed: Optional[int] = 0,
+    text_length: int = 0,
+) -> str:
+    """
+    Writes a synthetic catalog (l10n_*.json files and configuration.yml) into `directory`.\n
+    The default locale "en" contains every key, other locales miss about `missing_ratio` of them.
+    `variable_ratio` of the keys get a `#key` entry with string and int variables.
+    Texts are padded to at least `text_length` characters, which controls the file size.\n
+    Returns the path to the configuration file.
+    """
+    rnd = random.Random(seed)
+    translates_dir = os.path.join(directory, "translates")
+    os.makedirs(translates_dir, exist_ok=True)
+
+    key_names = [f"key{i}" for i in range(keys)]
+    with_variables = {key for key in key_names if rnd.random() < variable_ratio}
+
+    for language_code in language_codes(locales):
+        data = {}
+        for key in key_names:
+            if language_code != "en" and rnd.random() < missing_ratio:
+                continue
+            if key in with_variables:
+                data[key] = pad(f"{language_code} {key} {{name}} has {{count}}", text_length)
+                data[f"#{key}"] = {
+                    "description": f"Description of {key}",
+                    "variables": {
+                        "name": {"defaultValue": "World", "type": "string"},
+                        "count": {"defaultValue": 0, "type": "int"},
+                    },
+                }
+            else:
+                data[key] = pad(f"{language_code} {key}", text_length)
+
+        with open(os.path.join(translates_dir, f"l10n_{language_code}.json"), "w", encoding="utf-8") as file:
+            json.dump(data, file, ensure_ascii=False)
+
+    config_path = os.path.join(directory, "configuration.yml")
+    with open(config_path, "w", encoding="utf-8") as file:
+        file.write(
+            f"pathToTranslates: {translates_dir}/\n"
+            f"pathToOut: {os.path.join(directory, 'app_localization.py')}\n"
+            "defaultTranslateFile: l10n_en.json\n"
+            "className: AppLocalization\n"
+        )
+    return config_path
+
+
+def load_module(path: str, name: str = "bench_app_localization") -> ModuleType:
+    """
+    Imports the generated module at `path` as `name`, without adding it to `sys.modules`.
+    """
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
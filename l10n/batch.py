@@ -0,0 +1,233 @@
+import glob
+import json
+import logging
+import os
+import time
+from typing import Iterable, Optional
+
+from l10n.generator import (
+    OUTPUT_FORMAT_BINARY,
+    OUTPUT_FORMAT_PYTHON,
+    Generator,
+    L10nParseCache,
+    L10nStats,
+    worker_count,
+)
+
+class L10nBatchResult:
+    """
+    Result of generating one configuration in `build_all`.\n
+    `written` - the output was written (False if it was up to date, None if the generation failed), \
+    `errors` - errors of the generation (every file error for translation files that can not be parsed), \
+    `stats` - `L10nStats.as_dict()` of the run.
+    """
+    def __init__(self, config: str) -> None:
+        self.config: str = config
+        self.written: Optional[bool] = None
+        self.seconds: float = 0.0
+        self.errors: list[str] = []
+        self.stats: dict = {}
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def as_dict(self) -> dict:
+        return {
+            'config': self.config,
+            'written': self.written,
+            'seconds': self.seconds,
+            'errors': self.errors,
+            'stats': self.stats,
+        }
+
+class L10nBatchReport:
+    """
+    Aggregated result of `build_all`, `results` are in the order of the configurations.\n
+    `parsed` and `cached` - translation files parsed and taken from the shared parse cache by all workers.
+    """
+    def __init__(self) -> None:
+        self.results: list[L10nBatchResult] = []
+        self.seconds: float = 0.0
+        self.workers: int = 1
+        self.parsed: int = 0
+        self.cached: int = 0
+
+    @property
+    def failed(self) -> list[L10nBatchResult]:
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def written(self) -> list[L10nBatchResult]:
+        return [result for result in self.results if result.written]
+
+    def as_dict(self) -> dict:
+        return {
+            'seconds': self.seconds,
+            'workers': self.workers,
+            'configs': len(self.results),
+            'written': len(self.written),
+            'failed': len(self.failed),
+            'parsedFiles': self.parsed,
+            'cachedFiles': self.cached,
+            'results': [result.as_dict() for result in self.results],
+        }
+
+    def format(self) -> str:
+        lines: list[str] = []
+        for result in self.results:
+            status: str = 'failed' if not result.ok else ('written' if result.written else 'up to date')
+            lines.append(f"{status:<12}{result.seconds * 1e3:>10.1f} ms  {result.config}")
+            lines.extend(f"    {error}" for error in result.errors)
+        lines.append(
+            f"{len(self.results)} configurations in {self.seconds:.2f} s with {self.workers} workers: "
+            f"{len(self.written)} written, {len(self.failed)} failed, "
+            f"{self.parsed} files parsed, {self.cached} taken from the cache"
+        )
+        return '\n'.join(lines)
+
+def find_configs(patterns: Iterable[str]) -> list[str]:
+    """
+    Expands the paths and glob patterns (`**` matches nested directories) to configuration files, \
+    in the given order and without duplicates. Raises ValueError for a pattern that matches no file.
+    """
+    configs: list[str] = []
+    seen: set[str] = set()
+    for pattern in patterns:
+        paths: list[str] = sorted(glob.glob(pattern, recursive=True)) if glob.has_magic(pattern) else [pattern]
+        paths = [path for path in paths if os.path.isfile(path)]
+        if not paths:
+            raise ValueError(f"No configuration file matches {pattern}")
+        for path in paths:
+            real_path: str = os.path.realpath(path)
+            if real_path not in seen:
+                seen.add(real_path)
+                configs.append(path)
+    return configs
+
+def build_config(
+    config: str,
+    cache: Optional[L10nParseCache] = None,
+    force: bool = False,
+    output_format: str = OUTPUT_FORMAT_PYTHON
+) -> L10nBatchResult:
+    """
+    Builds one configuration like `python -m l10n.generator`, never raises: errors are stored in the result.
+    """
+    result: L10nBatchResult = L10nBatchResult(config)
+    start: float = time.perf_counter()
+    generator: Optional[Generator] = None
+    try:
+        generator = Generator(config, output_format=output_format, cache=cache)
+        result.written = generator.build(force=force)
+    except Exception as e:
+        # One broken configuration must not stop the others, every error ends up in the report
+        errors: Optional[list[str]] = getattr(e, 'errors', None)
+        result.errors = list(errors) if isinstance(errors, list) and errors else [f"{type(e).__name__}: {e}"]
+        result.written = None
+    result.seconds = time.perf_counter() - start
+    if generator is not None:
+        result.stats = generator.stats.as_dict()
+    return result
+
+def _build_group(configs: list[str], force: bool, output_format: str) -> tuple[list[L10nBatchResult], int, int]:
+    """
+    Builds configurations sharing one parse cache, returns the results and the parsed and cached file counts.
+    Top-level function so it can be used on a process pool.
+    """
+    cache: L10nParseCache = L10nParseCache()
+    results: list[L10nBatchResult] = [build_config(config, cache, force, output_format) for config in configs]
+    return results, cache.misses, cache.hits
+
+def _translations_directory(config: str) -> str:
+    """
+    Real path of `pathToTranslates` of the configuration, the configuration path itself if it can not be read \
+    (it is then built alone and its error is reported by the build).
+    """
+    generator: Generator = Generator(config, stats=L10nStats())
+    try:
+        generator.parse_config()
+        return os.path.realpath(generator.configuration.path_to_translates)
+    except Exception:
+        return os.path.realpath(config)
+
+def build_all(
+    configs: Iterable[str],
+    jobs: int = 1,
+    force: bool = False,
+    output_format: str = OUTPUT_FORMAT_PYTHON
+) -> L10nBatchReport:
+    """
+    Builds many configurations in one process.\n
+    Configurations with the same `pathToTranslates` are built one after another by the same worker, \
+    sharing an `L10nParseCache`, so a shared translations directory is parsed once.
+    With `jobs` > 1 (or < 1 for one job per CPU) the groups are built on a process pool, \
+    configurations writing the same output must not be built in parallel.
+    """
+    configs = list(configs)
+    report: L10nBatchReport = L10nBatchReport()
+    start: float = time.perf_counter()
+
+    groups: dict[str, list[str]] = {}
+    for config in configs:
+        groups.setdefault(_translations_directory(config), []).append(config)
+
+    # Largest groups first, so a big group started last does not keep the pool waiting
+    batches: list[list[str]] = sorted(groups.values(), key=len, reverse=True)
+    workers: int = max(1, min(worker_count(jobs), len(batches)))
+    results: dict[str, L10nBatchResult] = {}
+    if workers == 1:
+        cache: L10nParseCache = L10nParseCache()
+        for config in configs:
+            results[config] = build_config(config, cache, force, output_format)
+        report.parsed, report.cached = cache.misses, cache.hits
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for group_results, parsed, cached in executor.map(
+                _build_group,
+                batches,
+                [force] * len(batches),
+                [output_format] * len(batches)
+            ):
+                for result in group_results:
+                    results[result.config] = result
+                report.parsed += parsed
+                report.cached += cached
+
+    report.workers = workers
+    report.results = [results[config] for config in configs]
+    report.seconds = time.perf_counter() - start
+    return report
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Command line entry point, returns the exit code (1 if any configuration failed).
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate the localizations of many configuration files")
+    parser.add_argument('configs', nargs='+', help="Configuration files or glob patterns, e.g. 'services/**/configuration.yml'")
+    parser.add_argument('--jobs', type=int, default=1, help="Number of worker processes, 0 - one per CPU")
+    parser.add_argument('--force', action='store_true', help="Regenerate the outputs even if the inputs did not change")
+    parser.add_argument('--format', type=str, default=OUTPUT_FORMAT_PYTHON, choices=[OUTPUT_FORMAT_PYTHON, OUTPUT_FORMAT_BINARY], help="Output format")
+    parser.add_argument('--report', type=str, help="Also write the report as JSON to this file")
+    args = parser.parse_args(argv)
+
+    try:
+        configs: list[str] = find_configs(args.configs)
+    except ValueError as e:
+        logging.error(e)
+        return 1
+
+    report: L10nBatchReport = build_all(configs, args.jobs, args.force, args.format)
+    print(report.format())
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as file:
+            json.dump(report.as_dict(), file, indent=2)
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,460 @@
+import contextlib
+import mmap
+import os
+import struct
+from typing import Any, Optional, Union
+
+from l10n.generator import (
+    Generator,
+    L10nLocaleReport,
+    L10nMergeResult,
+    L10nObject,
+    L10nOutputWriter,
+    L10nParams,
+    L10nParamsVariable,
+    L10nStats,
+)
+from l10n.plural import PLURAL_CATEGORIES
+from l10n.runtime import Message
+
+MAGIC = b'L10N'
+BINARY_FORMAT_VERSION = 2
+
+# magic, version, reserved, strings, keys, locales, schemas, plurals, default locale, \
+# positions of: string index, string data, key index, schema index, schema data, plural index, plural data, locale table
+_HEADER = struct.Struct('<4sHHIIIIIIIIIIIIII')
+_STRING = struct.Struct('<II')        # offset in string data, length in bytes
+_U32 = struct.Struct('<I')
+_LOCALE = struct.Struct('<II')        # language code string, position of the entries
+# text string (the `other` form of a plural message), schema (NO_SCHEMA if the key has no variables), \
+# plural forms (NO_PLURAL if the text is a string)
+_ENTRY = struct.Struct('<III')
+_SCHEMA_SIZE = struct.Struct('<H')
+_VARIABLE = struct.Struct('<IBB2x8s')  # name string, type, has default, default value
+_PLURAL = struct.Struct('<IIH2x')     # language code of the plural rule, plural variable string, forms
+_FORM = struct.Struct('<IB3x')        # form string, index of the category in PLURAL_CATEGORIES
+
+NO_SCHEMA = 0xFFFFFFFF
+NO_PLURAL = 0xFFFFFFFF
+
+_TYPE_CODES: dict[str, int] = {'str': 0, 'int': 1, 'float': 2}
+_TYPE_NAMES: dict[int, str] = {code: name for name, code in _TYPE_CODES.items()}
+
+class _StringTable:
+    def __init__(self) -> None:
+        self.ids: dict[str, int] = {}
+        self.values: list[bytes] = []
+
+    def add(self, value: str) -> int:
+        string_id: Optional[int] = self.ids.get(value)
+        if string_id is None:
+            string_id = self.ids[value] = len(self.values)
+            self.values.append(value.encode('utf-8'))
+        return string_id
+
+class _RecordTable:
+    """
+    Variable-length records (schemas, plural forms) stored once and referenced by their index.
+    """
+    def __init__(self) -> None:
+        self.ids: dict[bytes, int] = {}
+        self.values: list[bytes] = []
+
+    def add(self, value: bytes) -> int:
+        record_id: Optional[int] = self.ids.get(value)
+        if record_id is None:
+            record_id = self.ids[value] = len(self.values)
+            self.values.append(value)
+        return record_id
+
+    def index(self) -> list[bytes]:
+        parts: list[bytes] = []
+        offset: int = 0
+        for value in self.values:
+            parts.append(_U32.pack(offset))
+            offset += len(value)
+        return parts
+
+def _encode_default(strings: _StringTable, variable: L10nParamsVariable) -> bytes:
+    if variable.default_value is None:
+        return bytes(8)
+    if variable.type == 'str':
+        return struct.pack('<I4x', strings.add(variable.default_value))
+    if variable.type == 'int':
+        return struct.pack('<q', variable.default_value)
+    return struct.pack('<d', variable.default_value)
+
+def write_binary_catalog(path: str, merged: L10nMergeResult, stats: Optional[L10nStats] = None) -> None:
+    """
+    Compiles the merged locales into a single binary catalog file:\n
+    header, string table (every string is stored once), key index sorted by the UTF-8 bytes of the key, \
+    variable schemas, plural forms and per-locale arrays of (text, schema, plural forms) entries indexed by the key position.
+    The file is written atomically. With `stats` the compilation is measured as the `render` phase.
+    """
+    with stats.phase('render') if stats is not None else contextlib.nullcontext():
+        parts: list[bytes] = _compile(merged)
+    with L10nOutputWriter(path, binary=True, stats=stats) as out:
+        for part in parts:
+            out.write(part)
+
+def _compile(merged: L10nMergeResult) -> list[bytes]:
+    strings: _StringTable = _StringTable()
+    language_codes: list[str] = list(merged.table)
+    keys: list[str] = sorted(
+        (val.value for val in merged.table[merged.default_language_code]),
+        key=lambda key: key.encode('utf-8')
+    )
+    key_ids: list[int] = [strings.add(key) for key in keys]
+    locale_ids: list[int] = [strings.add(language_code) for language_code in language_codes]
+
+    schemas: _RecordTable = _RecordTable()
+    plurals: _RecordTable = _RecordTable()
+    entries: list[bytes] = []
+    for language_code in language_codes:
+        by_key: dict[str, L10nObject] = {val.value: val for val in merged.table[language_code]}
+        report: Optional[L10nLocaleReport] = merged.report.get(language_code)
+        locale_entries: list[bytes] = []
+        for key in keys:
+            val: L10nObject = by_key[key]
+            schema_id: int = NO_SCHEMA
+            if val.params is not None and val.params.variables is not None:
+                schema_id = schemas.add(_SCHEMA_SIZE.pack(len(val.params.variables)) + b''.join(
+                    _VARIABLE.pack(
+                        strings.add(variable.variable_name),
+                        _TYPE_CODES[variable.type],
+                        variable.default_value is not None,
+                        _encode_default(strings, variable)
+                    )
+                    for variable in val.params.variables
+                ))
+            plural_id: int = NO_PLURAL
+            text: str = val.text
+            if isinstance(val.text, dict):
+                # Plural forms of a fallback text are selected by the rule of the locale it comes from
+                rule_language_code: str = report.source(key) if report is not None else language_code
+                plural_id = plurals.add(
+                    _PLURAL.pack(strings.add(rule_language_code), strings.add(val.params.plural), len(val.text))
+                    + b''.join(
+                        _FORM.pack(strings.add(form), PLURAL_CATEGORIES.index(category))
+                        for category, form in val.text.items()
+                    )
+                )
+                text = val.text['other']
+            locale_entries.append(_ENTRY.pack(strings.add(text), schema_id, plural_id))
+        entries.append(b''.join(locale_entries))
+
+    string_index_position: int = _HEADER.size
+    string_data_position: int = string_index_position + _STRING.size * len(strings.values)
+    key_index_position: int = string_data_position + sum(len(value) for value in strings.values)
+    schema_index_position: int = key_index_position + _U32.size * len(keys)
+    schema_data_position: int = schema_index_position + _U32.size * len(schemas.values)
+    plural_index_position: int = schema_data_position + sum(len(schema) for schema in schemas.values)
+    plural_data_position: int = plural_index_position + _U32.size * len(plurals.values)
+    locale_table_position: int = plural_data_position + sum(len(plural) for plural in plurals.values)
+    entries_position: int = locale_table_position + _LOCALE.size * len(language_codes)
+
+    parts: list[bytes] = []
+    parts.append(_HEADER.pack(
+        MAGIC,
+        BINARY_FORMAT_VERSION,
+        0,
+        len(strings.values),
+        len(keys),
+        len(language_codes),
+        len(schemas.values),
+        len(plurals.values),
+        language_codes.index(merged.default_language_code),
+        string_index_position,
+        string_data_position,
+        key_index_position,
+        schema_index_position,
+        schema_data_position,
+        plural_index_position,
+        plural_data_position,
+        locale_table_position,
+    ))
+
+    offset: int = 0
+    for value in strings.values:
+        parts.append(_STRING.pack(offset, len(value)))
+        offset += len(value)
+    for value in strings.values:
+        parts.append(value)
+
+    for key_id in key_ids:
+        parts.append(_U32.pack(key_id))
+
+    for table in (schemas, plurals):
+        parts.extend(table.index())
+        parts.extend(table.values)
+
+    for position, locale_id in enumerate(locale_ids):
+        parts.append(_LOCALE.pack(locale_id, entries_position + position * _ENTRY.size * len(keys)))
+    for locale_entries in entries:
+        parts.append(locale_entries)
+    return parts
+
+class BinaryLocaleView:
+    """
+    Translations of one locale of a `BinaryCatalog`, same interface as `l10n.runtime.LocaleView`.\n
+    A key is decoded from the mapped file on first access and then cached on the view.
+    """
+    def __init__(self, catalog: 'BinaryCatalog', language_code: str) -> None:
+        self._l10n_catalog: BinaryCatalog = catalog
+        self._l10n_language_code: str = language_code
+
+    def __getattr__(self, key: str) -> Any:
+        if key.startswith('_l10n_'):
+            raise AttributeError(key)
+        try:
+            message: Message = self._l10n_catalog.message(self._l10n_language_code, key)
+        except KeyError:
+            raise AttributeError(f"No {key} translation.") from None
+        value: Any = message.call() if not message.variables else message.call
+        self.__dict__[key] = value
+        return value
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __repr__(self) -> str:
+        return f"<BinaryLocaleView {self._l10n_language_code}>"
+
+class BinaryCatalog:
+    """
+    ### Read-only catalog backed by a memory-mapped binary catalog file.
+    Opening reads only the header and the locale table, strings are decoded on lookup, \
+    so startup does not depend on the catalog size and the pages are shared between processes \
+    through the page cache. Can be used with `l10n.runtime.Localization`:
+    ```python
+    catalog = BinaryCatalog("app/app_localization.l10n")
+    Localization(catalog, "ru").of().helloWorld
+    ```
+    """
+    def __init__(self, path: str) -> None:
+        with open(path, 'rb') as file:
+            self.__open(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ), path)
+
+    @classmethod
+    def from_buffer(cls, buffer: Union[mmap.mmap, bytes], name: str = 'buffer') -> 'BinaryCatalog':
+        """
+        Catalog reading a compiled binary catalog from memory instead of a file, `name` is used in errors.
+        """
+        catalog: BinaryCatalog = cls.__new__(cls)
+        catalog.__open(buffer, name)
+        return catalog
+
+    def __open(self, buffer: Union[mmap.mmap, bytes], name: str) -> None:
+        self.__mmap: Union[mmap.mmap, bytes] = buffer
+        # The header of other versions may have another size, the magic and the version are checked first
+        magic, version = struct.unpack_from('<4sH', self.__mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{name} is not a binary l10n catalog")
+        if version != BINARY_FORMAT_VERSION:
+            raise ValueError(f"Unsupported binary l10n catalog version: {version}, supported version: {BINARY_FORMAT_VERSION}")
+        (
+            _,
+            _,
+            _,
+            self.__strings,
+            self.__keys,
+            locales,
+            self.__schemas,
+            self.__plurals,
+            default_locale,
+            self.__string_index,
+            self.__string_data,
+            self.__key_index,
+            self.__schema_index,
+            self.__schema_data,
+            self.__plural_index,
+            self.__plural_data,
+            locale_table,
+        ) = _HEADER.unpack_from(self.__mmap, 0)
+
+        self.__entries: dict[str, int] = {}
+        for position in range(locales):
+            code_id, entries = _LOCALE.unpack_from(self.__mmap, locale_table + position * _LOCALE.size)
+            self.__entries[self.string(code_id)] = entries
+
+        self.locales: tuple[str, ...] = tuple(self.__entries)
+        self.default_locale: str = self.locales[default_locale]
+        self.views: dict[str, BinaryLocaleView] = {
+            language_code: BinaryLocaleView(self, language_code) for language_code in self.locales
+        }
+
+    @property
+    def key_count(self) -> int:
+        return self.__keys
+
+    def close(self) -> None:
+        if isinstance(self.__mmap, mmap.mmap):
+            self.__mmap.close()
+
+    def __enter__(self) -> 'BinaryCatalog':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def string(self, string_id: int) -> str:
+        offset, length = _STRING.unpack_from(self.__mmap, self.__string_index + string_id * _STRING.size)
+        start: int = self.__string_data + offset
+        return self.__mmap[start:start + length].decode('utf-8')
+
+    def __string_bytes(self, string_id: int) -> bytes:
+        offset, length = _STRING.unpack_from(self.__mmap, self.__string_index + string_id * _STRING.size)
+        start: int = self.__string_data + offset
+        return self.__mmap[start:start + length]
+
+    def key_position(self, key: str) -> int:
+        """
+        Binary search in the key index, raises KeyError for an unknown key.
+        """
+        target: bytes = key.encode('utf-8')
+        low, high = 0, self.__keys
+        while low < high:
+            middle: int = (low + high) // 2
+            (key_id,) = _U32.unpack_from(self.__mmap, self.__key_index + middle * _U32.size)
+            current: bytes = self.__string_bytes(key_id)
+            if current < target:
+                low = middle + 1
+            elif current > target:
+                high = middle
+            else:
+                return middle
+        raise KeyError(key)
+
+    def key(self, position: int) -> str:
+        (key_id,) = _U32.unpack_from(self.__mmap, self.__key_index + position * _U32.size)
+        return self.string(key_id)
+
+    def l10n_object(self, locale: str, key: str) -> L10nObject:
+        """
+        Decodes the translation of `key` in `locale` (missing keys are already resolved to the default locale).
+        """
+        return self.__decode(locale, key)[0]
+
+    def message(self, locale: str, key: str) -> Message:
+        return Message(*self.__decode(locale, key))
+
+    def __decode(self, locale: str, key: str) -> tuple[L10nObject, str]:
+        """
+        Returns the translation and the language code whose plural rule selects its form.
+        """
+        try:
+            entries: int = self.__entries[locale]
+        except KeyError:
+            raise ValueError(f"No {locale} localization.") from None
+        text_id, schema_id, plural_id = _ENTRY.unpack_from(self.__mmap, entries + self.key_position(key) * _ENTRY.size)
+
+        l10n_object: L10nObject = L10nObject()
+        l10n_object.value = key
+        l10n_object.text = self.string(text_id)
+        if schema_id != NO_SCHEMA:
+            l10n_params: L10nParams = L10nParams()
+            l10n_params.variables = self.__schema(schema_id)
+            l10n_object.params = l10n_params
+        if plural_id == NO_PLURAL:
+            return l10n_object, locale
+        rule_language_code, l10n_object.params.plural, l10n_object.text = self.__plural(plural_id)
+        return l10n_object, rule_language_code
+
+    def __plural(self, plural_id: int) -> tuple[str, str, dict[str, str]]:
+        """
+        Returns the language code of the plural rule, the plural variable and the forms by category.
+        """
+        (offset,) = _U32.unpack_from(self.__mmap, self.__plural_index + plural_id * _U32.size)
+        position: int = self.__plural_data + offset
+        language_id, variable_id, count = _PLURAL.unpack_from(self.__mmap, position)
+        position += _PLURAL.size
+
+        forms: dict[str, str] = {}
+        for _ in range(count):
+            form_id, category = _FORM.unpack_from(self.__mmap, position)
+            position += _FORM.size
+            forms[PLURAL_CATEGORIES[category]] = self.string(form_id)
+        return self.string(language_id), self.string(variable_id), forms
+
+    def __schema(self, schema_id: int) -> list[L10nParamsVariable]:
+        (offset,) = _U32.unpack_from(self.__mmap, self.__schema_index + schema_id * _U32.size)
+        position: int = self.__schema_data + offset
+        (count,) = _SCHEMA_SIZE.unpack_from(self.__mmap, position)
+        position += _SCHEMA_SIZE.size
+
+        variables: list[L10nParamsVariable] = []
+        for _ in range(count):
+            name_id, type_code, has_default, default = _VARIABLE.unpack_from(self.__mmap, position)
+            position += _VARIABLE.size
+
+            variable: L10nParamsVariable = L10nParamsVariable()
+            variable.variable_name = self.string(name_id)
+            variable.type = _TYPE_NAMES[type_code]
+            if has_default:
+                variable.default_value = self.__decode_default(variable.type, default)
+            variables.append(variable)
+        return variables
+
+    def __decode_default(self, type_name: str, default: bytes) -> Union[str, int, float]:
+        if type_name == 'str':
+            return self.string(struct.unpack('<I4x', default)[0])
+        if type_name == 'int':
+            return struct.unpack('<q', default)[0]
+        return struct.unpack('<d', default)[0]
+
+def _compile_config(path_to_config_file: str, jobs: int) -> bytes:
+    generator: Generator = Generator(path_to_config_file, jobs=jobs)
+    generator.parse_config()
+    generator.unmarshal()
+    return b''.join(_compile(generator.merge()))
+
+class SharedCatalog(BinaryCatalog):
+    """
+    ### Binary catalog compiled into anonymous shared memory, for pre-fork worker pools.
+    The parent process loads the catalog once into an anonymous shared mapping. Forked workers inherit \
+    the mapping: the strings live outside the Python heap, so reference counting and the garbage collector \
+    never write to these pages and all workers share one physical copy. A worker decodes only the keys \
+    it looks up (cached on its views).
+    ```python
+    # Imported by the parent before forking, e.g. by a gunicorn application with preload_app = True
+    catalog = SharedCatalog.from_config("app/configuration.yml")
+    # In a worker
+    Localization(catalog, "ru").of().helloWorld
+    ```
+    """
+    @classmethod
+    def from_merged(cls, merged: L10nMergeResult) -> 'SharedCatalog':
+        return cls.__from_parts(_compile(merged))
+
+    @classmethod
+    def from_file(cls, path: str) -> 'SharedCatalog':
+        """
+        Copies a binary catalog file (`--format binary`) into shared memory.
+        """
+        with open(path, 'rb') as file:
+            buffer: mmap.mmap = mmap.mmap(-1, os.fstat(file.fileno()).st_size)
+            file.readinto(buffer)
+        return cls.from_buffer(buffer, path)
+
+    @classmethod
+    def from_config(cls, path_to_config_file: str, jobs: int = 1) -> 'SharedCatalog':
+        """
+        Parses, merges and compiles the translations described by a generator configuration file \
+        in a short-lived child process, so the heap the workers inherit does not keep the parsed translations.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            image: bytes = executor.submit(_compile_config, path_to_config_file, jobs).result()
+        return cls.__from_parts([image])
+
+    @classmethod
+    def __from_parts(cls, parts: list[bytes]) -> 'SharedCatalog':
+        # Anonymous memory is mapped MAP_SHARED on Unix, forked children use the same pages
+        buffer: mmap.mmap = mmap.mmap(-1, sum(len(part) for part in parts))
+        for part in parts:
+            buffer.write(part)
+        return cls.from_buffer(buffer, 'shared catalog')
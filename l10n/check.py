@@ -0,0 +1,240 @@
+import json
+import operator
+import os
+import string
+import time
+from typing import Any, Iterable, Optional
+
+from l10n.generator import (
+    L10nFallbackError,
+    L10nObject,
+    L10nParams,
+    _parse_params,
+    _parse_plural,
+    _plural_variable,
+    map_batches,
+    resolve_fallbacks,
+    worker_count,
+)
+
+class L10nFileCheck:
+    """
+    Result of checking one translation file on its own.\n
+    `signatures` - key -> variables of its message in the order of the generated method signature, \
+    as (name, type, has default value), compared with the default locale by `check_files`; \
+    `parsed` - False if the file has parse errors, its signatures are incomplete then.
+    """
+    def __init__(self, file_name: str, language_code: str) -> None:
+        self.file_name: str = file_name
+        self.language_code: str = language_code
+        self.errors: list[str] = []
+        self.warnings: list[str] = []
+        self.signatures: dict[str, tuple[tuple[str, str, bool], ...]] = {}
+        self.parsed: bool = True
+
+class L10nCheckReport:
+    """
+    Result of `check_files`: every error and warning of every file, prefixed with the file and the key.
+    Errors break the generated code or the runtime catalog, warnings (unused variables, \
+    keys the default locale does not have) do not.
+    """
+    def __init__(self) -> None:
+        self.files: int = 0
+        self.keys: int = 0
+        self.workers: int = 1
+        self.seconds: float = 0.0
+        self.errors: list[str] = []
+        self.warnings: list[str] = []
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def as_dict(self) -> dict:
+        return {
+            'files': self.files,
+            'keys': self.keys,
+            'workers': self.workers,
+            'seconds': self.seconds,
+            'errors': self.errors,
+            'warnings': self.warnings,
+        }
+
+    def format(self) -> str:
+        lines: list[str] = [f"error: {error}" for error in self.errors]
+        lines.extend(f"warning: {warning}" for warning in self.warnings)
+        lines.append(
+            f"{self.files} files, {self.keys} keys checked in {self.seconds * 1e3:.0f} ms with {self.workers} workers: "
+            f"{len(self.errors)} errors, {len(self.warnings)} warnings"
+        )
+        return '\n'.join(lines)
+
+_FORMATTER: string.Formatter = string.Formatter()
+
+def _placeholders(text: str) -> list[str]:
+    """
+    Names of the variables `text` refers to, e.g. `value` for `{value}`, `{value!r}` or `{value:>10}`.
+    Raises ValueError for unbalanced braces and positional placeholders (`{}`, `{0}`).
+    """
+    names: list[str] = []
+    for _, field_name, _, _ in _FORMATTER.parse(text):
+        if field_name is None:
+            continue
+        name: str = field_name.split('.')[0].split('[')[0]
+        if not name.isidentifier():
+            raise ValueError(f"placeholder {{{field_name}}} is not a variable name")
+        names.append(name)
+    return names
+
+def _signature(params: Optional[L10nParams]) -> tuple[tuple[str, str, bool], ...]:
+    if params is None or not params.variables:
+        return ()
+    # Variables without a default value go first, like in the generated method signature (the sort is stable)
+    return tuple(sorted(
+        ((variable.variable_name, variable.type, variable.default_value is not None) for variable in params.variables),
+        key=operator.itemgetter(2)
+    ))
+
+# Variable types of the metadata by their name in the file: the name in the signature and the type of the default value
+_VARIABLE_TYPES: dict[str, tuple[str, type]] = {'string': ('str', str), 'int': ('int', int), 'float': ('float', float)}
+
+def _meta_signature(key: str, meta: Any, errors: list[str], file_name: str) -> tuple[tuple[str, str, bool], ...]:
+    """
+    Same as `_signature(_parse_params(...))`: valid metadata, by far the most common, is read directly, \
+    anything else is parsed by `_parse_params`, which reports its errors.
+    """
+    variables: Any = meta.get('variables') if isinstance(meta, dict) else None
+    if isinstance(variables, dict):
+        signature: list[tuple[str, str, bool]] = []
+        for name, data in variables.items():
+            type_name: Any = data.get('type') if isinstance(data, dict) else None
+            variable_type: Optional[tuple[str, type]] = _VARIABLE_TYPES.get(type_name) if isinstance(type_name, str) else None
+            if variable_type is None or ('defaultValue' in data and not isinstance(data['defaultValue'], variable_type[1])):
+                break
+            signature.append((name, variable_type[0], 'defaultValue' in data))
+        else:
+            return tuple(sorted(signature, key=operator.itemgetter(2)))
+    return _signature(_parse_params(key, meta, errors, file_name))
+
+def _format_signature(signature: tuple[tuple[str, str, bool], ...]) -> str:
+    return '(' + ', '.join(f"{name}: {type_name}" + (" = ..." if default else '') for name, type_name, default in signature) + ')'
+
+def check_file(path: str) -> L10nFileCheck:
+    """
+    Reads one translation file and checks every key on its own: the file errors `load_locale_file` reports, \
+    texts that are neither a string nor plural forms, placeholders that are not declared variables \
+    and declared variables the text does not use. Never raises.
+    The decoded JSON is checked as is, building the `L10nTranslations` of the file would cost more than checking it.
+    Top-level function so it can be used on a process pool.
+    """
+    file_name: str = os.path.basename(path)
+    result: L10nFileCheck = L10nFileCheck(file_name, file_name.replace('l10n_', '').replace('.json', ''))
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            data: Any = json.load(file)
+    except (OSError, ValueError) as e:
+        data = None
+        result.errors.append(f"{file_name}: {e}")
+    if data is not None and not isinstance(data, dict):
+        result.errors.append(f"{file_name}: the root of the file must be an object")
+    if not isinstance(data, dict):
+        result.parsed = False
+        return result
+
+    # Errors of the metadata go first, like the parse errors of `load_locale_file`
+    key_errors: list[str] = []
+    signatures: dict[str, tuple[tuple[str, str, bool], ...]] = result.signatures
+    for key, text in data.items():
+        if key.startswith('#'):
+            continue
+        meta_key: str = f"#{key}"
+        signature: tuple[tuple[str, str, bool], ...] = ()
+        if isinstance(text, dict):
+            # Plural forms are rare, their metadata is parsed like by `parse_translations`
+            l10n_object: L10nObject = L10nObject()
+            l10n_object.value = key
+            l10n_object.text = text
+            if meta_key in data:
+                l10n_object.params = _parse_params(key, data[meta_key], result.errors, file_name)
+            _parse_plural(l10n_object, _plural_variable(data.get(meta_key)), result.errors, file_name)
+            signature = _signature(l10n_object.params)
+        elif meta_key in data:
+            signature = _meta_signature(key, data[meta_key], result.errors, file_name)
+        signatures[key] = signature
+        if not signature and isinstance(text, str) and '{' not in text and '}' not in text:
+            continue
+        declared: list[str] = [name for name, _, _ in signature]
+        used: set[str] = set()
+        for form in (text.values() if isinstance(text, dict) else (text,)):
+            if not isinstance(form, str):
+                # Invalid plural forms are reported by `_parse_plural`
+                if not isinstance(text, dict):
+                    key_errors.append(f"{file_name}: {key}: the translation must be a string or an object of plural forms")
+                continue
+            if '{' not in form and '}' not in form:
+                continue
+            try:
+                used.update(_placeholders(form))
+            except ValueError as e:
+                key_errors.append(f"{file_name}: {key}: {e}")
+        for name in sorted(used.difference(declared)):
+            key_errors.append(f"{file_name}: {key}: placeholder {{{name}}} is not a declared variable, declare it in #{key}")
+        for name in declared:
+            if name not in used:
+                result.warnings.append(f"{file_name}: {key}.{name}: the variable is not used in the text")
+    result.parsed = not result.errors
+    result.errors.extend(key_errors)
+    return result
+
+def _check_files(paths: list[str]) -> list[L10nFileCheck]:
+    return [check_file(path) for path in paths]
+
+def check_files(
+    paths: Iterable[str],
+    default_language_code: str,
+    fallbacks: Optional[dict[str, str]] = None,
+    jobs: int = 1
+) -> L10nCheckReport:
+    """
+    Checks a whole catalog in one pass without rendering anything: every file with `check_file`, \
+    then every locale against the default locale (the same variables, types and default value presence \
+    for every key) and the fallback graph.\n
+    With `jobs` > 1 (or < 1 for one job per CPU) the files are checked on a process pool, see `map_batches`.
+    """
+    start: float = time.perf_counter()
+    paths = sorted(paths, key=os.path.basename)
+    report: L10nCheckReport = L10nCheckReport()
+    if len(paths) > 1:
+        report.workers = worker_count(jobs)
+    results: list[L10nFileCheck] = map_batches(_check_files, paths, jobs)
+
+    default: Optional[L10nFileCheck] = next(
+        (result for result in results if result.language_code == default_language_code), None
+    )
+    if default is None:
+        report.errors.append(f"l10n_{default_language_code}.json: the default translation file was not found")
+    for result in results:
+        report.files += 1
+        report.keys += len(result.signatures)
+        report.errors.extend(result.errors)
+        report.warnings.extend(result.warnings)
+        if default is None or result is default or not result.parsed or not default.parsed:
+            continue
+        for key, signature in result.signatures.items():
+            expected: Optional[tuple[tuple[str, str, bool], ...]] = default.signatures.get(key)
+            if expected is None:
+                report.warnings.append(f"{result.file_name}: {key}: the key is not in {default.file_name}, it is not generated")
+            elif signature != expected:
+                report.errors.append(
+                    f"{result.file_name}: {key}: variables {_format_signature(signature)} differ from "
+                    f"{_format_signature(expected)} in {default.file_name}"
+                )
+
+    if default is not None:
+        try:
+            resolve_fallbacks([result.language_code for result in results], default_language_code, fallbacks)
+        except L10nFallbackError as e:
+            report.errors.append(f"fallbacks: {e}")
+
+    report.seconds = time.perf_counter() - start
+    return report
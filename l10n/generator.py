@@ -1,9 +1,44 @@
-import argparse
+import contextlib
+import hashlib
 import json
 import logging
+import operator
 import os
-from typing import  Any, Optional, Union
-import yaml
+import re
+import sys
+import time
+import tracemalloc
+from typing import  Any, Callable, Iterable, Optional, Union
+
+from l10n.plural import PLURAL_CATEGORIES, PLURAL_TABLE_SIZE, L10nPluralRule, plural_rule
+
+GENERATOR_VERSION = '0.0.2'
+
+NOTE = "#NOTE THIS IS AN AUTO-GENERATED FILE, DO NOT EDIT IT."
+
+OUTPUT_MODE_MODULE = 'module'
+OUTPUT_MODE_PACKAGE = 'package'
+
+OUTPUT_FORMAT_PYTHON = 'python'
+OUTPUT_FORMAT_BINARY = 'binary'
+
+TEMPLATE_BASE_CLASS = """class {ClassNameBase}:
+    __slots__ = {Slots}
+
+    def __init__(self{ClassConstructorArgs}):{bodyBase}
+    """
+
+TEMPLATE_EXTEND_CLASS = """class {ClassNameExtend}({ExtendClass}):
+    __slots__ = {Slots}
+
+    def __init__(self{ClassConstructorArgs}):{bodyExtend}
+    """
+
+TEMPLATE_PROPERTY = """
+    {PropertyIs}
+    def {PropertyName}(self{PropertyArgs}) -> {PropertyType}:
+        {PropertyValue}
+    """
 
 class Types:
     def __init__(self):
@@ -12,6 +47,8 @@ class Types:
         self.FLOAT = float
 
 class L10nParamsVariable:
+    __slots__ = ('__variable_name', '__default_value', '__type')
+
     def __init__(self) -> None:
         self.__variable_name: str
         self.__default_value: Union[str, None] = None
@@ -49,10 +86,13 @@ class L10nParamsVariable:
             raise ValueError(f"Incorrect data type: {type(value)}, allowed types: str, int, float")
 
 class L10nParams:
+    __slots__ = ('__description', '__example', '__variables', '__plural')
+
     def __init__(self) -> None:
         self.__description: Union[str, None] = None
         self.__example: Union[str, None] = None
         self.__variables: Union[list[L10nParamsVariable], None] = None
+        self.__plural: Union[str, None] = None
     
     @property
     def description(self) -> Union[str, None]:
@@ -77,14 +117,40 @@ class L10nParams:
     @variables.setter
     def variables(self, value: Union[list[L10nParamsVariable], None]) -> None:
         self.__variables = value
+
+    @property
+    def plural(self) -> Union[str, None]:
+        """
+        Name of the int variable selecting the form of a plural text.
+        """
+        return self.__plural
+
+    @plural.setter
+    def plural(self, value: Union[str, None]) -> None:
+        self.__plural = value
         
 
 class L10nObject:
+    """
+    A translation: key, text and the variable schema of the key.
+    The text of a plural message is a dict of forms by CLDR plural category, in `PLURAL_CATEGORIES` order.
+    Objects of parsed locales are views over `L10nTranslations`, changing them does not change the locale.
+    """
+    __slots__ = ('__value', '__text', '__params')
+
     def __init__(self) -> None:
         self.__value: str
-        self.__text: str
+        self.__text: Union[str, dict[str, str]]
         self.__params: Union[L10nParams, None] = None
-    
+
+    @classmethod
+    def view(cls, value: str, text: Union[str, dict[str, str]], params: Union[L10nParams, None]) -> 'L10nObject':
+        l10n_object: L10nObject = cls.__new__(cls)
+        l10n_object.__value = value
+        l10n_object.__text = text
+        l10n_object.__params = params
+        return l10n_object
+
     @property
     def value(self) -> str:
         return self.__value
@@ -94,11 +160,11 @@ class L10nObject:
         self.__value = value
 
     @property
-    def text(self) -> str:
+    def text(self) -> Union[str, dict[str, str]]:
         return self.__text
 
     @text.setter
-    def text(self, value: str) -> None:
+    def text(self, value: Union[str, dict[str, str]]) -> None:
         self.__text = value
 
     @property
@@ -109,19 +175,249 @@ class L10nObject:
     def params(self, value: Union[L10nParams, None]) -> None:
         self.__params = value
 
+class L10nTranslations:
+    """
+    ### Compact translations of a locale.
+    Columns of key names, texts and variable schemas (`L10nParams`, None for keys without variables) by key position.
+    `L10nInternTable` shares equal key columns and schemas between locales, so a locale costs about \
+    two references and its texts per key.\n
+    Indexing and iterating returns `L10nObject` views created on access.
+    """
+    __slots__ = ('keys', 'texts', 'params')
+
+    def __init__(
+        self,
+        keys: tuple[str, ...] = (),
+        texts: tuple[str, ...] = (),
+        params: tuple[Optional[L10nParams], ...] = ()
+    ) -> None:
+        self.keys: tuple[str, ...] = keys
+        self.texts: tuple[str, ...] = texts
+        self.params: tuple[Optional[L10nParams], ...] = params
+
+    @classmethod
+    def of(cls, translate: Iterable[L10nObject]) -> 'L10nTranslations':
+        """
+        Columns of a list of `L10nObject`, returns `translate` itself if it is `L10nTranslations` already.
+        """
+        if isinstance(translate, L10nTranslations):
+            return translate
+        objects: list[L10nObject] = list(translate)
+        return cls(
+            tuple(sys.intern(val.value) for val in objects),
+            tuple(val.text for val in objects),
+            tuple(val.params for val in objects)
+        )
+
+    def positions(self) -> dict[str, int]:
+        return {key: position for position, key in enumerate(self.keys)}
+
+    def select(self, positions: list[int], keys: Optional[tuple[str, ...]] = None) -> 'L10nTranslations':
+        """
+        Translations at `positions`, `keys` - the already selected key column to share.
+        """
+        texts: tuple[str, ...] = self.texts
+        params: tuple[Optional[L10nParams], ...] = self.params
+        return L10nTranslations(
+            keys if keys is not None else tuple(self.keys[position] for position in positions),
+            tuple(texts[position] for position in positions),
+            tuple(params[position] for position in positions)
+        )
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return L10nTranslations(self.keys[index], self.texts[index], self.params[index])
+        return L10nObject.view(self.keys[index], self.texts[index], self.params[index])
+
+    def __iter__(self):
+        return map(L10nObject.view, self.keys, self.texts, self.params)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, L10nTranslations):
+            return (
+                self.keys == other.keys
+                and self.texts == other.texts
+                and all(map(operator.is_, self.params, other.params))
+            )
+        if isinstance(other, (list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"L10nTranslations({len(self)} keys)"
+
+class L10nInternTable:
+    """
+    Shares the strings and schemas of the parsed locales: key names and variable names are interned, \
+    equal key columns are stored once and equal schemas (description, example and variables) are stored once.
+    """
+    def __init__(self) -> None:
+        self.__keys: dict[tuple[str, ...], tuple[str, ...]] = {}
+        self.__params: dict[tuple, L10nParams] = {}
+
+    def translations(self, translations: L10nTranslations) -> L10nTranslations:
+        keys: tuple[str, ...] = tuple(map(sys.intern, translations.keys))
+        return L10nTranslations(
+            self.__keys.setdefault(keys, keys),
+            translations.texts,
+            tuple(map(self.params, translations.params))
+        )
+
+    def params(self, params: Optional[L10nParams]) -> Optional[L10nParams]:
+        if params is None:
+            return None
+        variables: Optional[tuple] = None
+        if params.variables is not None:
+            for variable in params.variables:
+                variable.variable_name = sys.intern(variable.variable_name)
+            variables = tuple(
+                # The type of the default value is compared too, 1 == 1.0 == True
+                (variable.variable_name, variable.type, variable.default_value, type(variable.default_value))
+                for variable in params.variables
+            )
+        return self.__params.setdefault((params.description, params.example, variables, params.plural), params)
+
 class L10nNode(object):
     def __init__(
         self,
         language_code: str,
-        translate: list[L10nObject]
+        translate: Union[L10nTranslations, list[L10nObject]]
     ):
         self.language_code: str = language_code
-        self.translate: list[L10nObject] = translate
+        self.translate: Union[L10nTranslations, list[L10nObject]] = translate
         self.next = None
 
+class L10nLocaleRegistry:
+    """
+    Ordered registry of parsed locales.\n
+    Locales are kept in insertion order and can be looked up in O(1) both by \
+    language code and by position.
+    """
+    def __init__(self) -> None:
+        self.__nodes: list[L10nNode] = []
+        self.__positions: dict[str, int] = {}
+
+    def add(
+        self,
+        language_code: str,
+        translate: list[L10nObject]
+    ) -> L10nNode:
+        """
+        Adds a locale to the end of the registry.
+        If the locale is already registered, its translations are replaced in place.
+        """
+        position: Optional[int] = self.__positions.get(language_code)
+        if position is not None:
+            self.__nodes[position].translate = translate
+            return self.__nodes[position]
+
+        node: L10nNode = L10nNode(
+            language_code = language_code,
+            translate = translate
+        )
+        if self.__nodes:
+            self.__nodes[-1].next = node
+        self.__positions[language_code] = len(self.__nodes)
+        self.__nodes.append(node)
+        return node
+
+    def insert(
+        self,
+        position: int,
+        language_code: str,
+        translate: list[L10nObject]
+    ) -> L10nNode:
+        """
+        Inserts a locale at the given position (0-based).
+        """
+        self.remove(language_code)
+        node: L10nNode = L10nNode(
+            language_code = language_code,
+            translate = translate
+        )
+        self.__nodes.insert(position, node)
+        self.__reindex()
+        return node
+
+    def remove(self, language_code: str) -> Optional[L10nNode]:
+        """
+        Removes a locale from the registry and returns it.
+        Returns None if the locale is not registered.
+        """
+        position: Optional[int] = self.__positions.get(language_code)
+        if position is None:
+            return None
+        node: L10nNode = self.__nodes.pop(position)
+        node.next = None
+        self.__reindex()
+        return node
+
+    def get(self, language_code: str) -> Optional[L10nNode]:
+        """
+        Returns the locale with the given language code or None.
+        """
+        position: Optional[int] = self.__positions.get(language_code)
+        if position is None:
+            return None
+        return self.__nodes[position]
+
+    def at(self, position: int) -> Optional[L10nNode]:
+        """
+        Returns the locale at the given position (0-based) or None if out of range.
+        """
+        if 0 <= position < len(self.__nodes):
+            return self.__nodes[position]
+        return None
+
+    def index_of(self, language_code: str) -> Optional[int]:
+        """
+        Returns the position (0-based) of the locale or None if it is not registered.
+        """
+        return self.__positions.get(language_code)
+
+    @property
+    def language_codes(self) -> list[str]:
+        return [node.language_code for node in self.__nodes]
+
+    @property
+    def head(self) -> Optional[L10nNode]:
+        return self.__nodes[0] if self.__nodes else None
+
+    def clear(self) -> None:
+        self.__nodes = []
+        self.__positions = {}
+
+    def __reindex(self) -> None:
+        self.__positions = {}
+        for position, node in enumerate(self.__nodes):
+            self.__positions[node.language_code] = position
+            node.next = self.__nodes[position + 1] if position + 1 < len(self.__nodes) else None
+
+    def __len__(self) -> int:
+        return len(self.__nodes)
+
+    def __iter__(self):
+        return iter(list(self.__nodes))
+
+    def __contains__(self, language_code: str) -> bool:
+        return language_code in self.__positions
+
 class L10nNodeOperations:
-    def __init__(self):
-        self.head: L10nNode = None
+    """
+    Linked list style API kept for backward compatibility.\n
+    All operations are delegated to `L10nLocaleRegistry`, `L10nNode.next` links are maintained by the registry.
+    """
+    def __init__(self, registry: Optional[L10nLocaleRegistry] = None):
+        self.registry: L10nLocaleRegistry = registry if registry is not None else L10nLocaleRegistry()
+
+    @property
+    def head(self) -> Optional[L10nNode]:
+        return self.registry.head
 
     def append(
         self,
@@ -131,17 +427,10 @@ class L10nNodeOperations:
         """
         Appends a new node with the given data to the end of the linked list.
         """
-        new_node: L10nNode = L10nNode(
+        self.registry.add(
             language_code = language_code,
             translate = translate
         )
-        if not self.head:
-            self.head = new_node
-            return
-        last_node: L10nNode = self.head
-        while last_node.next:
-            last_node = last_node.next
-        last_node.next = new_node
 
     def prepend(
         self,
@@ -151,12 +440,11 @@ class L10nNodeOperations:
         """
         Prepends a new node with the given data to the beginning of the linked list.
         """
-        new_node: L10nNode = L10nNode(
+        self.registry.insert(
+            0,
             language_code = language_code,
             translate = translate
         )
-        new_node.next = self.head
-        self.head = new_node
 
     def delete(
         self,
@@ -165,33 +453,14 @@ class L10nNodeOperations:
         """
         Deletes the first occurrence of the node with the given data from the linked list.
         """
-        current_node: L10nNode = self.head
-        if current_node and current_node.language_code == language_code:
-            self.head = current_node.next
-            current_node = None
-            return
-        prev_node: L10nNode = None
-        while current_node and current_node.language_code != language_code:
-            prev_node = current_node
-            current_node = current_node.next
-        if current_node is None:
-            return
-        prev_node.next = current_node.next
-        current_node = None
+        self.registry.remove(language_code)
 
     def get_value_at_index(self, index: int) -> Union[L10nNode, None]:
         """
         Returns the value of the node at the given index in the linked list.
         Returns None if the index is out of range.
         """
-        current_node: L10nNode = self.head
-        count: int = 0
-        while current_node:
-            if count == index - 1:
-                return current_node
-            count += 1
-            current_node = current_node.next
-        return None
+        return self.registry.at(index - 1)
 
     def get_index_of_value(
         self,
@@ -201,49 +470,995 @@ class L10nNodeOperations:
         Returns the index of the first occurrence of the given value in the linked list.
         Returns None if the value is not found.
         """
-        current_node: L10nNode = self.head
-        index: int = 0
-        while current_node:
-            if current_node.language_code == language_code:
-                return index
-            index += 1
-            current_node = current_node.next
-        return None
+        return self.registry.index_of(language_code)
 
     @property
     def size(self) -> int:
         """
         Returns the number of elements in the linked list.
         """
-        current_node: L10nNode = self.head
-        count: int = 0
-        while current_node:
-            count += 1
-            current_node = current_node.next
-        return count
+        return len(self.registry)
 
     def is_empty(self) -> bool:
         """
         Checks if the linked list is empty.
         """
-        return self.head is None
+        return len(self.registry) == 0
 
     def print_list(self) -> None:
         """
         Prints all the elements in the linked list.
         """
-        current_node: L10nNode = self.head
-        while current_node:
-            print(current_node.language_code, end=' ')
-            current_node = current_node.next
+        for node in self.registry:
+            print(node.language_code, end=' ')
         print()
 
+class L10nTemplate:
+    """
+    Template compiled once into literal parts and `{Slot}` names.\n
+    Rendering writes the parts directly, slots without a value are kept as is.
+    """
+    __SLOT = re.compile(r'\{([A-Za-z_][A-Za-z0-9_]*)\}')
+
+    def __init__(self, template: str) -> None:
+        self.template: str = template
+        self.literals: list[str] = []
+        self.slots: list[str] = []
+        position: int = 0
+        for match in self.__SLOT.finditer(template):
+            self.literals.append(template[position:match.start()])
+            self.slots.append(match.group(1))
+            position = match.end()
+        self.literals.append(template[position:])
+
+    def render_to(self, write: Callable[[str], Any], values: dict[str, str]) -> None:
+        write(self.literals[0])
+        for slot, literal in zip(self.slots, self.literals[1:]):
+            value: Optional[str] = values.get(slot)
+            write(value if value is not None else f"{{{slot}}}")
+            write(literal)
+
+    def render(self, values: dict[str, str]) -> str:
+        parts: list[str] = []
+        self.render_to(parts.append, values)
+        return ''.join(parts)
+
+class L10nTemplates:
+    def __init__(
+        self,
+        template_base_class: str,
+        template_extend_class: str,
+        template_property: str
+    ) -> None:
+        self.base_class: L10nTemplate = L10nTemplate(template_base_class)
+        self.extend_class: L10nTemplate = L10nTemplate(template_extend_class)
+        self.property: L10nTemplate = L10nTemplate(template_property)
+
+class L10nPhaseStats:
+    """
+    Wall time spent in a generation phase, without the time of the phases nested in it, \
+    and the peak of the memory traced by `tracemalloc` while the phase was running (None if memory is not traced).
+    """
+    def __init__(self, name: str) -> None:
+        self.name: str = name
+        self.seconds: float = 0.0
+        self.peak_bytes: Optional[int] = None
+        self.calls: int = 0
+
+class L10nStats:
+    """
+    ### Statistics of a generation run, available as `Generator.stats`.
+    `phases` - `L10nPhaseStats` of `config`, `scan`, `unmarshal`, `merge`, `render` and `write` \
+    (`usage` and `prune` with `usageSources`), in the order they ran.\n
+    `files` - per translation file: bytes, JSON load and conversion time (measured in the worker process with `jobs` > 1).\n
+    `keys` (emitted), `locales`, `variables` (declared in the default locale), `fallbacks` (entries inherited \
+    from the default locale class), `pruned` (keys not used by `usageSources`), `output_bytes` (bytes written by the run).\n
+    Every hook is called with the `L10nPhaseStats` of a phase when it ends.
+    With `trace_memory` the peak memory of the phases is traced with `tracemalloc`, which slows the run down; \
+    tracing is started by the first phase if needed and left running, `tracemalloc.stop()` ends it.
+    """
+    def __init__(
+        self,
+        trace_memory: bool = False,
+        hooks: Optional[list[Callable[[L10nPhaseStats], Any]]] = None
+    ) -> None:
+        self.trace_memory: bool = trace_memory
+        self.hooks: list[Callable[[L10nPhaseStats], Any]] = list(hooks) if hooks is not None else []
+        self.phases: dict[str, L10nPhaseStats] = {}
+        self.files: dict[str, dict[str, Union[int, float]]] = {}
+        self.keys: int = 0
+        self.locales: int = 0
+        self.variables: int = 0
+        self.fallbacks: int = 0
+        self.pruned: int = 0
+        self.output_bytes: int = 0
+        # [start, seconds of the nested phases, peak before the nested phases] of the running phases
+        self.__stack: list[list] = []
+
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            if self.__stack:
+                # reset_peak is global, keep the peak the running phase reached so far
+                self.__stack[-1][2] = max(self.__stack[-1][2], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        frame: list = [time.perf_counter(), 0.0, 0]
+        self.__stack.append(frame)
+        try:
+            yield
+        finally:
+            self.__stack.pop()
+            elapsed: float = time.perf_counter() - frame[0]
+            if self.__stack:
+                self.__stack[-1][1] += elapsed
+
+            phase: Optional[L10nPhaseStats] = self.phases.get(name)
+            if phase is None:
+                phase = self.phases[name] = L10nPhaseStats(name)
+            phase.seconds += elapsed - frame[1]
+            phase.calls += 1
+            if self.trace_memory:
+                peak: int = max(frame[2], tracemalloc.get_traced_memory()[1])
+                phase.peak_bytes = peak if phase.peak_bytes is None else max(phase.peak_bytes, peak)
+            for hook in self.hooks:
+                hook(phase)
+
+    def add_file(self, file_name: str, size: int, load_seconds: float, convert_seconds: float) -> None:
+        self.files[file_name] = {
+            'bytes': size,
+            'loadSeconds': load_seconds,
+            'convertSeconds': convert_seconds,
+        }
+
+    def as_dict(self) -> dict:
+        """
+        JSON-serializable statistics, keys are camelCase like in the manifest.
+        """
+        return {
+            'phases': {
+                phase.name: {'seconds': phase.seconds, 'peakBytes': phase.peak_bytes, 'calls': phase.calls}
+                for phase in self.phases.values()
+            },
+            'files': self.files,
+            'keys': self.keys,
+            'locales': self.locales,
+            'variables': self.variables,
+            'fallbacks': self.fallbacks,
+            'pruned': self.pruned,
+            'outputBytes': self.output_bytes,
+        }
+
+    def format(self) -> str:
+        lines: list[str] = [f"{'phase':<24}{'ms':>10}{'peak KiB':>12}"]
+        for phase in self.phases.values():
+            peak: str = f"{phase.peak_bytes / 1024:>12.1f}" if phase.peak_bytes is not None else f"{'-':>12}"
+            lines.append(f"{phase.name:<24}{phase.seconds * 1e3:>10.2f}{peak}")
+            if phase.name == 'unmarshal':
+                for file_name, file_stats in self.files.items():
+                    lines.append(
+                        f"  {file_name:<22}{(file_stats['loadSeconds'] + file_stats['convertSeconds']) * 1e3:>10.2f}"
+                        f"  load {file_stats['loadSeconds'] * 1e3:.2f} ms, convert {file_stats['convertSeconds'] * 1e3:.2f} ms, {file_stats['bytes']} bytes"
+                    )
+        lines.append(
+            f"keys: {self.keys}, locales: {self.locales}, variables: {self.variables}, "
+            f"fallbacks: {self.fallbacks}, pruned: {self.pruned}, output bytes: {self.output_bytes}"
+        )
+        return '\n'.join(lines)
+
+class L10nOutputWriter:
+    """
+    Buffered writer of the generated module.\n
+    The text is written to a temporary file next to `path` which replaces `path` atomically on success, \
+    so importers never see a half-written module. Offsets of named sections are recorded in `sections`.
+    With `binary` bytes are written instead of text.
+    With `stats` the flush and the replacement are measured as the `write` phase.
+    """
+    def __init__(self, path: str, binary: bool = False, stats: Optional[L10nStats] = None) -> None:
+        self.path: str = path
+        self.binary: bool = binary
+        self.stats: Optional[L10nStats] = stats
+        self.sections: list[list] = []
+        self.__position: int = 0
+        self.__section: Optional[list] = None
+        directory, name = os.path.split(path)
+        self.__temp_path: str = os.path.join(directory, f".{name}.{os.urandom(4).hex()}.tmp")
+        self.__file = None
+
+    def __enter__(self) -> 'L10nOutputWriter':
+        if self.binary:
+            self.__file = open(self.__temp_path, 'xb', buffering=1 << 16)
+        else:
+            self.__file = open(self.__temp_path, 'x', encoding='utf-8', newline='', buffering=1 << 16)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is not None:
+            self.__file.close()
+            os.remove(self.__temp_path)
+        elif self.stats is None:
+            self.__commit()
+        else:
+            with self.stats.phase('write'):
+                self.__commit()
+            self.stats.output_bytes += os.path.getsize(self.path)
+
+    def __commit(self) -> None:
+        self.__file.close()
+        if os.path.exists(self.path):
+            os.chmod(self.__temp_path, os.stat(self.path).st_mode & 0o7777)
+        os.replace(self.__temp_path, self.path)
+
+    def write(self, text: Union[str, bytes]) -> None:
+        self.__file.write(text)
+        self.__position += len(text)
+
+    def begin_section(self, name: str) -> None:
+        self.__section = [name, self.__position]
+
+    def end_section(self) -> None:
+        self.__section.append(self.__position)
+        self.sections.append(self.__section)
+        self.__section = None
+
+class L10nUnmarshalError(ValueError):
+    """
+    Raised by `Generator.unmarshal`, `errors` contains the errors of all parsed files.
+    """
+    def __init__(self, errors: list[str]) -> None:
+        super().__init__("\n".join(errors))
+        self.errors: list[str] = errors
+
+    def __reduce__(self):
+        # Keeps `errors` a list when the error is raised in a worker process
+        return (type(self), (self.errors,))
+
+class L10nLocaleFile:
+    """
+    Result of parsing one l10n_languageCode.json file.
+    """
+    def __init__(
+        self,
+        language_code: str,
+        translate: Union[L10nTranslations, list[L10nObject]],
+        errors: list[str]
+    ) -> None:
+        self.language_code: str = language_code
+        self.translate: L10nTranslations = L10nTranslations.of(translate)
+        self.errors: list[str] = errors
+        self.file_name: str = f"l10n_{language_code}.json"
+        self.size: int = 0
+        self.load_seconds: float = 0.0
+        self.convert_seconds: float = 0.0
+
+def _convert_type(input_type: str) -> type:
+    types = Types()
+
+    if input_type == 'string':
+        return types.STRING
+    elif input_type == 'float':
+        return types.FLOAT
+    elif input_type == 'int':
+        return types.INTEGER
+    else:
+        raise ValueError(f"Incorrect data type: {input_type}")
+
+def _check_type(value: Any, expected_type: type) -> bool:
+    if isinstance(value, expected_type):
+        return True
+    else:
+        return False
+
+def _parse_params(
+    key: str,
+    meta: Any,
+    errors: list[str],
+    file_name: str = ''
+) -> Optional[L10nParams]:
+    """
+    Converts the `#key` metadata of `key`, returns None if it declares no variables.
+    Errors are appended to `errors` and the invalid variables are skipped, never raises.
+    """
+    if not isinstance(meta, dict):
+        errors.append(f"{file_name}: {key}: the metadata #{key} must be an object")
+        return None
+    l10n_params = L10nParams()
+
+    if 'description' in meta:
+        l10n_params.description = meta['description']
+    if 'example' in meta:
+        l10n_params.example = meta['example']
+    if 'variables' not in meta:
+        return None
+
+    variables_map = meta['variables']
+    if not isinstance(variables_map, dict):
+        errors.append(f"{file_name}: {key}: variables must be an object of variable names")
+        return None
+    variables: list[L10nParamsVariable] = []
+
+    for var_name, var_data in variables_map.items():
+        if not isinstance(var_data, dict):
+            errors.append(f"{file_name}: {key}.{var_name}: the variable must be an object with its type")
+            continue
+        l10n_params_variable = L10nParamsVariable()
+        l10n_params_variable.variable_name = var_name
+        try:
+            typeVar = _convert_type(var_data['type'])
+        except (KeyError, TypeError, ValueError) as e:
+            errors.append(f"{file_name}: {key}.{var_name}: {e if not isinstance(e, KeyError) else 'no type specified'}")
+            continue
+        l10n_params_variable.type = typeVar.__name__
+        if 'defaultValue' in var_data:
+            if _check_type(var_data['defaultValue'], typeVar):
+                l10n_params_variable.default_value = var_data['defaultValue']
+            else:
+                errors.append(f"{file_name}: {key}.{var_name}: Default type does not match the specified variable type, default variable type: {type(var_data['defaultValue'])}, expected type: {l10n_params_variable.type}")
+                continue
+
+        variables.append(l10n_params_variable)
+        l10n_params.variables = variables
+
+    return l10n_params
+
+def _plural_variable(meta: Any) -> Any:
+    return meta.get('plural') if isinstance(meta, dict) else None
+
+def _parse_plural(l10n_object: L10nObject, plural: Any, errors: list[str], file_name: str = '') -> None:
+    """
+    Checks the forms of a plural text, orders them like `PLURAL_CATEGORIES` and sets the int variable \
+    selecting the form (`plural` - the "plural" of the `#key` metadata, by default the only declared int variable).
+    """
+    key: str = l10n_object.value
+    forms: dict = l10n_object.text
+    unknown: list[str] = [str(category) for category in forms if category not in PLURAL_CATEGORIES]
+    if unknown:
+        errors.append(f"{file_name}: {key}: unknown plural categories: {', '.join(unknown)}, allowed categories: {', '.join(PLURAL_CATEGORIES)}")
+    if 'other' not in forms:
+        errors.append(f"{file_name}: {key}: plural forms must contain the 'other' form")
+    if not all(isinstance(form, str) for form in forms.values()):
+        errors.append(f"{file_name}: {key}: plural forms must be strings")
+    l10n_object.text = {category: forms[category] for category in PLURAL_CATEGORIES if category in forms}
+
+    params: Optional[L10nParams] = l10n_object.params
+    int_variables: list[str] = [
+        variable.variable_name for variable in (params.variables or ())
+        if variable.type == 'int'
+    ] if params is not None else []
+    if plural is None and len(int_variables) == 1:
+        plural = int_variables[0]
+    if plural is None or plural not in int_variables:
+        errors.append(f"{file_name}: {key}: plural forms need an int variable selecting the form, declare it in #{key} and name it in \"plural\" if there are several")
+        return
+    params.plural = plural
+
+def parse_translations(
+    data: dict[str, Union[str, dict, list]],
+    errors: list[str],
+    file_name: str = ''
+) -> list[L10nObject]:
+    """
+    Converts the content of a translation file into a list of `L10nObject`.
+    Errors are appended to `errors` and the invalid variables are skipped.
+    """
+    l10n_object_list: list[L10nObject] = []
+
+    for key, text in data.items():
+        if key.startswith('#'):
+            continue  # Metadata is read with its key
+
+        l10n_object = L10nObject()
+        l10n_object.value = key
+        l10n_object.text = text
+
+        meta_key = f"#{key}"
+        if meta_key in data:  # Check if there is metadata for this key
+            l10n_object.params = _parse_params(key, data[meta_key], errors, file_name)
+        if isinstance(text, dict):
+            _parse_plural(l10n_object, _plural_variable(data.get(meta_key)), errors, file_name)
+        l10n_object_list.append(l10n_object)
+
+    return l10n_object_list
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_NUMBER_TAIL = re.compile(r'[0-9.eE+-]*')
+# Fast paths for the common members: a key and a string value without escapes, followed by the separator
+_JSON_KEY = re.compile(r'[ \t\n\r]*"([^"\\\x00-\x1f]*)"[ \t\n\r]*:[ \t\n\r]*')
+_JSON_STRING_MEMBER = re.compile(r'"([^"\\\x00-\x1f]*)"[ \t\n\r]*([,}])')
+_JSON_MEMBER = re.compile(
+    r'[ \t\n\r]*"([^"\\\x00-\x1f]*)"[ \t\n\r]*:[ \t\n\r]*"([^"\\\x00-\x1f]*)"[ \t\n\r]*([,}])'
+)
+
+class _JsonObjectReader:
+    """
+    Reads the members of a top-level JSON object from a text file one by one, \
+    only the current member and a chunk of the file are held in memory.
+    """
+    def __init__(self, file, chunk_size: int) -> None:
+        self.file = file
+        self.chunk_size: int = chunk_size
+        self.buffer: str = ''
+        self.position: int = 0
+        self.consumed: int = 0  # characters dropped from the buffer
+        self.eof: bool = False
+        self.decoder: json.JSONDecoder = json.JSONDecoder()
+
+    def fill(self) -> None:
+        # Reads at least as much as is buffered, so retrying a long value stays linear
+        chunk: str = self.file.read(max(self.chunk_size, len(self.buffer) - self.position))
+        if not chunk:
+            self.eof = True
+        self.consumed += self.position
+        self.buffer = self.buffer[self.position:] + chunk
+        self.position = 0
+
+    def error(self, message: str, position: Optional[int] = None) -> ValueError:
+        offset: int = self.consumed + (self.position if position is None else position)
+        return ValueError(f"{message}: char {offset}")
+
+    def peek(self) -> str:
+        """
+        Skips whitespace, returns the next character or '' at the end of the file.
+        """
+        while True:
+            self.position = _WHITESPACE.match(self.buffer, self.position).end()
+            if self.position < len(self.buffer) or self.eof:
+                return self.buffer[self.position:self.position + 1]
+            self.fill()
+
+    def expect(self, characters: str) -> str:
+        character: str = self.peek()
+        if not character or character not in characters:
+            raise self.error(f"Expecting {' or '.join(repr(c) for c in characters)}")
+        self.position += 1
+        return character
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError as e:
+                if self.eof:
+                    raise self.error(e.msg, e.pos) from None
+                self.fill()
+                continue
+            # A number may continue in the next chunk, e.g. `1` or `1.` of `1.5e10`
+            if not self.eof and _NUMBER_TAIL.match(self.buffer, end).end() == len(self.buffer):
+                self.fill()
+                continue
+            self.position = end
+            return value
+
+    def members(self):
+        if self.peek() != '{':
+            raise ValueError("the root of the file must be an object")
+        self.position += 1
+        if self.peek() == '}':
+            self.position += 1
+        else:
+            while True:
+                match = _JSON_MEMBER.match(self.buffer, self.position)
+                if match is not None:
+                    key, value, separator = match.groups()
+                    self.position = match.end()
+                    yield key, value
+                    if separator == '}':
+                        break
+                    continue
+                match = _JSON_KEY.match(self.buffer, self.position)
+                if match is not None:
+                    key = match.group(1)
+                    self.position = match.end()
+                else:
+                    key = self.value()
+                    if not isinstance(key, str):
+                        raise self.error("Expecting property name enclosed in double quotes")
+                    self.expect(':')
+                match = _JSON_STRING_MEMBER.match(self.buffer, self.position)
+                if match is not None:
+                    value, separator = match.groups()
+                    self.position = match.end()
+                else:
+                    value = self.value()
+                    separator = self.expect(',}')
+                yield key, value
+                if separator == '}':
+                    break
+        if self.peek():
+            raise self.error("Extra data")
+
+def stream_translations(
+    file,
+    errors: list[str],
+    file_name: str = '',
+    chunk_size: int = 1 << 16
+) -> list[L10nObject]:
+    """
+    Same result as `parse_translations(json.load(file), ...)`, but the file is read in chunks \
+    and every key is converted as soon as it is read, so the raw content is never held in memory as a whole.\n
+    `#key` metadata may come before or after its key: metadata read first is kept until its key is read, \
+    keys read first are completed when their metadata is read.
+    Raises ValueError if the file is not a JSON object.
+    """
+    l10n_object_list: list[L10nObject] = []
+    objects: dict[str, L10nObject] = {}
+    plurals: dict[str, Any] = {}  # "plural" of the metadata by key
+    pending: dict[str, Any] = {}  # metadata of keys not read yet
+    # Errors of the metadata by key, reported in the key order like `parse_translations` does
+    params_errors: dict[str, list[str]] = {}
+
+    for key, value in _JsonObjectReader(file, chunk_size).members():
+        if key.startswith('#'):
+            target: str = key[1:]
+            l10n_object: Optional[L10nObject] = objects.get(target)
+            if l10n_object is None:
+                pending[target] = value
+            else:
+                # Duplicate metadata replaces the previous one, like in json.load
+                params_errors[target] = []
+                l10n_object.params = _parse_params(target, value, params_errors[target], file_name)
+                plurals[target] = _plural_variable(value)
+            continue
+
+        l10n_object = objects.get(key)
+        if l10n_object is None:
+            l10n_object = objects[key] = L10nObject()
+            l10n_object.value = key
+            l10n_object_list.append(l10n_object)
+        l10n_object.text = value
+        if key in pending:
+            params_errors[key] = []
+            meta: Any = pending.pop(key)
+            plurals[key] = _plural_variable(meta)
+            l10n_object.params = _parse_params(key, meta, params_errors[key], file_name)
+
+    for l10n_object in l10n_object_list:
+        errors.extend(params_errors.get(l10n_object.value, ()))
+        if isinstance(l10n_object.text, dict):
+            # Checked once the metadata is known, it may follow the key
+            _parse_plural(l10n_object, plurals.get(l10n_object.value), errors, file_name)
+    return l10n_object_list
+
+# Files larger than this are streamed by `load_locale_file`
+STREAMING_THRESHOLD = 32 << 20
+
+def load_locale_file(path: str, streaming: Optional[bool] = None) -> L10nLocaleFile:
+    """
+    Reads and parses one l10n_languageCode.json file, never raises.
+    With `streaming` (by default for files larger than `STREAMING_THRESHOLD`) the file is parsed \
+    with `stream_translations`, its whole time is reported as the load time.
+    Top-level function so it can be used on a process pool.
+    """
+    file_name: str = os.path.basename(path)
+    language_code: str = file_name.replace('l10n_', '').replace('.json', '')
+    errors: list[str] = []
+    start: float = time.perf_counter()
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            size: int = os.fstat(file.fileno()).st_size
+            if streaming or (streaming is None and size > STREAMING_THRESHOLD):
+                translate: list[L10nObject] = stream_translations(file, errors, file_name)
+                data: Optional[dict[str, Union[str, dict, list]]] = None
+            else:
+                data = json.load(file)
+    except (OSError, ValueError) as e:
+        return L10nLocaleFile(language_code, [], [f"{file_name}: {e}"])
+
+    loaded: float = time.perf_counter()
+    if data is not None:
+        if not isinstance(data, dict):
+            return L10nLocaleFile(language_code, [], [f"{file_name}: the root of the file must be an object"])
+        translate = parse_translations(data, errors, file_name)
+    result: L10nLocaleFile = L10nLocaleFile(language_code, translate, errors)
+    result.file_name = file_name
+    result.size = size
+    result.load_seconds = loaded - start
+    result.convert_seconds = time.perf_counter() - loaded
+    return result
+
+class L10nLocaleReport:
+    """
+    Keys of a single locale compared with the default locale.\n
+    `missing` - keys of the default locale the locale does not translate, they are taken from its fallback chain.\n
+    `extra` - keys present in the locale only, they are not emitted.\n
+    `chain` - the fallback locales, nearest first, the default locale is the last one.\n
+    `sources` - provenance of the missing keys: key -> locale of the chain its translation comes from.
+    """
+    def __init__(self, language_code: str) -> None:
+        self.language_code: str = language_code
+        self.missing: list[str] = []
+        self.extra: list[str] = []
+        self.chain: list[str] = []
+        self.sources: dict[str, str] = {}
+
+    @property
+    def is_complete(self) -> bool:
+        return not self.missing and not self.extra
+
+    def source(self, key: str) -> str:
+        """
+        Locale the translation of `key` comes from.
+        """
+        return self.sources.get(key, self.language_code)
+
+    def as_dict(self) -> dict:
+        """
+        JSON-serializable provenance report: the fallback chain and the keys taken from every locale of the chain.
+        """
+        fallbacks: dict[str, list[str]] = {language_code: [] for language_code in self.chain}
+        for key in self.missing:
+            fallbacks[self.sources[key]].append(key)
+        return {
+            'chain': self.chain,
+            'fallbacks': fallbacks,
+            'extra': self.extra,
+        }
+
+class L10nMergeResult:
+    """
+    Result of `Generator.merge`.\n
+    `table` maps every language code to its translations in the key order of the default locale \
+    (all locales share the key column), missing keys are already resolved to the default locale translations.
+    """
+    def __init__(self, default_language_code: str) -> None:
+        self.default_language_code: str = default_language_code
+        self.table: dict[str, L10nTranslations] = {}
+        self.report: dict[str, L10nLocaleReport] = {}
+
+    @property
+    def deduplicated(self) -> int:
+        """
+        Number of entries inherited from the default locale class instead of being emitted again.
+        """
+        return sum(len(report.missing) for report in self.report.values())
+
+# Modules of this package the output depends on: the code generation, the plural rules, \
+# the binary format and the pruning of unused keys
+OUTPUT_MODULES: tuple[str, ...] = ('generator.py', 'plural.py', 'binary.py', 'usage.py')
+
+def generator_version() -> str:
+    """
+    `GENERATOR_VERSION` with a hash of the sources of `OUTPUT_MODULES`, so changing any of them \
+    between releases invalidates generated outputs as well.
+    """
+    digest = hashlib.sha256()
+    for name in OUTPUT_MODULES:
+        digest.update(file_state(os.path.join(os.path.dirname(__file__), name))['sha256'].encode('ascii'))
+    return f"{GENERATOR_VERSION}+{digest.hexdigest()[:16]}"
+
+def file_state(path: str, previous: Optional[dict] = None) -> dict:
+    """
+    Returns {"size", "mtimeNs", "sha256"} of the file.
+    The content is hashed only if the size or modification time differ from `previous`.
+    """
+    stat = os.stat(path)
+    if (
+        previous is not None
+        and previous.get('size') == stat.st_size
+        and previous.get('mtimeNs') == stat.st_mtime_ns
+    ):
+        return previous
+
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1 << 20), b''):
+            digest.update(chunk)
+    return {
+        'size': stat.st_size,
+        'mtimeNs': stat.st_mtime_ns,
+        'sha256': digest.hexdigest(),
+    }
+
+class L10nManifest:
+    """
+    Hashes of the inputs and outputs of the last generation, stored next to `pathToOut`.\n
+    `sections` are the [name, start, end] offsets of the sections of the module output mode.
+    `sources` are the size and modification time of the `usageSources` files `usage` was scanned from.
+    """
+    def __init__(self) -> None:
+        self.generator_version: Optional[str] = None
+        self.config: Optional[str] = None
+        self.templates: Optional[str] = None
+        self.usage: Optional[str] = None
+        self.sources: dict[str, dict] = {}
+        self.files: dict[str, dict] = {}
+        self.outputs: dict[str, dict] = {}
+        self.sections: list[list] = []
+
+    @staticmethod
+    def path_for(path_to_out: str) -> str:
+        return path_to_out + '.manifest.json'
+
+    @classmethod
+    def load(cls, path: str) -> Optional['L10nManifest']:
+        """
+        Returns None if there is no manifest or it can not be read.
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+            manifest = cls()
+            manifest.generator_version = data['generatorVersion']
+            manifest.config = data['config']
+            manifest.templates = data['templates']
+            manifest.usage = data.get('usage')
+            manifest.sources = data.get('sources', {})
+            manifest.files = data['files']
+            manifest.outputs = data['outputs']
+            manifest.sections = data['sections']
+            return manifest
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self, path: str) -> None:
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(
+                {
+                    'generatorVersion': self.generator_version,
+                    'config': self.config,
+                    'templates': self.templates,
+                    'usage': self.usage,
+                    'sources': self.sources,
+                    'files': self.files,
+                    'outputs': self.outputs,
+                    'sections': self.sections,
+                },
+                file,
+                indent=2
+            )
+
+    def is_compatible(self, other: 'L10nManifest') -> bool:
+        """
+        Checks that both manifests were produced by the same generator, config, templates, \
+        names used by the sources and set of files.
+        """
+        return (
+            self.generator_version == other.generator_version
+            and self.config == other.config
+            and self.templates == other.templates
+            and self.usage == other.usage
+            and self.files.keys() == other.files.keys()
+        )
+
+def worker_count(jobs: int) -> int:
+    """
+    Number of processes for the `jobs` option: `jobs` itself, one per CPU if it is less than 1.
+    """
+    return jobs if jobs >= 1 else (os.cpu_count() or 1)
+
+def map_batches(function: Callable[[list], list], items: list, jobs: int = 1) -> list:
+    """
+    Returns the results of `function(batch)` for consecutive batches of `items`, concatenated in the order of `items`.\n
+    With more than one worker (see `worker_count`) the batches run on a process pool, a few batches per worker: \
+    sending every item separately costs more than processing it. Otherwise `function(items)` runs in this process.
+    `function` must be picklable, a top-level function or a `functools.partial` of one.
+    """
+    workers: int = worker_count(jobs)
+    if workers == 1 or len(items) < 2:
+        return function(items)
+    from concurrent.futures import ProcessPoolExecutor
+
+    size: int = max(1, -(-len(items) // (workers * 4)))
+    batches: list[list] = [items[i:i + size] for i in range(0, len(items), size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return [result for batch in executor.map(function, batches) for result in batch]
+
+def _load_locale_files(paths: list[str]) -> list[L10nLocaleFile]:
+    return [load_locale_file(path) for path in paths]
+
+def load_locales(
+    paths: list[str],
+    jobs: int = 1,
+    stats: Optional[L10nStats] = None,
+    intern: Optional[L10nInternTable] = None
+) -> L10nLocaleRegistry:
+    """
+    Parses the translation files into a registry sorted by language code.\n
+    With `jobs` > 1 (or < 1 for one job per CPU) the files are parsed on a process pool, see `map_batches`.
+    The load and conversion time of every file is recorded in `stats`.
+    Key columns and schemas are shared through `intern` (a new table by default), \
+    pass the same table to share them with locales loaded before.
+    Raises `L10nUnmarshalError` with the errors of all files.
+    """
+    results: list[L10nLocaleFile] = map_batches(_load_locale_files, paths, jobs)
+
+    if intern is None:
+        intern = L10nInternTable()
+    registry: L10nLocaleRegistry = L10nLocaleRegistry()
+    errors: list[str] = []
+    for result in sorted(results, key=lambda result: result.language_code):
+        if stats is not None:
+            stats.add_file(result.file_name, result.size, result.load_seconds, result.convert_seconds)
+        if result.errors:
+            errors.extend(result.errors)
+            continue
+        registry.add(
+            language_code = result.language_code,
+            translate = intern.translations(result.translate)
+        )
+
+    if errors:
+        for error in errors:
+            logging.error(error)
+        raise L10nUnmarshalError(errors)
+    return registry
+
+class L10nParseCache:
+    """
+    Parsed translation files shared by generators (e.g. by `l10n.batch` for configurations \
+    with the same `pathToTranslates`), a file is parsed again only if its size or modification time changed.
+    The cached locales share key columns and schemas through `intern`.
+    `hits` and `misses` count the files taken from the cache and the files parsed.
+    """
+    def __init__(self) -> None:
+        self.intern: L10nInternTable = L10nInternTable()
+        self.hits: int = 0
+        self.misses: int = 0
+        # Real path -> (mtime in ns, size, language code, translations)
+        self.__files: dict[str, tuple[int, int, str, L10nTranslations]] = {}
+
+    def load(
+        self,
+        paths: list[str],
+        jobs: int = 1,
+        stats: Optional[L10nStats] = None
+    ) -> L10nLocaleRegistry:
+        """
+        Same as `load_locales`, the files found in the cache are not parsed (nor recorded in `stats`).
+        """
+        cached: dict[str, L10nTranslations] = {}
+        parse: list[str] = []
+        states: dict[str, tuple[int, int]] = {}
+        for path in paths:
+            real_path: str = os.path.realpath(path)
+            try:
+                stat: os.stat_result = os.stat(real_path)
+            except OSError:
+                # Reported by load_locales
+                parse.append(path)
+                continue
+            entry: Optional[tuple[int, int, str, L10nTranslations]] = self.__files.get(real_path)
+            if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+                cached[entry[2]] = entry[3]
+                continue
+            # Taken before parsing, a file modified meanwhile is parsed again next time
+            states[path] = (stat.st_mtime_ns, stat.st_size)
+            parse.append(path)
+
+        parsed: L10nLocaleRegistry = load_locales(parse, jobs, stats, self.intern)
+        self.hits += len(cached)
+        self.misses += len(parse)
+        for path in parse:
+            language_code: str = os.path.basename(path).replace('l10n_', '').replace('.json', '')
+            node: Optional[L10nNode] = parsed.get(language_code)
+            if node is not None and path in states:
+                self.__files[os.path.realpath(path)] = (*states[path], language_code, node.translate)
+                cached[language_code] = node.translate
+
+        registry: L10nLocaleRegistry = L10nLocaleRegistry()
+        for language_code in sorted(cached):
+            registry.add(language_code = language_code, translate = cached[language_code])
+        return registry
+
+class L10nFallbackError(ValueError):
+    """
+    Raised for a fallback graph with a cycle or with a fallback locale that has no translation file.
+    """
+
+def resolve_fallbacks(
+    language_codes: Iterable[str],
+    default_language_code: str,
+    fallbacks: Optional[dict[str, str]] = None
+) -> dict[str, list[str]]:
+    """
+    Returns the fallback chain of every locale: its fallback locales, nearest first, ending with the default locale \
+    (empty for the default locale). `fallbacks` maps a locale to the locale it falls back to, \
+    the other locales fall back to the default locale; entries of locales that are not loaded are ignored.
+    Raises `L10nFallbackError` for a cycle or a fallback locale that is not loaded.
+    """
+    fallbacks = fallbacks or {}
+    if default_language_code in fallbacks:
+        raise L10nFallbackError(f"The default locale {default_language_code} can not fall back to {fallbacks[default_language_code]}")
+    codes: set[str] = set(language_codes)
+    chains: dict[str, list[str]] = {}
+    for language_code in codes:
+        chain: list[str] = []
+        visited: list[str] = [language_code]
+        current: str = language_code
+        while current != default_language_code:
+            parent: str = fallbacks.get(current, default_language_code)
+            if parent in visited:
+                raise L10nFallbackError(f"Fallback cycle: {' -> '.join(visited[visited.index(parent):] + [parent])}")
+            if parent not in codes:
+                raise L10nFallbackError(f"Fallback locale {parent} of {current} has no translation file")
+            chain.append(parent)
+            visited.append(parent)
+            current = parent
+        chains[language_code] = chain
+    return chains
+
+def merge_locales(
+    registry: L10nLocaleRegistry,
+    default_language_code: str,
+    previous: Optional[L10nMergeResult] = None,
+    language_codes: Optional[Iterable[str]] = None,
+    fallbacks: Optional[dict[str, str]] = None
+) -> L10nMergeResult:
+    """
+    Resolves the translations of every locale in `registry` against its fallback chain (see `resolve_fallbacks`), \
+    so every locale of the result is complete.\n
+    Each locale is indexed by key once and overlays the merged table of its nearest fallback locale, \
+    so the merge is linear in the number of keys.
+    With `previous` and `language_codes` only these locales and the locales falling back to them are merged again, \
+    the others are taken from `previous` (the default locale and the fallback graph must not have changed since).
+    """
+    default_language_node: Optional[L10nNode] = registry.get(default_language_code)
+    if default_language_node is None:
+        raise ValueError(f"Default translation file l10n_{default_language_code}.json was not found")
+
+    chains: dict[str, list[str]] = resolve_fallbacks(registry.language_codes, default_language_code, fallbacks)
+    result: L10nMergeResult = L10nMergeResult(default_language_code)
+    default: L10nTranslations = L10nTranslations.of(default_language_node.translate)
+    default_positions: dict[str, int] = default.positions()
+
+    outdated: Optional[set[str]] = None
+    if previous is not None and language_codes is not None:
+        outdated = set(language_codes)
+        outdated |= {language_code for language_code, chain in chains.items() if outdated.intersection(chain)}
+    tables: dict[str, L10nTranslations] = {}
+    # Fallback locales go first, their chains are shorter
+    for node in sorted(registry, key=lambda node: len(chains[node.language_code])):
+        if outdated is not None and node.language_code not in outdated and node.language_code in previous.table:
+            tables[node.language_code] = previous.table[node.language_code]
+            result.report[node.language_code] = previous.report[node.language_code]
+            continue
+        translations: L10nTranslations = L10nTranslations.of(node.translate)
+        report: L10nLocaleReport = L10nLocaleReport(node.language_code)
+        report.chain = chains[node.language_code]
+        result.report[node.language_code] = report
+        if not report.chain:
+            tables[node.language_code] = default
+            continue
+
+        # Columns of the nearest fallback locale, overwritten by the keys the locale translates
+        parent: str = report.chain[0]
+        base: L10nTranslations = tables[parent]
+        texts: list[str] = list(base.texts)
+        params: list[Optional[L10nParams]] = list(base.params)
+        translated: bytearray = bytearray(len(default))
+        extra: dict[str, None] = {}
+        for key, text, key_params in zip(translations.keys, translations.texts, translations.params):
+            position: Optional[int] = default_positions.get(key)
+            if position is None:
+                extra[key] = None
+                continue
+            texts[position] = text
+            params[position] = key_params
+            translated[position] = 1
+
+        report.missing = [key for key, found in zip(default.keys, translated) if not found]
+        parent_sources: dict[str, str] = result.report[parent].sources
+        report.sources = {key: parent_sources.get(key, parent) for key in report.missing}
+        report.extra = list(extra)
+        tables[node.language_code] = L10nTranslations(default.keys, tuple(texts), tuple(params))
+
+    result.table = {node.language_code: tables[node.language_code] for node in registry}
+    result.report = {node.language_code: result.report[node.language_code] for node in registry}
+    return result
+
 class Configuration:
     def __init__(self):
         self.__path_to_translates: str
         self.__path_to_out: str
         self.__default_translate_file: str
         self.__class_name: str
+        self.__output_mode: str = OUTPUT_MODE_MODULE
+        self.__instrumentation: bool = False
+        self.__usage_sources: Optional[list[str]] = None
+        self.__keep_keys: list[str] = []
+        self.__fallbacks: dict[str, str] = {}
     
     @property
     def path_to_translates(self) -> str:
@@ -277,6 +1492,65 @@ class Configuration:
     def class_name(self, value: str) -> None:
         self.__class_name = value
 
+    @property
+    def output_mode(self) -> str:
+        return self.__output_mode
+
+    @output_mode.setter
+    def output_mode(self, value: str) -> None:
+        if value not in (OUTPUT_MODE_MODULE, OUTPUT_MODE_PACKAGE):
+            raise ValueError(f"Incorrect output mode: {value}, allowed modes: {OUTPUT_MODE_MODULE}, {OUTPUT_MODE_PACKAGE}")
+        self.__output_mode = value
+
+    @property
+    def instrumentation(self) -> bool:
+        return self.__instrumentation
+
+    @instrumentation.setter
+    def instrumentation(self, value: bool) -> None:
+        if not isinstance(value, bool):
+            raise ValueError(f"Incorrect instrumentation value: {value}, allowed values: true, false")
+        self.__instrumentation = value
+
+    @property
+    def usage_sources(self) -> Optional[list[str]]:
+        """
+        Files or directories scanned for the keys the application uses, None - every key is emitted.
+        """
+        return self.__usage_sources
+
+    @usage_sources.setter
+    def usage_sources(self, value: Optional[list[str]]) -> None:
+        if value is not None and (not isinstance(value, list) or not all(isinstance(path, str) for path in value)):
+            raise ValueError(f"Incorrect usage sources: {value}, a list of paths is expected")
+        self.__usage_sources = value
+
+    @property
+    def keep_keys(self) -> list[str]:
+        """
+        Keys or `fnmatch` patterns emitted even if they are not found in `usage_sources`.
+        """
+        return self.__keep_keys
+
+    @keep_keys.setter
+    def keep_keys(self, value: list[str]) -> None:
+        if not isinstance(value, list) or not all(isinstance(key, str) for key in value):
+            raise ValueError(f"Incorrect keep keys: {value}, a list of keys is expected")
+        self.__keep_keys = value
+
+    @property
+    def fallbacks(self) -> dict[str, str]:
+        """
+        Locale -> locale it falls back to (e.g. pt_BR -> pt), the other locales fall back to the default locale.
+        """
+        return self.__fallbacks
+
+    @fallbacks.setter
+    def fallbacks(self, value: dict[str, str]) -> None:
+        if not isinstance(value, dict) or not all(isinstance(key, str) and isinstance(val, str) for key, val in value.items()):
+            raise ValueError(f"Incorrect fallbacks: {value}, a mapping of locales to locales is expected")
+        self.__fallbacks = value
+
 class Generator:
     """
     ### This module is a generator of a python file that will contain translations. \
@@ -311,13 +1585,50 @@ class Generator:
     def __init__(
         self,
         path_to_config_file: str,
+        jobs: int = 1,
+        output_format: str = OUTPUT_FORMAT_PYTHON,
+        stats: Optional[L10nStats] = None,
+        cache: Optional[L10nParseCache] = None,
     ) -> None:
+        """
+        With `cache` the translation files are parsed through the given `L10nParseCache`, \
+        so generators sharing it parse a translations directory once.
+        """
         self.path_to_config_file: str = path_to_config_file
         self.configuration: Configuration = Configuration()
-        self.__l10n_node_operations = L10nNodeOperations()
+        if output_format not in (OUTPUT_FORMAT_PYTHON, OUTPUT_FORMAT_BINARY):
+            raise ValueError(f"Incorrect output format: {output_format}, allowed formats: {OUTPUT_FORMAT_PYTHON}, {OUTPUT_FORMAT_BINARY}")
+        self.jobs: int = jobs
+        self.output_format: str = output_format
+        self.__registry: L10nLocaleRegistry = L10nLocaleRegistry()
+        self.__cache: Optional[L10nParseCache] = cache
+        # Shared by every unmarshal, so locales parsed again by `update` share the columns too
+        self.__intern: L10nInternTable = cache.intern if cache is not None else L10nInternTable()
         self.__locales: list[str] = []
+        self.__merged: Optional[L10nMergeResult] = None
+        # Merge result before the unused keys were removed, reused by the next incremental merge
+        self.__unpruned: Optional[L10nMergeResult] = None
+        self.__usage = None
+        self.__pruned = None
+        # Manifest and templates of the output written or checked last, see `build` and `update`
+        self.__manifest: Optional[L10nManifest] = None
+        self.__templates: Optional[L10nTemplates] = None
+        self.stats: L10nStats = stats if stats is not None else L10nStats()
+
+    @property
+    def registry(self) -> L10nLocaleRegistry:
+        """
+        Locales parsed by `unmarshal`, in the order they were read.
+        """
+        return self.__registry
 
     def parse_config(self) -> None:
+        with self.stats.phase('config'):
+            self.__parse_config()
+
+    def __parse_config(self) -> None:
+        import yaml  # Imported on use, so importing the generator as a library stays cheap
+
         with open(self.path_to_config_file, "r") as file:
             data = yaml.safe_load(file)
         
@@ -325,6 +1636,11 @@ class Generator:
         self.configuration.path_to_out = data['pathToOut']
         self.configuration.default_translate_file = data['defaultTranslateFile']
         self.configuration.class_name = data['className']
+        self.configuration.output_mode = data.get('outputMode', OUTPUT_MODE_MODULE)
+        self.configuration.instrumentation = data.get('instrumentation', False)
+        self.configuration.usage_sources = data.get('usageSources')
+        self.configuration.keep_keys = data.get('keepKeys', [])
+        self.configuration.fallbacks = data.get('fallbacks') or {}
     
     def __get_file_names(self) -> list[str]:
         """
@@ -332,212 +1648,777 @@ class Generator:
         Returns: ["l10n_en.json","l10n_ru.json",...]
         """
         file_names_with_extension = []
-        with os.scandir(self.configuration.path_to_translates) as entries:
+        with self.stats.phase('scan'), os.scandir(self.configuration.path_to_translates) as entries:
             for entry in entries:
-                if entry.is_file() and entry.name.startswith('l10n_') and entry.name.endswith('.json'):
+                if entry.is_file() and self.__is_translation_file(entry.name):
                     file_names_with_extension.append(entry.name)
         
-        return file_names_with_extension
+        return sorted(file_names_with_extension)
 
-    def __convert_type(self, input_type: str) -> type:
-        types = Types()
-        
-        if input_type == 'string':
-            return types.STRING
-        elif input_type == 'float':
-            return types.FLOAT
-        elif input_type == 'int':
-            return types.INTEGER
-        else:
-            raise ValueError(f"Incorrect data type: {input_type}")
-        
-    def __check_type(self, value: Any, expected_type: type) -> bool:
-        if isinstance(value, expected_type):
-            return True
-        else:
-            return False
+    def unmarshal(self, files: Optional[list[str]] = None, jobs: Optional[int] = None):
+        """
+        Parses the translation files into `registry`, locales are registered sorted by language code.\n
+        If `files` is not given, all l10n_*.json files from `pathToTranslates` are parsed.
+        With `jobs` > 1 (or < 1 for one job per CPU) the files are parsed on a process pool, \
+        by default the `jobs` passed to the constructor is used.\n
+        Raises `L10nUnmarshalError` with the errors of all files.
+        """
+        if files is None:
+            files = self.__get_file_names()
+        if jobs is None:
+            jobs = self.jobs
+
+        with self.stats.phase('unmarshal'):
+            registry: L10nLocaleRegistry = self.__load_locales(
+                [self.configuration.path_to_translates + i for i in files],
+                jobs
+            )
+        for node in registry:
+            self.__locales.append(node.language_code)
+            self.__registry.add(
+                language_code = node.language_code,
+                translate = node.translate
+            )
+
+    def __load_locales(self, paths: list[str], jobs: int) -> L10nLocaleRegistry:
+        if self.__cache is not None:
+            return self.__cache.load(paths, jobs, self.stats)
+        return load_locales(paths, jobs, self.stats, self.__intern)
+
+    @property
+    def merged(self) -> Optional[L10nMergeResult]:
+        """
+        Result of the last `merge`, `merged.deduplicated` is the number of entries \
+        inherited from the default locale class during the last generation.
+        """
+        return self.__merged
 
-    def unmarshal(self):
-        files: list[str] = self.__get_file_names()
+    @property
+    def default_language_code(self) -> str:
+        """
+        Language code of `defaultTranslateFile` (e.g. l10n_en.json -> en).
+        """
+        return self.configuration.default_translate_file.replace(
+            'l10n_', ''
+        ).replace(
+            '.json', ''
+        )
 
-        for i in files:
-            l10n_object_list: list[L10nObject] = []  # Create a new list for each file
+    def scan_usage(self):
+        """
+        Scans `usageSources` for the keys the application looks up (`l10n.usage.L10nUsage`), \
+        the generated output is not scanned. The result is cached by the generator.
+        """
+        if self.__usage is None:
+            from l10n.usage import scan_sources
+
+            with self.stats.phase('usage'):
+                self.__usage = scan_sources(
+                    self.configuration.usage_sources,
+                    f"Base{self.configuration.class_name}",
+                    self.jobs,
+                    exclude=self.__usage_exclude()
+                )
+        return self.__usage
 
-            with open(self.configuration.path_to_translates + i, 'r', encoding='utf-8') as file:
-                data: dict[str, Union[str, dict, list]] = json.load(file)
-            
-            language_code = i.replace('l10n_', '').replace('.json', '')
-            self.__locales.append(language_code)
+    def __usage_exclude(self) -> list[str]:
+        # The generated output looks up every key, it is never scanned
+        return [self.output_path, self.configuration.path_to_out]
 
-            keys_list: list[str] = list(data.keys())
-            
-            for key in keys_list:
-                l10n_object = L10nObject()
-                l10n_object.value = key
-                l10n_object.text = key
+    @property
+    def pruned(self):
+        """
+        `l10n.usage.L10nPruneReport` of the last `merge` if `usageSources` is configured, otherwise None.
+        """
+        return self.__pruned
 
-                if not key.startswith('#'):
-                    l10n_object.text = data[key]
-                else:
-                    continue  # Skip the metadata for now
-
-                if f"#{key}" in keys_list:  # Check if there is metadata for this key
-                    l10n_params = L10nParams()
-                    meta_key = f"#{key}"
-                    
-                    if 'description' in data[meta_key]:
-                        l10n_params.description = data[meta_key]['description']
-                    if 'example' in data[meta_key]:
-                        l10n_params.example = data[meta_key]['example']
-                    if 'variables' in data[meta_key]:
-                        variables_map = data[meta_key]['variables']
-                        variables: list[L10nParamsVariable] = []
-
-                        for var_name, var_data in variables_map.items():
-                            l10n_params_variable = L10nParamsVariable()
-                            l10n_params_variable.variable_name = var_name
-                            typeVar = self.__convert_type(var_data['type'])
-                            l10n_params_variable.type = typeVar.__name__
-                            if 'defaultValue' in var_data:
-                                if self.__check_type(var_data['defaultValue'], typeVar):
-                                    l10n_params_variable.default_value = var_data['defaultValue']
-                                else:
-                                    logging.error(f"Default type does not match the specified variable type, default variable type: {type(var_data['defaultValue'])}, expected type: {l10n_params_variable.type}")
-                                    return
-                                
-                            variables.append(l10n_params_variable)
-                            l10n_params.variables = variables
-
-                        l10n_object.params = l10n_params
-                l10n_object_list.append(l10n_object)
-
-            self.__l10n_node_operations.append(
-                language_code = language_code,
-                translate = l10n_object_list
+    def merge(self, language_codes: Optional[Iterable[str]] = None) -> L10nMergeResult:
+        """
+        Resolves the translations of every locale against its fallback chain (see `merge_locales`).\n
+        Each locale is indexed by key once, so the merge is linear in the number of keys.
+        With `language_codes` only these locales and the locales falling back to them are merged again \
+        if the default locale is not one of them, the others are taken from the previous `merge`.
+        If `usageSources` is configured, the keys the sources do not use are removed from the result.
+        """
+        if self.default_language_code not in self.__registry:
+            raise ValueError(f"Default translation file {self.configuration.default_translate_file} was not found in {self.configuration.path_to_translates}")
+
+        with self.stats.phase('merge'):
+            previous: Optional[L10nMergeResult] = None
+            if language_codes is not None:
+                language_codes = list(language_codes)
+                if self.default_language_code not in language_codes:
+                    previous = self.__unpruned
+            result: L10nMergeResult = merge_locales(
+                self.__registry,
+                self.default_language_code,
+                previous,
+                language_codes,
+                self.configuration.fallbacks
             )
+        self.__unpruned = result
+        if self.configuration.usage_sources is not None:
+            from l10n.usage import prune_merged
+
+            usage = self.scan_usage()
+            with self.stats.phase('prune'):
+                result, self.__pruned = prune_merged(result, usage, self.configuration.keep_keys)
+            self.stats.pruned = len(self.__pruned.pruned)
+        self.__merged = result
+
+        default_translate: list[L10nObject] = result.table[self.default_language_code]
+        self.stats.keys = len(default_translate)
+        self.stats.locales = len(self.__registry)
+        self.stats.variables = sum(
+            len(val.params.variables) for val in default_translate
+            if val.params is not None and val.params.variables is not None
+        )
+        self.stats.fallbacks = result.deduplicated
+        logging.info(f"{result.deduplicated} entries are inherited from fallback locale classes")
+        return result
 
-    def generate(
+    def provenance(self) -> dict[str, dict]:
+        """
+        Returns the provenance report of every locale (see `L10nLocaleReport.as_dict`): \
+        its fallback chain and the keys taken from every locale of the chain.
+        The last `merge` is reused if it covers every translation file (e.g. after a `build` that wrote \
+        the whole output), otherwise all translation files are parsed and merged.
+        """
+        self.parse_config()
+        file_names: list[str] = self.__get_file_names()
+        merged: Optional[L10nMergeResult] = self.__unpruned
+        if merged is None or set(merged.report) != {self.__language_code(name) for name in file_names}:
+            registry: L10nLocaleRegistry = self.__load_locales(
+                [self.configuration.path_to_translates + name for name in file_names],
+                self.jobs
+            )
+            merged = merge_locales(registry, self.default_language_code, fallbacks=self.configuration.fallbacks)
+        return {language_code: report.as_dict() for language_code, report in merged.report.items()}
+
+    def check(self, jobs: Optional[int] = None):
+        """
+        Validates all translation files in one pass without rendering or writing anything \
+        (`l10n.check.L10nCheckReport` with the errors of every file and key, see `l10n.check.check_files`).
+        By default the `jobs` passed to the constructor is used.
+        """
+        from l10n.check import check_files
+
+        self.parse_config()
+        with self.stats.phase('check'):
+            return check_files(
+                [self.configuration.path_to_translates + name for name in self.__get_file_names()],
+                self.default_language_code,
+                self.configuration.fallbacks,
+                self.jobs if jobs is None else jobs
+            )
+
+    def build(
         self,
-        template_base_class: str,
-        template_extend_class: str,
-        template_property: str
+        template_base_class: str = TEMPLATE_BASE_CLASS,
+        template_extend_class: str = TEMPLATE_EXTEND_CLASS,
+        template_property: str = TEMPLATE_PROPERTY,
+        force: bool = False
+    ) -> bool:
+        """
+        Parses the configuration and generates the output incrementally.\n
+        The manifest stored next to `pathToOut` is compared with the current inputs:
+        if nothing changed, nothing is parsed or written; if only non-default locale files changed, \
+        only these files are parsed and only their sections of the output are replaced.\n
+        Returns True if the output was written.
+        """
+        self.parse_config()
+        manifest_path: str = L10nManifest.path_for(self.output_path)
+        previous: Optional[L10nManifest] = None if force else L10nManifest.load(manifest_path)
+        templates: L10nTemplates = L10nTemplates(template_base_class, template_extend_class, template_property)
+        current: L10nManifest = self.__current_manifest(templates, previous)
+        self.__templates = templates
+
+        changed: Optional[list[str]] = None
+        if self.__is_output_valid(previous, current):
+            changed = [
+                name for name in current.files
+                if current.files[name]['sha256'] != previous.files[name]['sha256']
+            ]
+
+        if changed is not None and not changed:
+            current.outputs = previous.outputs
+            current.sections = previous.sections
+            if current.files != previous.files or current.sources != previous.sources:
+                # Only modification times changed, remember them to skip hashing and scanning next time
+                current.save(manifest_path)
+            self.__manifest = current
+            return False
+
+        if (
+            changed is not None
+            and self.configuration.default_translate_file not in changed
+            and self.output_format == OUTPUT_FORMAT_PYTHON
+        ):
+            changed_codes: list[str] = [self.__language_code(name) for name in changed]
+            self.unmarshal(self.__fallback_files(current, changed_codes))
+            self.__write_changed_locales(templates, current, previous, changed_codes)
+        else:
+            self.unmarshal()
+            current.sections = self.__write_output(templates)
+            current.outputs = {path: file_state(path) for path in self.output_files}
+
+        current.save(manifest_path)
+        self.__manifest = current
+        return True
+
+    def update(self, file_names: Iterable[str]) -> bool:
+        """
+        Parses the given translation files into the in-memory `registry` again (deleted files remove their locale) \
+        and rewrites the output like `build`, without parsing the other files.
+        Locales not parsed yet (e.g. `build` found nothing to do) are parsed on the first call.\n
+        Raises `L10nUnmarshalError` if a file can not be parsed, the registry and the output are left unchanged.
+        Returns True if the output was written.
+        """
+        if self.__templates is None:
+            raise ValueError("Generator.update requires a build first")
+        templates: L10nTemplates = self.__templates
+        self.__load_missing()
+
+        previous: Optional[L10nManifest] = self.__manifest
+        current: L10nManifest = self.__current_manifest(templates, previous)
+        changed: list[str] = sorted(
+            name for name in set(file_names)
+            if self.__is_translation_file(name)
+            and current.files.get(name, {}).get('sha256') != (previous.files.get(name, {}).get('sha256') if previous is not None else None)
+        )
+        if not changed:
+            return False
+
+        existing: list[str] = [name for name in changed if name in current.files]
+        with self.stats.phase('unmarshal'):
+            parsed: L10nLocaleRegistry = self.__load_locales(
+                [self.configuration.path_to_translates + name for name in existing],
+                1
+            )
+        if self.configuration.default_translate_file not in current.files:
+            raise ValueError(f"Default translation file {self.configuration.default_translate_file} was not found in {self.configuration.path_to_translates}")
+
+        for name in changed:
+            if name not in current.files:
+                self.__registry.remove(self.__language_code(name))
+        added: bool = False
+        for node in parsed:
+            added = added or node.language_code not in self.__registry
+            self.__registry.add(language_code = node.language_code, translate = node.translate)
+        if added:
+            self.__sort_registry()
+
+        if (
+            self.__is_output_valid(previous, current)
+            and self.configuration.default_translate_file not in changed
+            and self.output_format == OUTPUT_FORMAT_PYTHON
+        ):
+            self.__write_changed_locales(templates, current, previous, [self.__language_code(name) for name in changed])
+        else:
+            current.sections = self.__write_output(templates)
+            current.outputs = {path: file_state(path) for path in self.output_files}
+
+        current.save(L10nManifest.path_for(self.output_path))
+        self.__manifest = current
+        return True
+
+    def watch(
+        self,
+        interval: float = 1.0,
+        use_inotify: Optional[bool] = None,
+        template_base_class: str = TEMPLATE_BASE_CLASS,
+        template_extend_class: str = TEMPLATE_EXTEND_CLASS,
+        template_property: str = TEMPLATE_PROPERTY
     ):
-        # Extracting default language code from configuration file
-        default_language_code: str = self.configuration.default_translate_file.replace(
-            'l10n_', ''
-        ).replace(
-            '.json', ''
+        """
+        Builds the output, keeps the parsed locales in memory and starts a `l10n.watch.TranslationsWatcher` \
+        of `pathToTranslates` which calls `update` with the changed files. Returns the started watcher, \
+        `stop()` ends watching. Changes of the configuration or `usageSources` need a new generator.
+        """
+        from l10n.watch import TranslationsWatcher
+
+        self.parse_config()
+        # Created before the build, so edits made during the build are picked up by its first scan
+        watcher: TranslationsWatcher = TranslationsWatcher(
+            self.configuration.path_to_translates,
+            self.__on_change,
+            interval = interval,
+            use_inotify = use_inotify
         )
+        self.build(template_base_class, template_extend_class, template_property)
+        self.__load_missing()
+        watcher.start()
+        return watcher
+
+    def __on_change(self, changed: set[str]) -> None:
+        start: float = time.perf_counter()
+        try:
+            written: bool = self.update(changed)
+        except ValueError as e:
+            logging.error(f"The output was not updated: {e}")
+            return
+        if written:
+            logging.info(f"{', '.join(sorted(changed))}: the output was updated in {(time.perf_counter() - start) * 1e3:.1f} ms")
 
-        default_language_node: L10nNode
-
-        for i in range(1, self.__l10n_node_operations.size + 1):
-            current_node = self.__l10n_node_operations.get_value_at_index(i)
-            if current_node.language_code == default_language_code:
-                default_language_node = current_node
-                break
-
-        BASE_CLASS = f"Base{self.configuration.class_name}"  # Generating base class name
-
-        # Generation of implementation classes.
-        extend_class: str = ""  # Initializing extend class string
-
-        # Iterate over all languages
-        for i in range(1, self.__l10n_node_operations.size + 1):
-            language_code = self.__l10n_node_operations.get_value_at_index(i).language_code.capitalize()
-            current_node = self.__l10n_node_operations.get_value_at_index(i)
-
-            # Generating extended class using provided template and language code
-            extended_class = template_extend_class.replace(
-                '{ClassNameExtend}',
-                f"{self.configuration.class_name}{language_code}"
-            ).replace(
-                '{ExtendClass}',
-                BASE_CLASS
-            ).replace(
-                '{bodyExtend}',
-                '...'
-            ).replace(
-                '{ClassConstructorArgs}',
-                ''
+    def __load_missing(self) -> None:
+        """
+        Parses the translation files whose locales are not in `registry` yet.
+        """
+        missing: list[str] = [
+            name for name in self.__get_file_names()
+            if self.__language_code(name) not in self.__registry
+        ]
+        if missing:
+            self.unmarshal(missing)
+            self.__sort_registry()
+
+    def __sort_registry(self) -> None:
+        # Same order as a full unmarshal, so the output does not depend on the order the files were parsed in
+        nodes: list[L10nNode] = sorted(self.__registry, key=lambda node: node.language_code)
+        self.__registry.clear()
+        for node in nodes:
+            self.__registry.add(language_code = node.language_code, translate = node.translate)
+
+    @staticmethod
+    def __is_translation_file(name: str) -> bool:
+        return name.startswith('l10n_') and name.endswith('.json')
+
+    def __language_code(self, file_name: str) -> str:
+        return file_name.replace('l10n_', '').replace('.json', '')
+
+    def __current_manifest(self, templates: L10nTemplates, previous: Optional[L10nManifest]) -> L10nManifest:
+        """
+        Manifest of the current inputs, files unchanged since `previous` are not hashed again.
+        """
+        current: L10nManifest = L10nManifest()
+        current.generator_version = generator_version()
+        current.config = file_state(self.path_to_config_file)['sha256']
+        current.templates = hashlib.sha256(
+            '\0'.join((
+                self.output_format,
+                templates.base_class.template,
+                templates.extend_class.template,
+                templates.property.template,
+            )).encode('utf-8')
+        ).hexdigest()
+        if self.configuration.usage_sources is not None:
+            from l10n.usage import find_source_files
+
+            for path in find_source_files(self.configuration.usage_sources, self.__usage_exclude()):
+                stat = os.stat(path)
+                current.sources[path] = {'size': stat.st_size, 'mtimeNs': stat.st_mtime_ns}
+            if self.__usage is None and previous is not None and previous.usage is not None and previous.sources == current.sources:
+                # No source file changed since the last generation, they are not parsed again
+                current.usage = previous.usage
+            else:
+                # Edits of the sources regenerate the output only if the set of looked up names changed
+                current.usage = hashlib.sha256('\0'.join(sorted(self.scan_usage().names)).encode('utf-8')).hexdigest()
+        for name in self.__get_file_names():
+            current.files[name] = file_state(
+                self.configuration.path_to_translates + name,
+                previous.files.get(name) if previous is not None else None
             )
+        return current
 
-            properties_class: str = ''
+    def __fallback_files(self, current: L10nManifest, changed_codes: list[str]) -> list[str]:
+        """
+        Translation files needed to merge the changed locales again: the changed locales, \
+        the locales falling back to them and all their fallback locales (the default one included).
+        """
+        chains: dict[str, list[str]] = resolve_fallbacks(
+            [self.__language_code(name) for name in current.files],
+            self.default_language_code,
+            self.configuration.fallbacks
+        )
+        changed: set[str] = set(changed_codes)
+        needed: set[str] = set()
+        for language_code, chain in chains.items():
+            if language_code in changed or changed.intersection(chain):
+                needed.add(language_code)
+                needed.update(chain)
+        needed.add(self.default_language_code)
+        return [name for name in current.files if self.__language_code(name) in needed]
+
+    def __is_output_valid(self, previous: Optional[L10nManifest], current: L10nManifest) -> bool:
+        """
+        Checks that the output of `previous` can be updated in place: same inputs except for the file contents \
+        and the output files were not modified since.
+        """
+        return (
+            previous is not None
+            and previous.is_compatible(current)
+            and bool(previous.outputs)
+            and all(
+                os.path.isfile(path) and file_state(path, state)['sha256'] == state['sha256']
+                for path, state in previous.outputs.items()
+            )
+        )
 
-            # Iterate over the translations of default language
-            for default_val in default_language_node.translate:
-                # Check if the property exists in the current language
-                current_property = next((prop for prop in current_node.translate if prop.value == default_val.value), None)
-                
-                # If the property does not exist in the current language, use the default language property
-                if not current_property:
-                    val = default_val
-                else:
-                    val = current_property
-
-                _property = template_property.replace(
-                    '{PropertyName}',
-                    val.value
-                ).replace(
-                    '{PropertyType}',
-                    type(val.text).__name__
-                ).replace(
-                    '{PropertyValue}',
-                    f'return f"{val.text}"'
+    def __write_changed_locales(
+        self,
+        templates: L10nTemplates,
+        current: L10nManifest,
+        previous: L10nManifest,
+        changed_codes: list[str]
+    ) -> None:
+        """
+        Rewrites only the locale modules (package output mode) or the locale sections (module output mode) \
+        of `changed_codes` and of the locales falling back to them, sets the outputs and sections of `current`.
+        """
+        merged: L10nMergeResult = self.merge(changed_codes)
+        changed: set[str] = set(changed_codes)
+        changed_codes = [
+            language_code for language_code, report in merged.report.items()
+            if language_code in changed or changed.intersection(report.chain)
+        ]
+
+        if self.configuration.output_mode == OUTPUT_MODE_PACKAGE:
+            current.outputs = dict(previous.outputs)
+            for language_code in changed_codes:
+                path: str = self.__write_locale_module(templates, merged, self.__registry.get(language_code))
+                current.outputs[path] = file_state(path)
+            current.sections = previous.sections
+            return
+
+        changed_sections: set[str] = {f"locale:{language_code}" for language_code in changed_codes}
+        with open(self.configuration.path_to_out, 'r', encoding='utf-8', newline='') as old_output:
+            with L10nOutputWriter(self.configuration.path_to_out, stats=self.stats) as out, self.stats.phase('render'):
+                for name, start, end in previous.sections:
+                    # Sections are contiguous, so the old output is copied by reading it sequentially
+                    old_section: str = old_output.read(end - start)
+                    out.begin_section(name)
+                    if name in changed_sections:
+                        self.__render_locale(templates, merged, self.__registry.get(name[len('locale:'):]), out.write)
+                    else:
+                        out.write(old_section)
+                    out.end_section()
+        current.sections = out.sections
+        current.outputs = {self.configuration.path_to_out: file_state(self.configuration.path_to_out)}
+
+    def generate(
+        self,
+        template_base_class: str = TEMPLATE_BASE_CLASS,
+        template_extend_class: str = TEMPLATE_EXTEND_CLASS,
+        template_property: str = TEMPLATE_PROPERTY
+    ):
+        self.__write_output(L10nTemplates(template_base_class, template_extend_class, template_property))
+
+    @property
+    def output_path(self) -> str:
+        """
+        `pathToOut` for the module output mode, the package directory (`pathToOut` without .py) for the package one, \
+        `pathToOut` with the .l10n extension for the binary output format.
+        """
+        path: str = self.configuration.path_to_out
+        if self.output_format == OUTPUT_FORMAT_BINARY:
+            return os.path.splitext(path)[0] + '.l10n'
+        if self.configuration.output_mode == OUTPUT_MODE_PACKAGE and path.endswith('.py'):
+            return path[:-len('.py')]
+        return path
+
+    @property
+    def output_files(self) -> list[str]:
+        """
+        Paths of the files emitted for the locales in `registry`.
+        """
+        if self.output_format == OUTPUT_FORMAT_BINARY:
+            return [self.output_path]
+        if self.configuration.output_mode != OUTPUT_MODE_PACKAGE:
+            return [self.configuration.path_to_out]
+        return [
+            os.path.join(self.output_path, '__init__.py'),
+            os.path.join(self.output_path, '_base.py'),
+        ] + [
+            self.__locale_module_path(language_code) for language_code in self.__registry.language_codes
+        ]
+
+    def __locale_module_path(self, language_code: str) -> str:
+        return os.path.join(self.output_path, f"_l10n_{language_code}.py")
+
+    def __write_output(self, templates: L10nTemplates) -> list[list]:
+        """
+        Writes the output of the configured format and mode, returns the sections of the module output mode.
+        """
+        if self.output_format == OUTPUT_FORMAT_BINARY:
+            from l10n.binary import write_binary_catalog
+
+            write_binary_catalog(self.output_path, self.merge(), self.stats)
+            return []
+
+        if self.configuration.output_mode != OUTPUT_MODE_PACKAGE:
+            with L10nOutputWriter(self.configuration.path_to_out, stats=self.stats) as out, self.stats.phase('render'):
+                self.render(
+                    templates.base_class.template,
+                    templates.extend_class.template,
+                    templates.property.template,
+                    out
                 )
+            return out.sections
 
-                # Checking if property has parameters
-                if val.params is None or val.params.variables is None:
-                    _property = _property.replace(
-                        '{PropertyArgs}',
-                        ''
-                    ).replace(
-                        '{PropertyIs}',
-                        '@property'
-                    )
+        merged: L10nMergeResult = self.merge()
+        os.makedirs(self.output_path, exist_ok=True)
+
+        with L10nOutputWriter(os.path.join(self.output_path, '_base.py'), stats=self.stats) as out, self.stats.phase('render'):
+            self.__render_header(templates, merged, out.write)
+
+        for current_node in self.__registry:
+            self.__write_locale_module(templates, merged, current_node)
+
+        # Modules of locales that no longer exist
+        expected: set[str] = set(self.output_files)
+        with os.scandir(self.output_path) as entries:
+            for entry in entries:
+                if entry.name.startswith('_l10n_') and entry.name.endswith('.py') and entry.path not in expected:
+                    os.remove(entry.path)
+
+        with L10nOutputWriter(os.path.join(self.output_path, '__init__.py'), stats=self.stats) as out, self.stats.phase('render'):
+            out.write(NOTE)
+            out.write("\n\nimport contextlib\nimport contextvars\nimport importlib\n\n")
+            out.write(f"from ._base import Base{self.configuration.class_name}\n\n")
+            if self.configuration.instrumentation:
+                out.write("from ._base import _L10N_FALLBACKS, _L10N_HITS, _L10N_KEYS, _L10N_UNKNOWN_LOCALES\n\n")
+            self.__render_main(templates, merged, out.write)
+        return []
+
+    def __write_locale_module(
+        self,
+        templates: L10nTemplates,
+        merged: L10nMergeResult,
+        current_node: L10nNode
+    ) -> str:
+        path: str = self.__locale_module_path(current_node.language_code)
+        with L10nOutputWriter(path, stats=self.stats) as out, self.stats.phase('render'):
+            out.write(NOTE)
+            if current_node.language_code == merged.default_language_code:
+                out.write(f"\n\nfrom ._base import Base{self.configuration.class_name}\n\n")
+            else:
+                parent: str = merged.report[current_node.language_code].chain[0]
+                out.write(f"\n\nfrom ._l10n_{parent} import {self.__locale_class_name(parent)}\n\n")
+            if self.configuration.instrumentation:
+                out.write("from ._base import _L10N_FALLBACKS, _L10N_HITS\n\n")
+            self.__render_locale(templates, merged, current_node, out.write)
+        return path
+
+    def render(
+        self,
+        template_base_class: str,
+        template_extend_class: str,
+        template_property: str,
+        out: L10nOutputWriter
+    ) -> None:
+        """
+        Renders the single module output into `out` as named sections: `header`, `locale:<code>` for each locale and `main`.
+        """
+        templates: L10nTemplates = L10nTemplates(template_base_class, template_extend_class, template_property)
+        merged: L10nMergeResult = self.merge()
+
+        out.begin_section("header")
+        self.__render_header(templates, merged, out.write)
+        out.end_section()
+
+        # Generation of implementation classes, every locale class goes after the classes it extends.
+        for current_node in self.__locales_in_fallback_order(merged):
+            out.begin_section(f"locale:{current_node.language_code}")
+            self.__render_locale(templates, merged, current_node, out.write)
+            out.end_section()
+
+        out.begin_section("main")
+        self.__render_main(templates, merged, out.write)
+        out.end_section()
+
+    def __property_slots(self, val: L10nObject) -> dict[str, str]:
+        # Checking if property has parameters
+        if val.params is None or val.params.variables is None:
+            return {
+                'PropertyArgs': '',
+                'PropertyIs': '@property',
+            }
+
+        property_args = ""
+        default_args = ""
+        for variable in val.params.variables:
+            # Adding variable and its type to property
+            if variable.default_value is None:
+                default_args += f", {variable.variable_name}: {variable.type}"
+            else:
+                property_args += f", {variable.variable_name}: {variable.type}"
+                # Checking if variable has a default value
+                if isinstance(variable.default_value, str):
+                    property_args += f' = "{variable.default_value}"'
                 else:
-                    property_args = ""
-                    default_args = ""
-                    for variable in val.params.variables:
-                        # Adding variable and its type to property
-                        if variable.default_value is None:
-                            default_args += f", {variable.variable_name}: {variable.type}"
-                        else:
-                            property_args += f", {variable.variable_name}: {variable.type}"
-                            # Checking if variable has a default value
-                            if isinstance(variable.default_value, str):
-                                property_args += f' = "{variable.default_value}"'
-                            else:
-                                property_args += f' = {variable.default_value}'
-                    # Concatenate default_args before property_args
-                    property_args = default_args + property_args
-                    _property = _property.replace('{PropertyArgs}', property_args).replace('{PropertyIs}', '')
-
-                properties_class += _property  # Appending property to properties string
-
-            extend_class += extended_class + properties_class + "\n"  # Appending extended class to the extend class string
+                    property_args += f' = {variable.default_value}'
+        # Concatenate default_args before property_args
+        return {
+            'PropertyArgs': default_args + property_args,
+            'PropertyIs': '',
+        }
 
-        # Generating base class using provided template and base class name
-        base_class = template_base_class.replace(
-            '{ClassNameBase}', BASE_CLASS
-        ).replace(
-            '{bodyBase}',
-            '...'
-        ).replace(
-                '{ClassConstructorArgs}',
-                ''
-            )
+    def __locales_in_fallback_order(self, merged: L10nMergeResult) -> list[L10nNode]:
+        """
+        Every locale after its fallback locales (the default locale first), as the locale classes extend them.
+        """
+        return sorted(self.__registry, key=lambda node: len(merged.report[node.language_code].chain))
 
-        properties_base_class: str = ""  # Initializing properties string for base class
-        for val in default_language_node.translate:
-            _property: str = template_property.replace(
-                '{PropertyName}',
-                val.value
-            ).replace(
-                '{PropertyValue}',
-                '{Comments}'
-            )
+    def __counters_name(self, language_code: str) -> str:
+        return re.sub(r'\W', '_', language_code.upper())
+
+    def __render_counters(
+        self,
+        merged: L10nMergeResult,
+        write: Callable[[str], Any]
+    ) -> None:
+        """
+        Lookup counters of the instrumented output, lists of the locales are indexed like `_L10N_KEYS`.
+        """
+        write("_L10N_KEYS = (\n")
+        for val in merged.table[merged.default_language_code]:
+            write(f'    "{val.value}",\n')
+        write(")\n\n")
+        for kind in ('HITS', 'FALLBACKS'):
+            write(f"_L10N_{kind} = {{\n")
+            for language_code in self.__registry.language_codes:
+                write(f'    "{language_code}": [0] * len(_L10N_KEYS),\n')
+            write("}\n\n")
+        write("_L10N_UNKNOWN_LOCALES = {}\n\n")
+
+    def __locale_class_name(self, language_code: str) -> str:
+        return f"{self.configuration.class_name}{language_code.capitalize()}"
+
+    def __render_locale(
+        self,
+        templates: L10nTemplates,
+        merged: L10nMergeResult,
+        current_node: L10nNode,
+        write: Callable[[str], Any]
+    ) -> None:
+        is_default: bool = current_node.language_code == merged.default_language_code
+        instrumentation: bool = self.configuration.instrumentation
+        report: L10nLocaleReport = merged.report[current_node.language_code]
+        fallbacks: set[str] = set(report.missing)
+        # Plural rules used by the section, fallback texts use the rule of the locale they come from
+        rules: dict[str, L10nPluralRule] = {}
+        for val in merged.table[current_node.language_code]:
+            if isinstance(val.text, dict) and (instrumentation or val.value not in fallbacks):
+                rule: L10nPluralRule = plural_rule(report.source(val.value))
+                rules[rule.name] = rule
+        for rule in rules.values():
+            self.__render_plural_rule(rule, write)
+
+        # The default locale class implements the base class, other locale classes extend the class
+        # of their nearest fallback locale and override only the keys they translate.
+        templates.extend_class.render_to(write, {
+            'ClassNameExtend': self.__locale_class_name(current_node.language_code),
+            'ExtendClass': f"Base{self.configuration.class_name}" if is_default else self.__locale_class_name(report.chain[0]),
+            'bodyExtend': '...',
+            'ClassConstructorArgs': '',
+            'Slots': '()',
+        })
+
+        for val in merged.table[current_node.language_code]:
+            if val.value not in fallbacks:
+                templates.property.render_to(write, self.__locale_property_slots(val, report))
+
+        write("\n")
+        if instrumentation:
+            self.__render_counted_locale(templates, merged, current_node, write)
+
+    def __locale_property_slots(self, val: L10nObject, report: L10nLocaleReport) -> dict[str, str]:
+        slots: dict[str, str] = self.__property_slots(val)
+        slots['PropertyName'] = val.value
+        slots['PropertyType'] = 'str'
+        if isinstance(val.text, dict):
+            slots['PropertyValue'] = self.__plural_body(val, plural_rule(report.source(val.value)))
+        else:
+            slots['PropertyValue'] = f'return f"{val.text}"'
+        return slots
 
+    def __render_counted_locale(
+        self,
+        templates: L10nTemplates,
+        merged: L10nMergeResult,
+        current_node: L10nNode,
+        write: Callable[[str], Any]
+    ) -> None:
+        """
+        Counting class of the instrumented output: extends the locale class and overrides every key, \
+        the inherited keys as well to count the fallbacks. `of()` returns it while the counters are enabled.
+        """
+        counters: str = self.__counters_name(current_node.language_code)
+        write(f'_L10N_HITS_{counters} = _L10N_HITS["{current_node.language_code}"]\n')
+        write(f'_L10N_FALLBACKS_{counters} = _L10N_FALLBACKS["{current_node.language_code}"]\n\n')
+
+        report: L10nLocaleReport = merged.report[current_node.language_code]
+        fallbacks: set[str] = set(report.missing)
+        class_name: str = self.__locale_class_name(current_node.language_code)
+        templates.extend_class.render_to(write, {
+            'ClassNameExtend': f"_Counted{class_name}",
+            'ExtendClass': class_name,
+            'bodyExtend': '...',
+            'ClassConstructorArgs': '',
+            'Slots': '()',
+        })
+        for index, val in enumerate(merged.table[current_node.language_code]):
+            slots: dict[str, str] = self.__locale_property_slots(val, report)
+            kind: str = 'FALLBACKS' if val.value in fallbacks else 'HITS'
+            slots['PropertyValue'] = f'_L10N_{kind}_{counters}[{index}] += 1\n        ' + slots['PropertyValue']
+            templates.property.render_to(write, slots)
+
+        write("\n")
+
+    def __render_plural_rule(self, rule: L10nPluralRule, write: Callable[[str], Any]) -> None:
+        """
+        Category index table of the small integers and the rule of the others, see `L10nPluralRule`.
+        """
+        write(f"# Plural categories: {', '.join(rule.categories)}\n")
+        write(f"_PLURAL_{rule.name} = bytes.fromhex(\n")
+        for start in range(0, len(rule.table), 64):
+            write(f'    "{rule.table[start:start + 64].hex()}"\n')
+        write(")\n\n")
+        write(f"def _plural_{rule.name.lower()}(n: int) -> int:\n    n = abs(n)\n    return {rule.expression}\n\n")
+
+    def __plural_body(self, val: L10nObject, rule: L10nPluralRule) -> str:
+        """
+        Selects the form by a table lookup for small integers, the forms equal to the `other` one share its return.
+        """
+        forms: list[str] = rule.forms(val.text)
+        other: str = forms[-1]
+        if all(form == other for form in forms):
+            return f'return f"{other}"'
+        variable: str = val.params.plural
+        lines: list[str] = [
+            f"_category = _PLURAL_{rule.name}[{variable}] if 0 <= {variable} < {PLURAL_TABLE_SIZE} else _plural_{rule.name.lower()}({variable})"
+        ]
+        for index, form in enumerate(forms[:-1]):
+            if form != other:
+                lines.append(f'if _category == {index}:\n            return f"{form}"')
+        lines.append(f'return f"{other}"')
+        return '\n        '.join(lines)
+
+    def __render_header(
+        self,
+        templates: L10nTemplates,
+        merged: L10nMergeResult,
+        write: Callable[[str], Any]
+    ) -> None:
+        write(NOTE)
+        write("\n\n")
+        if self.configuration.output_mode == OUTPUT_MODE_MODULE:
+            write("import contextlib\nimport contextvars\n")  # Used by the locale context helpers
+        write("import inspect")  # Importing inspect module
+        write("\n\n")
+        if self.configuration.instrumentation:
+            self.__render_counters(merged, write)
+
+        # Generating base class using provided template and base class name
+        templates.base_class.render_to(write, {
+            'ClassNameBase': f"Base{self.configuration.class_name}",
+            'bodyBase': '...',
+            'ClassConstructorArgs': '',
+            'Slots': '()',
+        })
+        write("\n")
+
+        for val in merged.table[merged.default_language_code]:
             property_description: str = ''
 
             if val.params is not None:
@@ -550,222 +2431,301 @@ class Generator:
 
                 if val.params.example is not None:
                     property_description += f'        {val.params.example}\\n\n'
-                else:
-                    property_description += ''
 
                 if val.params.variables is not None:
-                    __variables_description: str = ''
-                    __variables_description += "        Args:\n"
+                    property_description += "        Args:\n"
                     for vars in val.params.variables:
-                        __variables_description += f'           {vars.variable_name} ({vars.type}) Default value: {vars.default_value if vars.default_value is not None else ""}.\n'
-                    property_description += __variables_description
-            _property = _property.replace(
-                '{Comments}',
-                f'"""{property_description}        """\n        {{PropertyValue}}'
-            )
-            _property = _property.replace(
-                '{PropertyValue}',
+                        property_description += f'           {vars.variable_name} ({vars.type}) Default value: {vars.default_value if vars.default_value is not None else ""}.\n'
+
+            slots: dict[str, str] = self.__property_slots(val)
+            slots['PropertyName'] = val.value
+            slots['PropertyType'] = 'str'
+            slots['PropertyValue'] = (
+                f'"""{property_description}        """\n        '
                 'raise NotImplementedError(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name} method must be implemented in subclass")'
-            ).replace(
-                '{PropertyType}',
-                type(val.text).__name__
             )
+            templates.property.render_to(write, slots)
 
-            # Checking if property has parameters
-            if val.params is None or val.params.variables is None:
-                _property = _property.replace(
-                    '{PropertyArgs}',
-                    ''
-                ).replace(
-                    '{PropertyIs}',
-                    '@property'
-                )
-            else:
-                property_args = ""
-                default_args = ""
-                for variable in val.params.variables:
-                    # Adding variable and its type to property
-                    if variable.default_value is None:
-                        default_args += f", {variable.variable_name}: {variable.type}"
-                    else:
-                        property_args += f", {variable.variable_name}: {variable.type}"
-                        # Checking if variable has a default value
-                        if isinstance(variable.default_value, str):
-                            property_args += f' = "{variable.default_value}"'
-                        else:
-                            property_args += f' = {variable.default_value}'
-                # Concatenate default_args before property_args
-                property_args = default_args + property_args
-                _property = _property.replace('{PropertyArgs}', property_args).replace('{PropertyIs}', '')
-
-            properties_base_class += _property  # Appending property to properties string
-
-        # Generating main class using provided template and class name
-        main_class = template_base_class.replace(
-            '{ClassNameBase}',
-            self.configuration.class_name
-        ).replace(
-            '{bodyBase}',
-            '\n        self.__locale = locale'
-        ).replace(
-            '{ClassConstructorArgs}',
-            f', locale: str = "{default_language_code}"'
-        )
-
-        main_class += template_property.replace(
-            '{PropertyIs}',
-            '@property'
-        ).replace(
-            '{PropertyName}',
-            'default_locale'
-        ).replace(
-            '{PropertyArgs}',
-            ''
-        ).replace(
-            '{PropertyType}',
-            'str'
-        ).replace(
-            '{PropertyValue}',
-            f'return "{default_language_code}"'
-        )
-
-        main_class += template_property.replace(
-            '{PropertyIs}',
-            '@property'
-        ).replace(
-            '{PropertyName}',
-            'current_locale'
-        ).replace(
-            '{PropertyArgs}',
-            ''
-        ).replace(
-            '{PropertyType}',
-            'str'
-        ).replace(
-            '{PropertyValue}',
-            f'return self.__locale'
-        )
-
-        supported_locales_str_list: str = ''
-        supported_locales_str_list += '[\n'
-        for i in range(1, self.__l10n_node_operations.size + 1):
-            current = self.__l10n_node_operations.get_value_at_index(i)
-            if i == 1:
-                supported_locales_str_list += f'           "{current.language_code}",\n'
-            else:
-                supported_locales_str_list += f'           "{current.language_code}",\n'
-        supported_locales_str_list += '        ]'
-
-        main_class += template_property.replace(
-            '{PropertyIs}',
-            '@property'
-        ).replace(
-            '{PropertyName}',
-            'locales'
-        ).replace(
-            '{PropertyArgs}',
-            ''
-        ).replace(
-            '{PropertyType}',
-            'list[str]'
-        ).replace(
-            '{PropertyValue}',
-            f'return {supported_locales_str_list}'
-        )
+        write("\n")
 
-        main_class_method_of = template_property.replace(
-            '{PropertyIs}',
-            ''
-        ).replace(
-            '{PropertyName}',
-            'of'
-        ).replace(
-            '{PropertyArgs}',
-            ''
-        ).replace(
-            '{PropertyType}',
-            BASE_CLASS
-        ).replace(
-            '{PropertyValue}',
-            f''
-        )
-        
-        method_of_if_else_construct: str = ''
-        for i in range(1, self.__l10n_node_operations.size + 1):
-            current = self.__l10n_node_operations.get_value_at_index(i)
-            if i == 1:
-                method_of_if_else_construct += f"""    if self.__locale == "{current.language_code}":
-            return {self.configuration.class_name}{current.language_code.capitalize()}()
-                """
+    def __render_main(
+        self,
+        templates: L10nTemplates,
+        merged: L10nMergeResult,
+        write: Callable[[str], Any]
+    ) -> None:
+        default_language_code: str = merged.default_language_code
+        package: bool = self.configuration.output_mode == OUTPUT_MODE_PACKAGE
+
+        if not package:
+            # Locale -> class table and one cached instance per locale, used by `of()`
+            write("_LOCALE_CLASSES = {\n")
+            for current in self.__registry:
+                write(f'    "{current.language_code}": {self.__locale_class_name(current.language_code)},\n')
+            write("}\n\n")
+            if self.configuration.instrumentation:
+                # Plain and counting instance of every locale, `enable_counters` switches `of()` between them
+                write("_L10N_PLAIN_INSTANCES = {locale: cls() for locale, cls in _LOCALE_CLASSES.items()}\n\n")
+                write("_L10N_COUNTED_INSTANCES = {\n")
+                for current in self.__registry:
+                    write(f'    "{current.language_code}": _Counted{self.__locale_class_name(current.language_code)}(),\n')
+                write("}\n\n")
+                write("_L10N_COUNTING = True\n\n")
+                write("_LOCALE_INSTANCES = dict(_L10N_COUNTED_INSTANCES)\n\n")
             else:
-                method_of_if_else_construct += f"""\n        elif self.__locale == "{current.language_code}":
-            return {self.configuration.class_name}{current.language_code.capitalize()}()
-                """
-        
-        method_of_if_else_construct += """
+                write("_LOCALE_INSTANCES = {locale: cls() for locale, cls in _LOCALE_CLASSES.items()}\n\n")
         else:
-            raise ValueError(f"No {self.__locale} localization.")
-        """
+            # Locale modules are imported on first use by `of()` or by module attribute access (PEP 562)
+            write("_LOCALE_MODULES = {\n")
+            for current in self.__registry:
+                write(f'    "{current.language_code}": ("._l10n_{current.language_code}", "{self.__locale_class_name(current.language_code)}"),\n')
+            write("}\n\n")
+            write("_LOCALE_CLASS_NAMES = {class_name: locale for locale, (_, class_name) in _LOCALE_MODULES.items()}\n\n")
+            write("_LOCALE_INSTANCES = {}\n\n")
+            if self.configuration.instrumentation:
+                write("_L10N_PLAIN_INSTANCES = {}\n\n_L10N_COUNTED_INSTANCES = {}\n\n_L10N_COUNTING = True\n\n")
+                # Both classes of a locale are created with its module, `of()` returns the counting one while counting
+                write(f"""def _load_locale(locale: str) -> Base{self.configuration.class_name}:
+    try:
+        module_name, class_name = _LOCALE_MODULES[locale]
+    except KeyError:{self.__count_unknown('locale', 8)}
+        raise ValueError(f"No {{locale}} localization.") from None
+    module = importlib.import_module(module_name, __name__)
+    plain = _L10N_PLAIN_INSTANCES.setdefault(locale, getattr(module, class_name)())
+    counted = _L10N_COUNTED_INSTANCES.setdefault(locale, getattr(module, f"_Counted{{class_name}}")())
+    return _LOCALE_INSTANCES.setdefault(locale, counted if _L10N_COUNTING else plain)
+
+def __getattr__(name: str):
+    if name in _LOCALE_CLASS_NAMES:
+        _load_locale(_LOCALE_CLASS_NAMES[name])
+        return type(_L10N_PLAIN_INSTANCES[_LOCALE_CLASS_NAMES[name]])
+    raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+
+""")
+            else:
+                write(f"""def _load_locale(locale: str) -> Base{self.configuration.class_name}:
+    try:
+        module_name, class_name = _LOCALE_MODULES[locale]
+    except KeyError:{self.__count_unknown('locale', 8)}
+        raise ValueError(f"No {{locale}} localization.") from None
+    cls = getattr(importlib.import_module(module_name, __name__), class_name)
+    return _LOCALE_INSTANCES.setdefault(locale, cls())
 
-        main_class_method_of += method_of_if_else_construct
+def __getattr__(name: str):
+    if name in _LOCALE_CLASS_NAMES:
+        return type(_load_locale(_LOCALE_CLASS_NAMES[name]))
+    raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
 
-        main_class += main_class_method_of
+""")
 
-        imports = (
-            "import inspect"  # Importing inspect module
-        )
+        # Generating main class using provided template and class name
+        templates.base_class.render_to(write, {
+            'ClassNameBase': self.configuration.class_name,
+            'bodyBase': '\n        self.__locale = locale',
+            'ClassConstructorArgs': f', locale: str = "{default_language_code}"',
+            'Slots': '("__locale",)',
+        })
+
+        templates.property.render_to(write, {
+            'PropertyIs': '@property',
+            'PropertyName': 'default_locale',
+            'PropertyArgs': '',
+            'PropertyType': 'str',
+            'PropertyValue': f'return "{default_language_code}"',
+        })
+
+        templates.property.render_to(write, {
+            'PropertyIs': '@property',
+            'PropertyName': 'current_locale',
+            'PropertyArgs': '',
+            'PropertyType': 'str',
+            'PropertyValue': 'return self.__locale',
+        })
+
+        supported_locales_str_list: str = '[\n'
+        for language_code in self.__registry.language_codes:
+            supported_locales_str_list += f'           "{language_code}",\n'
+        supported_locales_str_list += '        ]'
 
-        note: str = "#NOTE THIS IS AN AUTO-GENERATED FILE, DO NOT EDIT IT."
-
-        # Combining all generated components to form the final result
-        result = (
-            note
-            + "\n\n"
-            + imports
-            + "\n\n"
-            + base_class
-            + "\n"
-            + properties_base_class
-            + "\n"
-            + extend_class
-            + main_class
-        )
+        templates.property.render_to(write, {
+            'PropertyIs': '@property',
+            'PropertyName': 'locales',
+            'PropertyArgs': '',
+            'PropertyType': 'list[str]',
+            'PropertyValue': f'return {supported_locales_str_list}',
+        })
+
+        templates.property.render_to(write, {
+            'PropertyIs': '',
+            'PropertyName': 'of',
+            'PropertyArgs': '',
+            'PropertyType': f"Base{self.configuration.class_name}",
+            'PropertyValue': """try:
+            return _LOCALE_INSTANCES[self.__locale]
+        except KeyError:
+            return _load_locale(self.__locale)""" if package else f"""try:
+            return _LOCALE_INSTANCES[self.__locale]
+        except KeyError:{self.__count_unknown('self.__locale', 12)}
+            raise ValueError(f"No {{self.__locale}} localization.") from None""",
+        })
+
+        self.__render_locale_context(merged, write)
+        if self.configuration.instrumentation:
+            self.__render_counters_api(write)
+
+    def __count_unknown(self, locale: str, indent: int) -> str:
+        """
+        Statement counting an unknown locale, empty without instrumentation.
+        """
+        if not self.configuration.instrumentation:
+            return ''
+        return f"\n{' ' * indent}_L10N_UNKNOWN_LOCALES[{locale}] = _L10N_UNKNOWN_LOCALES.get({locale}, 0) + 1"
+
+    def __render_counters_api(self, write: Callable[[str], Any]) -> None:
+        write("""
+def snapshot_counters() -> dict:
+    \"\"\"Copy of the lookup counters per locale and key: `hits` (fallbacks included), `fallbacks` - lookups of keys
+    inherited from a locale of the fallback chain (e.g. pt for pt_BR, or the default locale)
+    and `unknownLocales` - locales passed to `of()` or `set_locale()` without a localization.\"\"\"
+    def per_key(counters):
+        return {
+            locale: {key: count for key, count in zip(_L10N_KEYS, values) if count}
+            for locale, values in counters.items()
+        }
+    hits = {
+        locale: list(map(int.__add__, values, _L10N_FALLBACKS[locale]))
+        for locale, values in _L10N_HITS.items()
+    }
+    return {
+        "hits": per_key(hits),
+        "fallbacks": per_key(_L10N_FALLBACKS),
+        "unknownLocales": dict(_L10N_UNKNOWN_LOCALES),
+    }
 
-        # Writing the result to an output file
-        with open(self.configuration.path_to_out, 'w', encoding='utf-8') as file:
-            file.write(
-                result
-            )
+def reset_counters() -> None:
+    \"\"\"Sets all counters to zero.\"\"\"
+    for counters in (_L10N_HITS, _L10N_FALLBACKS):
+        for values in counters.values():
+            values[:] = [0] * len(values)
+    _L10N_UNKNOWN_LOCALES.clear()
+
+def enable_counters(enabled: bool = True) -> None:
+    \"\"\"Switches `of()` to the counting locale instances or, with False, back to the plain ones,
+    which cost as much as without instrumentation. Instances returned by `of()` before keep their behaviour.\"\"\"
+    global _L10N_COUNTING
+    _L10N_COUNTING = enabled
+    _LOCALE_INSTANCES.update(_L10N_COUNTED_INSTANCES if enabled else _L10N_PLAIN_INSTANCES)
+
+def counters_enabled() -> bool:
+    return _L10N_COUNTING
+""")
+
+    def __render_locale_context(
+        self,
+        merged: L10nMergeResult,
+        write: Callable[[str], Any]
+    ) -> None:
+        """
+        Module-level helpers binding the locale of the current asyncio task or thread in a ContextVar, \
+        `of()` returns the cached instance of the bound locale.
+        """
+        class_name: str = self.configuration.class_name
+        package: bool = self.configuration.output_mode == OUTPUT_MODE_PACKAGE
+        write(f"""
+
+_CURRENT_LOCALE = contextvars.ContextVar("{class_name}.locale", default="{merged.default_language_code}")
+
+def set_locale(locale: str) -> contextvars.Token:
+    \"\"\"Binds `locale` to the current context (asyncio task or thread), returns the token for `reset_locale`.\"\"\"
+    if locale not in {'_LOCALE_MODULES' if package else '_LOCALE_CLASSES'}:{self.__count_unknown('locale', 8)}
+        raise ValueError(f"No {{locale}} localization.")
+    return _CURRENT_LOCALE.set(locale)
+
+def reset_locale(token: contextvars.Token) -> None:
+    _CURRENT_LOCALE.reset(token)
+
+def get_locale() -> str:
+    return _CURRENT_LOCALE.get()
+
+@contextlib.contextmanager
+def use_locale(locale: str):
+    \"\"\"`with use_locale("ru"): of().helloWorld`, the previous locale is restored on exit.\"\"\"
+    token = set_locale(locale)
+    try:
+        yield of()
+    finally:
+        _CURRENT_LOCALE.reset(token)
+
+def of() -> Base{class_name}:
+    \"\"\"Translations of the locale bound to the current context, the default locale if none is bound.\"\"\"
+""")
+        if package:
+            write("""    locale = _CURRENT_LOCALE.get()
+    try:
+        return _LOCALE_INSTANCES[locale]
+    except KeyError:
+        return _load_locale(locale)
+""")
+        else:
+            write("    return _LOCALE_INSTANCES[_CURRENT_LOCALE.get()]\n")
 
 
-parser = argparse.ArgumentParser()
-parser.add_argument('--config', type=str, help="Path to configuration file")
-args = parser.parse_args()
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Command line entry point, returns the exit code.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--config', type=str, help="Path to configuration file")
+    parser.add_argument('--force', action='store_true', help="Regenerate the output even if the inputs did not change")
+    parser.add_argument('--jobs', type=int, help="Number of processes parsing translation files, 0 - one per CPU (default: 1, one per CPU with --check)")
+    parser.add_argument('--format', type=str, default=OUTPUT_FORMAT_PYTHON, choices=[OUTPUT_FORMAT_PYTHON, OUTPUT_FORMAT_BINARY], help="Output format")
+    parser.add_argument('--stats', action='store_true', help="Print the time and peak memory of every phase and the catalog statistics")
+    parser.add_argument('--watch', action='store_true', help="Keep running and update the output when a translation file changes")
+    parser.add_argument('--interval', type=float, default=1.0, help="Seconds between scans of the translations directory in the watch mode")
+    parser.add_argument('--check', action='store_true', help="Validate all translation files and report every error without writing anything")
+    parser.add_argument('--provenance', type=str, help="Write the fallback chain of every locale and the keys it takes from each fallback locale to this JSON file")
+    args = parser.parse_args(argv)
 
-if __name__ == "__main__":
     if not args.config:
         logging.warning("Error: no path to config file provided")
-        exit(0)
+        return 0
+
+    jobs: int = args.jobs if args.jobs is not None else (0 if args.check else 1)
+    obj = Generator(args.config, jobs=jobs, output_format=args.format, stats=L10nStats(trace_memory=args.stats))
+    if args.check:
+        report = obj.check()
+        print(report.format())
+        return 0 if report.ok else 1
+    if args.watch:
+        logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+        try:
+            watcher = obj.watch(interval=args.interval)
+        except L10nUnmarshalError:
+            return 1
+        logging.info(f"Watching {obj.configuration.path_to_translates} ({watcher.backend}), press Ctrl+C to stop")
+        try:
+            while watcher.is_running:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            watcher.stop()
+        return 0
+
+    try:
+        obj.build(force=args.force)
+        if args.provenance:
+            with open(args.provenance, 'w', encoding='utf-8') as file:
+                json.dump(obj.provenance(), file, ensure_ascii=False, indent=2)
+    except L10nUnmarshalError:
+        return 1
+    finally:
+        if args.stats:
+            print(obj.stats.format())
+    return 0
 
-    template_base_class = """class {ClassNameBase}:
-    def __init__(self{ClassConstructorArgs}):{bodyBase}
-    """
 
-    template_extend_class = """class {ClassNameExtend}({ExtendClass}):
-    def __init__(self{ClassConstructorArgs}):{bodyExtend}
-    """
-
-    template_property = """
-    {PropertyIs}
-    def {PropertyName}(self{PropertyArgs}) -> {PropertyType}:
-        {PropertyValue}
-    """
-
-    obj = Generator(args.config,)
-    obj.parse_config()
-    obj.unmarshal()
-    obj.generate(
-        template_base_class,
-        template_extend_class,
-        template_property
-    )
\ No newline at end of file
+if __name__ == "__main__":
+    exit(main())
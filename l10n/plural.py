@@ -0,0 +1,119 @@
+import functools
+import logging
+import re
+
+# CLDR plural categories in the order forms are stored and rendered
+PLURAL_CATEGORIES: tuple[str, ...] = ('zero', 'one', 'two', 'few', 'many', 'other')
+
+# Categories of 0 <= n < PLURAL_TABLE_SIZE are looked up in a table, larger and negative numbers use the rule
+PLURAL_TABLE_SIZE = 256
+
+# CLDR cardinal rules restricted to integers (no visible fraction digits): conditions over the absolute \
+# value `n` in the order they are checked, `other` is implied
+_OTHER: tuple[tuple[str, str], ...] = ()
+_ONE: tuple[tuple[str, str], ...] = (('one', 'n == 1'),)
+_ZERO_ONE: tuple[tuple[str, str], ...] = (('one', 'n <= 1'),)
+_MILLION: tuple[str, str] = ('many', 'n != 0 and n % 1000000 == 0')
+_SLAVIC: tuple[tuple[str, str], ...] = (
+    ('one', 'n % 10 == 1 and n % 100 != 11'),
+    ('few', '2 <= n % 10 <= 4 and not 12 <= n % 100 <= 14'),
+    ('many', 'True'),
+)
+
+_RULES: dict[str, tuple[tuple[str, str], ...]] = {
+    language: conditions
+    for languages, conditions in (
+        (
+            'bm bo dz id ig ii ja jv km ko lkt lo ms my nqo osa sah ses sg su th to vi wo yo yue zh',
+            _OTHER,
+        ),
+        (
+            'af an asa ast az bal bem bez bg brx ce cgg chr ckb da de dv ee el en eo et eu fi fo fur fy gl gsw '
+            'ha haw hu ia io jgo jmc ka kaj kcg kk kkj kl ks ksb ku ky lb lg lij mas mgo ml mn mr nb nd ne nl nn '
+            'nnh no nr ny nyn om or os pap ps rm rof rwk saq sc sd sdh seh sn so sq ss ssy st sv sw syr ta te '
+            'teo tig tk tn tr ts ug ur uz ve vo vun wae xh xog yi',
+            _ONE,
+        ),
+        ('ak am as bho bn doi fa ff gu guw hi hy kab kn ln mg nso pa si ti wa zu', _ZERO_ONE),
+        ('fr pt', _ZERO_ONE + (_MILLION,)),
+        ('ca es it pt-pt vec', _ONE + (_MILLION,)),
+        ('be ru uk', _SLAVIC),
+        ('bs hr sh sr', _SLAVIC[:2]),
+        ('pl', (('one', 'n == 1'),) + _SLAVIC[1:]),
+        ('cs sk', (('one', 'n == 1'), ('few', '2 <= n <= 4'))),
+        ('is mk', _SLAVIC[:1]),
+        ('lt', (('one', 'n % 10 == 1 and not 11 <= n % 100 <= 19'), ('few', 'n % 10 >= 2 and not 11 <= n % 100 <= 19'))),
+        ('lv prg', (('zero', 'n % 10 == 0 or 11 <= n % 100 <= 19'), ('one', 'n % 10 == 1 and n % 100 != 11'))),
+        ('mo ro', (('one', 'n == 1'), ('few', 'n == 0 or 1 <= n % 100 <= 19'))),
+        ('sl', (('one', 'n % 100 == 1'), ('two', 'n % 100 == 2'), ('few', '3 <= n % 100 <= 4'))),
+        ('he iw', (('one', 'n == 1'), ('two', 'n == 2'))),
+        ('ar ars', (
+            ('zero', 'n == 0'), ('one', 'n == 1'), ('two', 'n == 2'),
+            ('few', '3 <= n % 100 <= 10'), ('many', '11 <= n % 100 <= 99'),
+        )),
+        ('ga', (('one', 'n == 1'), ('two', 'n == 2'), ('few', '3 <= n <= 6'), ('many', '7 <= n <= 10'))),
+        ('cy', (('zero', 'n == 0'), ('one', 'n == 1'), ('two', 'n == 2'), ('few', 'n == 3'), ('many', 'n == 6'))),
+        ('gd', (('one', 'n == 1 or n == 11'), ('two', 'n == 2 or n == 12'), ('few', '3 <= n <= 10 or 13 <= n <= 19'))),
+        ('mt', (('one', 'n == 1'), ('two', 'n == 2'), ('few', 'n == 0 or 3 <= n % 100 <= 10'), ('many', '11 <= n % 100 <= 19'))),
+        ('fil tl', (('one', 'n <= 3 or n % 10 not in (4, 6, 9)'),)),
+    )
+    for language in languages.split()
+}
+
+class L10nPluralRule:
+    """
+    Cardinal plural rule of a language for integers.\n
+    `categories` - the categories the language uses in `PLURAL_CATEGORIES` order, `other` is always the last one.
+    `expression` - Python expression of the index in `categories` of the absolute value `n`, \
+    `table` - the indexes of 0 <= n < `PLURAL_TABLE_SIZE`, `select(n)` - the index of any integer.
+    """
+    __slots__ = ('language', 'categories', 'expression', 'table', 'select')
+
+    def __init__(self, language: str, conditions: tuple[tuple[str, str], ...]) -> None:
+        self.language: str = language
+        self.categories: tuple[str, ...] = tuple(category for category, _ in conditions) + ('other',)
+        expression: str = ''
+        for index, (_, condition) in enumerate(conditions):
+            if condition == 'True':
+                # Every integer is matched by now, `other` is only used by fractions
+                expression += str(index)
+                break
+            expression += f"{index} if {condition} else "
+        else:
+            expression += str(len(conditions))
+        self.expression: str = expression
+        # Compiled from the conditions above, never from translation files
+        namespace: dict = {}
+        exec(f"def select(n):\n    n = abs(n)\n    return {self.expression}\n", namespace)
+        self.select = namespace['select']
+        self.table: bytes = bytes(map(self.select, range(PLURAL_TABLE_SIZE)))
+
+    @property
+    def name(self) -> str:
+        """
+        Identifier of the rule in generated code, e.g. PT_PT.
+        """
+        return re.sub(r'\W', '_', self.language.upper())
+
+    def category(self, n: int) -> str:
+        return self.categories[self.table[n] if 0 <= n < PLURAL_TABLE_SIZE else self.select(n)]
+
+    def forms(self, forms: dict[str, str]) -> list[str]:
+        """
+        Forms of a plural message by the index in `categories`, the `other` form is used for the missing ones \
+        (forms of categories the language does not use are ignored).
+        """
+        return [forms.get(category, forms['other']) for category in self.categories]
+
+@functools.lru_cache(maxsize=None)
+def plural_rule(language_code: str) -> L10nPluralRule:
+    """
+    Plural rule of a language code (e.g. ru, pt-BR, pt_PT), the region is used only by the languages \
+    whose rules differ by region. Languages without a known rule use only the `other` form.
+    """
+    code: str = language_code.lower().replace('_', '-')
+    language: str = code if code in _RULES else code.split('-')[0]
+    if language not in _RULES:
+        logging.warning(f"No plural rule for {language_code}, plural messages use only the 'other' form")
+        return L10nPluralRule(language, _OTHER)
+    return L10nPluralRule(language, _RULES[language])
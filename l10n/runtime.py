@@ -0,0 +1,643 @@
+import logging
+import os
+import itertools
+import operator
+import string
+import threading
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
+
+from l10n.generator import (
+    Generator,
+    L10nLocaleRegistry,
+    L10nLocaleReport,
+    L10nMergeResult,
+    L10nNode,
+    L10nObject,
+    L10nParamsVariable,
+    L10nTranslations,
+    L10nUnmarshalError,
+    load_locales,
+    merge_locales,
+)
+from l10n.plural import PLURAL_TABLE_SIZE, L10nPluralRule, plural_rule
+from l10n.watch import TranslationsWatcher, is_translation_file
+
+# Declared variable type -> accepted Python types (int values are accepted for float variables)
+_TYPES: dict[str, tuple[type, ...]] = {
+    'str': (str,),
+    'int': (int,),
+    'float': (float, int),
+}
+
+_MISSING = object()
+
+class Message:
+    """
+    Translation compiled once into a literal/slot sequence.\n
+    `parts` contains literal strings and slot indexes into `variables`. Variables are ordered as in \
+    the generated method signature: variables without a default value first, then the ones with it.
+    Placeholders that are not declared variables are kept in the text as is.
+    A plural message compiles every form, the plural rule of `language_code` picks the form \
+    (`parts` are the parts of its `other` form).\n
+    `call` renders the message like the generated method, it is a plain function because \
+    calling it is noticeably cheaper than calling an object.
+    """
+    __slots__ = ('key', 'parts', 'variables', 'types', 'defaults', 'template', 'render_args', 'call', '__positions', '__render', '__arity', '__required')
+
+    def __init__(self, l10n_object: L10nObject, language_code: Optional[str] = None) -> None:
+        declared: list[L10nParamsVariable] = []
+        if l10n_object.params is not None and l10n_object.params.variables is not None:
+            declared = l10n_object.params.variables
+        ordered: list[L10nParamsVariable] = (
+            [variable for variable in declared if variable.default_value is None]
+            + [variable for variable in declared if variable.default_value is not None]
+        )
+
+        self.key: str = l10n_object.value
+        self.variables: tuple[str, ...] = tuple(variable.variable_name for variable in ordered)
+        self.types: tuple[tuple[type, ...], ...] = tuple(_TYPES[variable.type] for variable in ordered)
+        self.defaults: tuple[Any, ...] = tuple(
+            _MISSING if variable.default_value is None else variable.default_value for variable in ordered
+        )
+        self.__positions: dict[str, int] = {name: position for position, name in enumerate(self.variables)}
+        self.__arity: int = len(self.variables)
+        self.__required: int = len([variable for variable in ordered if variable.default_value is None])
+
+        text: Union[str, dict[str, str]] = l10n_object.text
+        if isinstance(text, dict):
+            # Plural message: every form is compiled, the category of the plural variable picks one
+            if language_code is None:
+                raise ValueError(f"{self.key}: the language code is required to compile a plural message")
+            rule: L10nPluralRule = plural_rule(language_code)
+            renders: list[Callable[[tuple], str]] = [self.__compile_text(form)[2] for form in rule.forms(text)]
+            self.parts, _, _ = self.__compile_text(text['other'])
+            self.template: Optional[str] = None
+            slot: int = self.__positions[l10n_object.params.plural]
+            table: bytes = rule.table
+            select: Callable[[int], int] = rule.select
+
+            def render(args: tuple) -> str:
+                n: int = args[slot]
+                return renders[table[n] if 0 <= n < PLURAL_TABLE_SIZE else select(n)](args)
+
+            self.__render = render
+        else:
+            self.parts, self.template, self.__render = self.__compile_text(text)
+        # Renders complete, already checked arguments in the order of `variables`
+        self.render_args = self.__render
+
+        self.call = self.__compile_call()
+
+    def __compile_text(self, text: str) -> tuple[tuple[Union[str, int], ...], Optional[str], Callable[[tuple], str]]:
+        """
+        Returns the parts, the %-template (None if the text needs str.format) and the render function of a text.
+        """
+        parts: list[Union[str, int]] = []
+        format_parts: list[str] = []
+        percent_parts: list[str] = []
+        slots: list[int] = []
+        plain_slots: bool = True
+        for literal, field_name, format_spec, conversion in string.Formatter().parse(text):
+            if literal:
+                parts.append(literal)
+                format_parts.append(literal.replace('{', '{{').replace('}', '}}'))
+                percent_parts.append(literal.replace('%', '%%'))
+            if field_name is None:
+                continue
+
+            suffix: str = (f"!{conversion}" if conversion else '') + (f":{format_spec}" if format_spec else '')
+            position: Optional[int] = self.__positions.get(field_name)
+            if position is None:
+                placeholder: str = f"{{{field_name}{suffix}}}"
+                parts.append(placeholder)
+                format_parts.append(placeholder.replace('{', '{{').replace('}', '}}'))
+                percent_parts.append(placeholder.replace('%', '%%'))
+            else:
+                parts.append(position)
+                format_parts.append(f"{{{position}{suffix}}}")
+                percent_parts.append('%s')
+                slots.append(position)
+                plain_slots = plain_slots and not suffix
+
+        # The slot sequence is rendered in C: by a %-template when every variable is used once, in order \
+        # and without a format spec (the common case, about twice as fast), by a str.format template otherwise.
+        if plain_slots and slots == list(range(self.__arity)):
+            template: str = ''.join(percent_parts)
+            return tuple(parts), template, template.__mod__
+        format_template: str = ''.join(format_parts)
+        return tuple(parts), None, lambda args: format_template.format(*args)
+
+    def __compile_call(self):
+        arity: int = self.__arity
+        types: tuple[tuple[type, ...], ...] = self.types
+        bind = self.__bind
+        check = self.__check
+        render = self.__render
+
+        def call(*args: Any, **kwargs: Any) -> str:
+            if kwargs or len(args) != arity:
+                args = bind(args, kwargs)
+            if not all(map(isinstance, args, types)):
+                check(args)
+            return render(args)
+
+        call.__name__ = self.key
+        return call
+
+    def __call__(self, *args: Any, **kwargs: Any) -> str:
+        return self.call(*args, **kwargs)
+
+    def bind_many(self, rows: Iterable[Union[tuple, list, dict]]) -> list[tuple]:
+        """
+        Binds and checks rows of arguments like `call` does: a row is a tuple or list of positional \
+        arguments or a dict of keyword arguments. Returns complete argument tuples.
+        When every row is already a complete tuple, the rows are returned as is and the types \
+        are checked column by column without a Python call per row.
+        """
+        rows = rows if type(rows) is list else list(rows)
+        if not _complete(rows, self.__arity):
+            rows = [
+                self.__bind((), row) if type(row) is dict else self.__bind(tuple(row), {})
+                for row in rows
+            ]
+        self.check_many(rows)
+        return rows
+
+    def check_many(self, rows: list[tuple]) -> None:
+        """
+        Checks the types of complete argument tuples column by column.
+        """
+        for position, expected in enumerate(self.types):
+            if not all(map(isinstance, map(operator.itemgetter(position), rows), itertools.repeat(expected))):
+                for row in rows:
+                    self.__check(row)
+
+    def render_many(self, rows: Iterable[Union[tuple, list, dict]]) -> list[str]:
+        """
+        Renders the message for every row of arguments, see `bind_many`.
+        """
+        return list(map(self.__render, self.bind_many(rows)))
+
+    def __check(self, args: tuple) -> None:
+        for value, expected, name in zip(args, self.types, self.variables):
+            if not isinstance(value, expected):
+                raise TypeError(f"{self.key}(): {name} must be {expected[0].__name__}, not {type(value).__name__}")
+
+    def __bind(self, args: tuple, kwargs: dict[str, Any]) -> tuple:
+        count: int = len(args)
+        if count > self.__arity:
+            raise TypeError(f"{self.key}() takes {self.__arity} arguments but {count} were given")
+        if not kwargs and count >= self.__required:
+            # Required variables go first, so the rest is filled with defaults
+            return args + self.defaults[count:]
+
+        values: list[Any] = list(args) + list(self.defaults[count:])
+        for name, value in kwargs.items():
+            position: Optional[int] = self.__positions.get(name)
+            if position is None:
+                raise TypeError(f"{self.key}() got an unexpected keyword argument '{name}'")
+            if position < count:
+                raise TypeError(f"{self.key}() got multiple values for argument '{name}'")
+            values[position] = value
+
+        for name, value in zip(self.variables, values):
+            if value is _MISSING:
+                raise TypeError(f"{self.key}() missing required argument: '{name}'")
+        return tuple(values)
+
+    def __repr__(self) -> str:
+        return f"Message({self.key}({', '.join(self.variables)}))"
+
+def render_many(
+    catalog: Any,
+    key: str,
+    locales: Union[str, Iterable[str]],
+    args_rows: Iterable[Union[tuple, list, dict]],
+    chunk_size: Optional[int] = None
+) -> Union[list[str], Iterator[str]]:
+    """
+    ### Renders `key` for many rows, e.g. one per recipient.
+    `locales` is the locale of every row (or a single locale for all of them), `args_rows` are tuples \
+    of positional arguments or dicts of keyword arguments. The message of every locale is resolved \
+    once, arguments are checked per variable column and the results are returned in the input order.\n
+    With `chunk_size` a generator is returned, it renders `chunk_size` rows at a time, so memory \
+    does not depend on the number of rows. Works with any catalog providing `message(locale, key)`.
+    ```python
+    render_many(catalog, "bye", ["en", "ru", "en"], [("Ann",), {"value": "Bob"}, ()])
+    ```
+    """
+    if chunk_size is None:
+        if isinstance(locales, str):
+            return catalog.message(locales, key).render_many(args_rows)
+        return _render_chunk(catalog, key, {}, list(locales), list(args_rows))
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    return _render_chunks(catalog, key, locales, args_rows, chunk_size)
+
+def _render_chunks(
+    catalog: Any,
+    key: str,
+    locales: Union[str, Iterable[str]],
+    args_rows: Iterable[Union[tuple, list, dict]],
+    chunk_size: int
+) -> Iterator[str]:
+    messages: dict[str, Message] = {}
+    locale_iterator: Iterator[str] = itertools.repeat(locales) if isinstance(locales, str) else iter(locales)
+    row_iterator: Iterator[Union[tuple, list, dict]] = iter(args_rows)
+    while True:
+        rows: list[Union[tuple, list, dict]] = list(itertools.islice(row_iterator, chunk_size))
+        if not rows:
+            return
+        yield from _render_chunk(catalog, key, messages, list(itertools.islice(locale_iterator, len(rows))), rows)
+
+def _render_chunk(
+    catalog: Any,
+    key: str,
+    messages: dict[str, Message],
+    locales: list[str],
+    args_rows: list[Union[tuple, list, dict]]
+) -> list[str]:
+    if len(locales) != len(args_rows):
+        raise ValueError(f"Got {len(locales)} locales for {len(args_rows)} rows")
+
+    for locale in set(locales):
+        if locale not in messages:
+            messages[locale] = catalog.message(locale, key)
+    group: list[Message] = [messages[locale] for locale in set(locales)]
+    if not group:
+        return []
+
+    # The common case: complete tuples and the same variables in every locale. The rows are checked \
+    # once and each row is rendered by the template of its locale, in C, without regrouping the rows.
+    if all(message.types == group[0].types for message in group) and _complete(args_rows, len(group[0].types)):
+        group[0].check_many(args_rows)
+        if all(message.template is not None for message in group):
+            templates: dict[str, str] = {locale: messages[locale].template for locale in set(locales)}
+            return list(map(operator.mod, map(templates.__getitem__, locales), args_rows))
+        renders: dict[str, Callable[[tuple], str]] = {locale: messages[locale].render_args for locale in set(locales)}
+        return list(map(_call, map(renders.__getitem__, locales), args_rows))
+
+    # Defaults differ between locales, so incomplete rows are bound by the message of their locale
+    groups: dict[str, list[int]] = {}
+    for index, locale in enumerate(locales):
+        indexes: Optional[list[int]] = groups.get(locale)
+        if indexes is None:
+            indexes = groups[locale] = []
+        indexes.append(index)
+
+    results: list[Optional[str]] = [None] * len(args_rows)
+    for locale, indexes in groups.items():
+        for index, text in zip(indexes, messages[locale].render_many(list(map(args_rows.__getitem__, indexes)))):
+            results[index] = text
+    return results
+
+def _complete(rows: list, arity: int) -> bool:
+    """
+    True if every row is a tuple with a value for every variable.
+    """
+    return not (set(map(type, rows)) - {tuple} or set(map(len, rows)) - {arity})
+
+# operator.call is available since Python 3.11
+_call: Callable[[Callable[[tuple], str], tuple], str] = getattr(operator, 'call', None) or (lambda function, args: function(args))
+
+class LocaleView:
+    """
+    Translations of one locale, the runtime counterpart of a generated locale class: keys without \
+    variables are attributes holding the string, keys with variables are functions rendering the `Message`.
+    """
+    __slots__ = ()
+
+    _l10n_language_code: str = ''
+
+    def __getitem__(self, key: str) -> Union[str, Message]:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __repr__(self) -> str:
+        return f"<LocaleView {self._l10n_language_code}>"
+
+class Catalog:
+    """
+    ### Immutable snapshot of the translations loaded at runtime, without code generation.
+    Reads the same l10n_languageCode.json files as `Generator`, missing keys are resolved along \
+    the fallback chains once when the catalog is built, so a lookup is a single attribute or dict access.
+    ```python
+    catalog = Catalog.from_config("app/configuration.yml")
+    localization = Localization(catalog, "ru")
+    localization.of().helloWorld
+    localization.of().bye(value="World")
+    ```
+    """
+    def __init__(
+        self,
+        registry: L10nLocaleRegistry,
+        default_locale: str,
+        previous: Optional['Catalog'] = None,
+        changed: Iterable[str] = (),
+        fallbacks: Optional[dict[str, str]] = None
+    ) -> None:
+        """
+        `fallbacks` - locale -> the locale its missing keys are taken from (the default locale by default).
+        `previous` and `changed` are used by `replace`: while the default locale is unchanged, \
+        the compiled views of the locales that are not in `changed` and do not fall back to them are taken from `previous`.
+        """
+        changed = set(changed)
+        reuse: bool = previous is not None and default_locale not in changed
+        self.registry: L10nLocaleRegistry = registry
+        self.default_locale: str = default_locale
+        self.fallbacks: dict[str, str] = dict(fallbacks or {})
+        self.locales: tuple[str, ...] = tuple(registry.language_codes)
+        self.messages: dict[str, dict[str, Message]] = {}
+        self.views: dict[str, LocaleView] = {}
+
+        # Only the changed locales and the locales falling back to them are merged again
+        self.__merged: L10nMergeResult = merge_locales(
+            registry,
+            default_locale,
+            previous.__merged if reuse else None,
+            changed if reuse else None,
+            self.fallbacks
+        )
+        self.report = self.__merged.report
+
+        # Fallback locales are compiled first: entries a locale takes from its fallback locale share \
+        # the text and the params of that locale, their messages are compiled once and shared between \
+        # the locales and the snapshots.
+        for language_code in sorted(self.locales, key=lambda code: len(self.report[code].chain)):
+            table: L10nTranslations = self.__merged.table[language_code]
+            if reuse and language_code in previous.views and previous.__merged.table.get(language_code) is table:
+                self.messages[language_code] = previous.messages[language_code]
+                self.views[language_code] = previous.views[language_code]
+            else:
+                self.__compile(language_code, table)
+        self.messages = {language_code: self.messages[language_code] for language_code in self.locales}
+        self.views = {language_code: self.views[language_code] for language_code in self.locales}
+
+    def replace(self, changed: L10nLocaleRegistry, removed: Iterable[str] = ()) -> 'Catalog':
+        """
+        Returns a new snapshot with the locales of `changed` added or replaced and the `removed` ones dropped.
+        Only the changed locales and the locales falling back to them are compiled again, \
+        unless the default locale is one of them.
+        """
+        removed = set(removed)
+        registry: L10nLocaleRegistry = L10nLocaleRegistry()
+        for language_code in sorted((set(self.locales) - removed) | set(changed.language_codes)):
+            node: Optional[L10nNode] = changed.get(language_code) or self.registry.get(language_code)
+            registry.add(language_code, node.translate)
+        return Catalog(registry, self.default_locale, self, removed | set(changed.language_codes), self.fallbacks)
+
+    def __compile(self, language_code: str, translate: L10nTranslations) -> None:
+        messages: dict[str, Message] = {}
+        attributes: dict[str, Any] = {'__slots__': (), '_l10n_language_code': language_code}
+        report: L10nLocaleReport = self.report[language_code]
+        parent: Optional[L10nTranslations] = self.__merged.table[report.chain[0]] if report.chain else None
+        parent_messages: dict[str, Message] = self.messages[report.chain[0]] if report.chain else {}
+        for position, l10n_object in enumerate(translate):
+            if (
+                parent is not None
+                and translate.texts[position] is parent.texts[position]
+                and translate.params[position] is parent.params[position]
+            ):
+                message: Message = parent_messages[translate.keys[position]]
+            else:
+                # Plural forms of a fallback text are selected by the rule of the locale it comes from
+                message = Message(l10n_object, report.source(translate.keys[position]))
+            messages[message.key] = message
+            attributes[message.key] = message.call() if not message.variables else staticmethod(message.call)
+
+        self.messages[language_code] = messages
+        view_class = type(f"LocaleView{language_code.capitalize()}", (LocaleView,), attributes)
+        self.views[language_code] = view_class()
+
+    @classmethod
+    def load(
+        cls,
+        path_to_translates: str,
+        default_locale: str = 'en',
+        jobs: int = 1,
+        fallbacks: Optional[dict[str, str]] = None
+    ) -> 'Catalog':
+        """
+        Loads all l10n_*.json files from `path_to_translates`.
+        Raises `L10nUnmarshalError` with the errors of all files, `L10nFallbackError` for an invalid fallback graph.
+        """
+        paths: list[str] = []
+        with os.scandir(path_to_translates) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.startswith('l10n_') and entry.name.endswith('.json'):
+                    paths.append(entry.path)
+        return cls(load_locales(paths, jobs), default_locale, fallbacks=fallbacks)
+
+    @classmethod
+    def from_config(cls, path_to_config_file: str, jobs: int = 1) -> 'Catalog':
+        """
+        Loads the translations described by a generator configuration file.
+        """
+        generator: Generator = Generator(path_to_config_file)
+        generator.parse_config()
+        return cls.load(
+            generator.configuration.path_to_translates,
+            generator.default_language_code,
+            jobs,
+            generator.configuration.fallbacks
+        )
+
+    def view(self, locale: str) -> LocaleView:
+        try:
+            return self.views[locale]
+        except KeyError:
+            raise ValueError(f"No {locale} localization.") from None
+
+    def message(self, locale: str, key: str) -> Message:
+        """
+        Returns the compiled message, raises KeyError for an unknown key.
+        """
+        try:
+            messages: dict[str, Message] = self.messages[locale]
+        except KeyError:
+            raise ValueError(f"No {locale} localization.") from None
+        return messages[key]
+
+    def render_many(
+        self,
+        key: str,
+        locales: Union[str, Iterable[str]],
+        args_rows: Iterable[Union[tuple, list, dict]],
+        chunk_size: Optional[int] = None
+    ) -> Union[list[str], Iterator[str]]:
+        """
+        See `l10n.runtime.render_many`.
+        """
+        return render_many(self, key, locales, args_rows, chunk_size)
+
+class ReloadingCatalog:
+    """
+    ### Catalog that follows the translation files of a long-running process.
+    Holds an immutable `Catalog` snapshot. When a file changes only that locale is parsed again, \
+    a new snapshot sharing the unchanged locales is built and swapped in with a single assignment, \
+    so readers never take a lock and never see a half-updated catalog. If a changed file has errors, \
+    they are logged and kept in `errors`, the previous snapshot stays in use.
+    ```python
+    catalog = ReloadingCatalog.from_config("app/configuration.yml")
+    localization = Localization(catalog, "ru")
+    localization.of().helloWorld
+    catalog.close()
+    ```
+    """
+    def __init__(
+        self,
+        path_to_translates: str,
+        default_locale: str = 'en',
+        watch: bool = True,
+        interval: float = 1.0,
+        use_inotify: Optional[bool] = None,
+        fallbacks: Optional[dict[str, str]] = None
+    ) -> None:
+        self.__path_to_translates: str = path_to_translates
+        # Serializes the reloads only, `of()` readers never take it
+        self.__lock: threading.Lock = threading.Lock()
+        # Created before loading, so files written while the catalog is loading are reloaded
+        self.__watcher: TranslationsWatcher = TranslationsWatcher(
+            path_to_translates,
+            self.reload,
+            interval = interval,
+            use_inotify = use_inotify
+        )
+        self.errors: list[str] = []
+        self.reloads: int = 0
+        self.__swap(Catalog.load(path_to_translates, default_locale, fallbacks=fallbacks))
+        if watch:
+            self.__watcher.start()
+
+    @classmethod
+    def from_config(cls, path_to_config_file: str, watch: bool = True, interval: float = 1.0) -> 'ReloadingCatalog':
+        generator: Generator = Generator(path_to_config_file)
+        generator.parse_config()
+        return cls(
+            generator.configuration.path_to_translates,
+            generator.default_language_code,
+            watch,
+            interval,
+            fallbacks = generator.configuration.fallbacks
+        )
+
+    @property
+    def snapshot(self) -> Catalog:
+        return self.__snapshot
+
+    @property
+    def watcher(self) -> TranslationsWatcher:
+        return self.__watcher
+
+    @property
+    def default_locale(self) -> str:
+        return self.__snapshot.default_locale
+
+    @property
+    def locales(self) -> tuple[str, ...]:
+        return self.__snapshot.locales
+
+    @property
+    def messages(self) -> dict[str, dict[str, Message]]:
+        return self.__snapshot.messages
+
+    @property
+    def report(self):
+        return self.__snapshot.report
+
+    def view(self, locale: str) -> LocaleView:
+        return self.__snapshot.view(locale)
+
+    def message(self, locale: str, key: str) -> Message:
+        return self.__snapshot.message(locale, key)
+
+    def render_many(
+        self,
+        key: str,
+        locales: Union[str, Iterable[str]],
+        args_rows: Iterable[Union[tuple, list, dict]],
+        chunk_size: Optional[int] = None
+    ) -> Union[list[str], Iterator[str]]:
+        """
+        Renders the whole batch with the current snapshot, see `l10n.runtime.render_many`.
+        """
+        return render_many(self.__snapshot, key, locales, args_rows, chunk_size)
+
+    def reload(self, file_names: Optional[Iterable[str]] = None) -> bool:
+        """
+        Parses the given l10n_*.json files of the translations directory again (all of them by default) \
+        and swaps in the new snapshot. Deleted files remove their locale.
+        Returns False and keeps the current snapshot if the files have errors.
+        """
+        with self.__lock:
+            if file_names is None:
+                file_names = [name for name in os.listdir(self.__path_to_translates) if is_translation_file(name)]
+                file_names += [f"l10n_{language_code}.json" for language_code in self.__snapshot.locales]
+
+            paths: list[str] = []
+            removed: list[str] = []
+            for file_name in set(file_names):
+                path: str = os.path.join(self.__path_to_translates, file_name)
+                if os.path.exists(path):
+                    paths.append(path)
+                else:
+                    removed.append(file_name.replace('l10n_', '').replace('.json', ''))
+
+            try:
+                snapshot: Catalog = self.__snapshot.replace(load_locales(paths), removed)
+            except L10nUnmarshalError as e:
+                self.errors = e.errors
+                return False
+            except ValueError as e:
+                logging.error(e)
+                self.errors = [str(e)]
+                return False
+
+            self.errors = []
+            self.reloads += 1
+            self.__swap(snapshot)
+            return True
+
+    def close(self) -> None:
+        self.__watcher.stop()
+
+    def __enter__(self) -> 'ReloadingCatalog':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __swap(self, snapshot: Catalog) -> None:
+        self.__snapshot = snapshot
+        # `Localization.of()` reads this attribute only, the dict always belongs to a single snapshot
+        self.views: dict[str, LocaleView] = snapshot.views
+
+class Localization:
+    """
+    Runtime counterpart of the generated main class: `Localization(catalog, "ru").of().helloWorld`.
+    """
+    __slots__ = ('__catalog', '__locale')
+
+    def __init__(self, catalog: Union[Catalog, ReloadingCatalog], locale: Optional[str] = None) -> None:
+        self.__catalog: Union[Catalog, ReloadingCatalog] = catalog
+        self.__locale: str = locale if locale is not None else catalog.default_locale
+
+    @property
+    def default_locale(self) -> str:
+        return self.__catalog.default_locale
+
+    @property
+    def current_locale(self) -> str:
+        return self.__locale
+
+    @property
+    def locales(self) -> list[str]:
+        return list(self.__catalog.locales)
+
+    def of(self) -> LocaleView:
+        try:
+            return self.__catalog.views[self.__locale]
+        except KeyError:
+            raise ValueError(f"No {self.__locale} localization.") from None
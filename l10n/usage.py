@@ -0,0 +1,242 @@
+import ast
+import fnmatch
+import functools
+import logging
+import os
+from typing import Iterable, Optional
+
+from l10n.generator import L10nLocaleReport, L10nMergeResult, L10nTranslations, map_batches
+
+_LOOKUP_FUNCTIONS: frozenset[str] = frozenset(('getattr', 'hasattr'))
+
+class L10nUsageError(ValueError):
+    """
+    Raised when a source file can not be scanned, pruning keys without its usages would be unsafe.
+    """
+    def __init__(self, errors: list[str]) -> None:
+        super().__init__("\n".join(errors))
+        self.errors: list[str] = errors
+
+class L10nSourceUsage:
+    """
+    Names looked up in one source file.\n
+    `names` - attribute names (`x.helloWorld`) and string constants passed to `getattr` / `hasattr`.\n
+    `dynamic` - "file:line" of `getattr` / `hasattr` calls on a localization (the result of `of()` \
+    or a value annotated with `Base<className>`) with a computed name, their keys must be kept explicitly.
+    """
+    def __init__(self, path: str) -> None:
+        self.path: str = path
+        self.names: set[str] = set()
+        self.dynamic: list[str] = []
+        self.errors: list[str] = []
+
+class _UsageScanner:
+    def __init__(self, usage: L10nSourceUsage, base_class_name: str) -> None:
+        self.usage: L10nSourceUsage = usage
+        self.base_class_name: str = base_class_name
+        # Names bound to a localization anywhere in the file, scopes are not tracked
+        self.receivers: set[str] = set()
+
+    def is_receiver(self, node: ast.expr) -> bool:
+        if isinstance(node, ast.Name):
+            return node.id in self.receivers
+        return isinstance(node, ast.Call) and self.is_call_of(node, 'of')
+
+    @staticmethod
+    def is_call_of(node: ast.Call, name: str) -> bool:
+        func: ast.expr = node.func
+        return (isinstance(func, ast.Name) and func.id == name) or (isinstance(func, ast.Attribute) and func.attr == name)
+
+    def is_base_annotation(self, node: Optional[ast.expr]) -> bool:
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            return node.value.split('.')[-1] == self.base_class_name
+        if isinstance(node, ast.Attribute):
+            return node.attr == self.base_class_name
+        return isinstance(node, ast.Name) and node.id == self.base_class_name
+
+    def bind(self, node: ast.AST) -> None:
+        if isinstance(node, ast.Assign):
+            if self.is_receiver(node.value):
+                self.receivers.update(target.id for target in node.targets if isinstance(target, ast.Name))
+        elif isinstance(node, ast.AnnAssign):
+            if isinstance(node.target, ast.Name) and (
+                self.is_base_annotation(node.annotation) or (node.value is not None and self.is_receiver(node.value))
+            ):
+                self.receivers.add(node.target.id)
+        elif isinstance(node, ast.arg):
+            if self.is_base_annotation(node.annotation):
+                self.receivers.add(node.arg)
+        elif isinstance(node, ast.withitem):
+            # with use_locale("ru") as of: ...
+            context: ast.expr = node.context_expr
+            if isinstance(node.optional_vars, ast.Name) and isinstance(context, ast.Call) and self.is_call_of(context, 'use_locale'):
+                self.receivers.add(node.optional_vars.id)
+
+    def lookup(self, node: ast.AST) -> None:
+        if isinstance(node, ast.Attribute):
+            self.usage.names.add(node.attr)
+        elif (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id in _LOOKUP_FUNCTIONS
+            and len(node.args) >= 2
+        ):
+            name: ast.expr = node.args[1]
+            if isinstance(name, ast.Constant) and isinstance(name.value, str):
+                self.usage.names.add(name.value)
+            elif self.is_receiver(node.args[0]):
+                self.usage.dynamic.append(f"{self.usage.path}:{node.lineno}")
+
+    def scan(self, tree: ast.AST) -> None:
+        nodes: list[ast.AST] = list(ast.walk(tree))
+        # Receivers are bound first, so lookups above the binding are recognized as well
+        for node in nodes:
+            self.bind(node)
+        for node in nodes:
+            self.lookup(node)
+
+def scan_source_file(path: str, base_class_name: str = '') -> L10nSourceUsage:
+    """
+    Parses one Python file with `ast` and collects the names it looks up, never raises.
+    Top-level function so it can be used on a process pool.
+    """
+    usage: L10nSourceUsage = L10nSourceUsage(path)
+    try:
+        with open(path, 'rb') as file:
+            tree: ast.Module = ast.parse(file.read(), filename=path)
+    except (OSError, SyntaxError, ValueError) as e:
+        usage.errors.append(f"{path}: {e}")
+        return usage
+
+    _UsageScanner(usage, base_class_name).scan(tree)
+    return usage
+
+def _scan_source_files(paths: list[str], base_class_name: str) -> list[L10nSourceUsage]:
+    return [scan_source_file(path, base_class_name) for path in paths]
+
+def find_source_files(paths: Iterable[str], exclude: Iterable[str] = ()) -> list[str]:
+    """
+    Python files in `paths` (files or directories, walked recursively), \
+    hidden directories, `__pycache__` and the `exclude` files or directories are skipped.
+    """
+    excluded: set[str] = {os.path.abspath(path) for path in exclude}
+    files: list[str] = []
+    for path in paths:
+        if os.path.isfile(path):
+            if os.path.abspath(path) not in excluded:
+                files.append(path)
+            continue
+        if not os.path.isdir(path):
+            raise ValueError(f"Source path {path} does not exist")
+        for root, directories, names in os.walk(path):
+            directories[:] = sorted(
+                directory for directory in directories
+                if not directory.startswith('.') and directory != '__pycache__'
+                and os.path.abspath(os.path.join(root, directory)) not in excluded
+            )
+            for name in sorted(names):
+                file_path: str = os.path.join(root, name)
+                if name.endswith('.py') and os.path.abspath(file_path) not in excluded:
+                    files.append(file_path)
+    return files
+
+class L10nUsage:
+    """
+    Names looked up in all scanned source files, see `L10nSourceUsage`.
+    """
+    def __init__(self, files: list[L10nSourceUsage]) -> None:
+        self.files: int = len(files)
+        self.names: set[str] = set()
+        self.dynamic: list[str] = []
+        for usage in files:
+            self.names |= usage.names
+            self.dynamic.extend(usage.dynamic)
+
+def scan_sources(
+    paths: Iterable[str],
+    base_class_name: str = '',
+    jobs: int = 1,
+    exclude: Iterable[str] = ()
+) -> L10nUsage:
+    """
+    Scans the Python files in `paths` for the names they look up.\n
+    With `jobs` > 1 (or < 1 for one job per CPU) the files are parsed on a process pool, see `map_batches`.
+    Raises `L10nUsageError` with the errors of all files.
+    """
+    files: list[str] = find_source_files(paths, exclude)
+    results: list[L10nSourceUsage] = map_batches(
+        functools.partial(_scan_source_files, base_class_name=base_class_name), files, jobs
+    )
+
+    errors: list[str] = [error for usage in results for error in usage.errors]
+    if errors:
+        for error in errors:
+            logging.error(error)
+        raise L10nUsageError(errors)
+    return L10nUsage(results)
+
+class L10nPruneReport:
+    """
+    Result of `prune_merged`.\n
+    `kept` - reachable keys in the key order of the default locale, `pruned` - keys that are not emitted, \
+    `kept_by_pattern` - kept keys matched only by `keepKeys`, `dynamic` - lookups with a computed name, see `L10nSourceUsage`.
+    """
+    def __init__(self) -> None:
+        self.files: int = 0
+        self.kept: list[str] = []
+        self.pruned: list[str] = []
+        self.kept_by_pattern: list[str] = []
+        self.dynamic: list[str] = []
+
+    def as_dict(self) -> dict:
+        return {
+            'files': self.files,
+            'kept': self.kept,
+            'pruned': self.pruned,
+            'keptByPattern': self.kept_by_pattern,
+            'dynamic': self.dynamic,
+        }
+
+def prune_merged(merged: L10nMergeResult, usage: L10nUsage, keep: Iterable[str] = ()) -> tuple[L10nMergeResult, L10nPruneReport]:
+    """
+    Removes the keys that are neither looked up in the sources nor matched by a `keep` name or `fnmatch` pattern \
+    from every locale of the merged table. Returns the pruned copy and the report.
+    """
+    patterns: list[str] = list(keep)
+    report: L10nPruneReport = L10nPruneReport()
+    report.files = usage.files
+    report.dynamic = usage.dynamic
+
+    reachable: set[str] = set()
+    for val in merged.table[merged.default_language_code]:
+        if val.value in usage.names:
+            reachable.add(val.value)
+            report.kept.append(val.value)
+        elif any(fnmatch.fnmatchcase(val.value, pattern) for pattern in patterns):
+            reachable.add(val.value)
+            report.kept.append(val.value)
+            report.kept_by_pattern.append(val.value)
+        else:
+            report.pruned.append(val.value)
+
+    default: L10nTranslations = merged.table[merged.default_language_code]
+    positions: list[int] = [position for position, key in enumerate(default.keys) if key in reachable]
+    keys: tuple[str, ...] = default.select(positions).keys
+    result: L10nMergeResult = L10nMergeResult(merged.default_language_code)
+    for language_code, table in merged.table.items():
+        result.table[language_code] = table.select(positions, keys)
+        previous: L10nLocaleReport = merged.report[language_code]
+        locale_report: L10nLocaleReport = L10nLocaleReport(language_code)
+        locale_report.missing = [key for key in previous.missing if key in reachable]
+        locale_report.extra = previous.extra
+        locale_report.chain = previous.chain
+        locale_report.sources = {key: previous.sources[key] for key in locale_report.missing}
+        result.report[language_code] = locale_report
+
+    if report.dynamic:
+        logging.warning(
+            f"{len(report.dynamic)} localization lookups use a computed name, add their keys to keepKeys: "
+            + ", ".join(report.dynamic[:10]) + (", ..." if len(report.dynamic) > 10 else "")
+        )
+    logging.info(f"{len(report.pruned)} of {len(report.kept) + len(report.pruned)} keys are not used and are not emitted")
+    return result, report
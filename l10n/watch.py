@@ -0,0 +1,196 @@
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from typing import Callable, Iterable, Optional
+
+# inotify(7) flags
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+_EVENT = struct.Struct('iIII')  # wd, mask, cookie, len
+
+def is_translation_file(name: str) -> bool:
+    return name.startswith('l10n_') and name.endswith('.json')
+
+def scan_translations(path: str) -> dict[str, tuple[int, int]]:
+    """
+    Returns the (mtime in ns, size) of every l10n_*.json file in `path` by file name.
+    """
+    states: dict[str, tuple[int, int]] = {}
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if not is_translation_file(entry.name):
+                continue
+            try:
+                stat: os.stat_result = entry.stat()
+            except FileNotFoundError:
+                continue
+            states[entry.name] = (stat.st_mtime_ns, stat.st_size)
+    return states
+
+class _Inotify:
+    """
+    Minimal inotify binding over libc, only used as a wake-up signal for `TranslationsWatcher`.
+    """
+    def __init__(self, path: str) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self.fd: int = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask: int = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+        if libc.inotify_add_watch(self.fd, os.fsencode(path), mask) < 0:
+            errno: int = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, f"inotify_add_watch failed for {path}")
+        # Written by `wake` so that stopping the watcher does not wait for the timeout
+        self.__wake_read, self.__wake_write = os.pipe()
+
+    def wait(self, timeout: float) -> set[str]:
+        """
+        Waits up to `timeout` seconds for events, returns the names of the touched translation files.
+        """
+        readable, _, _ = select.select([self.fd, self.__wake_read], [], [], timeout)
+        touched: set[str] = set()
+        if self.fd not in readable:
+            return touched
+        while True:
+            try:
+                data: bytes = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return touched
+            position: int = 0
+            while position < len(data):
+                _, _, _, length = _EVENT.unpack_from(data, position)
+                position += _EVENT.size
+                name: str = os.fsdecode(data[position:position + length].rstrip(b'\0'))
+                position += length
+                if is_translation_file(name):
+                    touched.add(name)
+
+    def wake(self) -> None:
+        os.write(self.__wake_write, b'\0')
+
+    def close(self) -> None:
+        os.close(self.fd)
+        os.close(self.__wake_read)
+        os.close(self.__wake_write)
+
+class TranslationsWatcher:
+    """
+    ### Watches the l10n_*.json files of a directory on a background thread.
+    `callback` receives the names of the files that were created, modified or deleted since the previous call.\n
+    On Linux inotify reports the written files as soon as they are closed, elsewhere (or with \
+    `use_inotify=False`) the directory is polled every `interval` seconds and the files are compared \
+    by mtime and size. Bursts of writes are coalesced for `settle` seconds.
+    ```python
+    watcher = TranslationsWatcher("app/translates", lambda names: print(names))
+    watcher.start()
+    ...
+    watcher.stop()
+    ```
+    """
+    def __init__(
+        self,
+        path: str,
+        callback: Callable[[set[str]], None],
+        interval: float = 1.0,
+        settle: float = 0.02,
+        use_inotify: Optional[bool] = None
+    ) -> None:
+        self.__path: str = path
+        self.__callback: Callable[[set[str]], None] = callback
+        self.__interval: float = interval
+        self.__settle: float = settle
+        self.__use_inotify: bool = use_inotify if use_inotify is not None else sys.platform.startswith('linux')
+        self.__inotify: Optional[_Inotify] = None
+        self.__states: dict[str, tuple[int, int]] = scan_translations(path)
+        self.__stopped: threading.Event = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    @property
+    def backend(self) -> str:
+        return 'inotify' if self.__inotify is not None else 'polling'
+
+    @property
+    def is_running(self) -> bool:
+        return self.__thread is not None and self.__thread.is_alive()
+
+    def poll(self, touched: Iterable[str] = ()) -> set[str]:
+        """
+        Compares the directory with the previous scan, returns the changed file names and the `touched` ones.
+        """
+        states: dict[str, tuple[int, int]] = scan_translations(self.__path)
+        changed: set[str] = set(touched) | {
+            name for name in states.keys() | self.__states.keys()
+            if states.get(name) != self.__states.get(name)
+        }
+        self.__states = states
+        return changed
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+        if self.__use_inotify:
+            try:
+                self.__inotify = _Inotify(self.__path)
+            except (OSError, AttributeError) as e:
+                logging.info(f"inotify is not available ({e}), polling {self.__path}")
+        self.__stopped.clear()
+        self.__thread = threading.Thread(target=self.__run, name=f"l10n-watch {self.__path}", daemon=True)
+        self.__thread.start()
+
+    def stop(self) -> None:
+        self.__stopped.set()
+        if self.__inotify is not None:
+            self.__inotify.wake()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+        if self.__inotify is not None:
+            self.__inotify.close()
+            self.__inotify = None
+
+    def __enter__(self) -> 'TranslationsWatcher':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    def __run(self) -> None:
+        while not self.__stopped.is_set():
+            touched: set[str] = set()
+            if self.__inotify is not None:
+                # The scan after the timeout is only a safety net, e.g. for files replaced on network mounts
+                touched = self.__inotify.wait(self.__interval)
+                if touched:
+                    time.sleep(self.__settle)
+                    touched |= self.__inotify.wait(0)
+                if self.__stopped.is_set():
+                    return
+            elif self.__stopped.wait(self.__interval):
+                return
+
+            changed: set[str] = self.poll(touched)
+            if not changed:
+                continue
+            try:
+                self.__callback(changed)
+            except Exception:
+                logging.exception(f"Reloading {', '.join(sorted(changed))} failed")
@@ -0,0 +1,44 @@
+import json
+import os
+import shutil
+import pytest
+
+def _write_locale(directory, language_code, data):
+    with open(os.path.join(directory, f'l10n_{language_code}.json'), 'w', encoding='utf-8') as file:
+        json.dump(data, file, ensure_ascii=False)
+
+@pytest.fixture
+def write_locale():
+    """
+    write_locale(directory, language_code, data) writes directory/l10n_<language_code>.json.
+    """
+    return _write_locale
+
+@pytest.fixture
+def write_config(tmp_path):
+    """
+    write_config(name, extra, locales, out) writes the generator configuration tmp_path/<name>.yml and returns its path.\n
+    `locales` - translations by language code written to tmp_path/translates, the files of tests/translates \
+    are copied there without them; `out` - pathToOut, tmp_path/<name>.py by default; \
+    `extra` - more configuration lines.
+    """
+    def write(name='configuration', extra='', locales=None, out=None):
+        translates = tmp_path / 'translates'
+        if locales is None:
+            if not translates.exists():
+                shutil.copytree('tests/translates', translates)
+        else:
+            translates.mkdir(exist_ok=True)
+            for language_code, data in locales.items():
+                _write_locale(translates, language_code, data)
+        path = tmp_path / f'{name}.yml'
+        path.write_text(
+            f"pathToTranslates: {translates}/\n"
+            f"pathToOut: {out or tmp_path / f'{name}.py'}\n"
+            "defaultTranslateFile: l10n_en.json\n"
+            "className: AppLocalization\n"
+            + extra
+        )
+        return str(path)
+
+    return write
@@ -0,0 +1,72 @@
+import json
+import os
+import pytest
+from benchmarks.synthetic import write_catalog
+from l10n.batch import build_all, find_configs, main
+from l10n.generator import Generator
+
+@pytest.fixture
+def services(tmp_path):
+    # Three services sharing one translations directory and one with its own
+    shared = write_catalog(str(tmp_path / 'shared'), keys=30, locales=4)
+    configs = []
+    for name in ('billing', 'orders', 'users'):
+        service = tmp_path / 'services' / name
+        service.mkdir(parents=True)
+        config = service / 'configuration.yml'
+        config.write_text(open(shared).read().replace(str(tmp_path / 'shared' / 'app_localization.py'), str(service / 'app_localization.py')))
+        configs.append(str(config))
+    own = tmp_path / 'services' / 'search'
+    configs.append(write_catalog(str(own), keys=10, locales=2))
+    return tmp_path, sorted(configs)
+
+def read(path):
+    with open(path, encoding='utf-8') as file:
+        return file.read()
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_build_all_parses_shared_directory_once(services, jobs):
+    tmp_path, configs = services
+    report = build_all(configs, jobs=jobs)
+    assert not report.failed
+    assert [result.config for result in report.results] == configs
+    assert len(report.written) == 4
+    assert report.parsed == 4 + 2 and report.cached == 2 * 4
+
+    for config in configs:
+        assert not Generator(config).build()
+    root = tmp_path / 'services'
+    assert read(root / 'billing' / 'app_localization.py') == read(root / 'orders' / 'app_localization.py')
+
+def test_errors_are_aggregated(services):
+    tmp_path, configs = services
+    with open(tmp_path / 'shared' / 'translates' / 'l10n_x001.json', 'w', encoding='utf-8') as file:
+        file.write('{')
+    broken = tmp_path / 'broken.yml'
+    broken.write_text("pathToTranslates: missing/\n")
+    report = build_all(configs + [str(broken)], jobs=2)
+
+    search = str(tmp_path / 'services' / 'search' / 'configuration.yml')
+    failed = {result.config: result.errors for result in report.failed}
+    assert set(failed) == set(configs) - {search} | {str(broken)}
+    assert all('l10n_x001.json' in errors[0] for config, errors in failed.items() if config != str(broken))
+    assert failed[str(broken)] == ["KeyError: 'pathToOut'"]
+    assert report.results[configs.index(search)].written
+
+def test_find_configs(services):
+    tmp_path, configs = services
+    pattern = str(tmp_path / 'services' / '**' / 'configuration.yml')
+    assert find_configs([pattern, configs[0]]) == configs
+    with pytest.raises(ValueError):
+        find_configs([str(tmp_path / 'nothing' / '*.yml')])
+
+def test_main(services, capsys):
+    tmp_path, configs = services
+    report_path = tmp_path / 'report.json'
+    assert main([str(tmp_path / 'services' / '*' / 'configuration.yml'), '--report', str(report_path)]) == 0
+    assert '4 configurations' in capsys.readouterr().out
+    report = json.loads(report_path.read_text())
+    assert report['configs'] == 4 and report['failed'] == 0 and report['cachedFiles'] == 8
+
+    os.remove(tmp_path / 'shared' / 'translates' / 'l10n_en.json')
+    assert main(configs) == 1
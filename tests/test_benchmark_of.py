@@ -0,0 +1,36 @@
+import tracemalloc
+from benchmarks.synthetic import language_codes, load_module, write_catalog
+from l10n.generator import Generator
+
+LOCALES = 40
+
+def test_of_returns_cached_instance_without_allocating(tmp_path):
+    config = write_catalog(str(tmp_path), keys=20, locales=LOCALES)
+    generator = Generator(config)
+    generator.parse_config()
+    generator.unmarshal()
+    generator.generate()
+    module = load_module(generator.configuration.path_to_out)
+
+    # The timing against the old if/elif chain is in `python -m benchmarks.bench_of`
+    last_locale = language_codes(LOCALES)[-1]
+    localization = module.AppLocalization(last_locale)
+    instance = localization.of()
+    assert type(instance).__name__ == f"AppLocalization{last_locale.capitalize()}"
+    assert localization.of() is instance
+    assert module.AppLocalization(last_locale).of() is instance
+
+    # Every result is kept, so an instance created by the generated module per call would still be traced after the loop
+    of = localization.of
+    results = [None] * 200
+    generated = [tracemalloc.Filter(True, generator.configuration.path_to_out)]
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot().filter_traces(generated)
+        for index in range(len(results)):
+            results[index] = of()
+        after = tracemalloc.take_snapshot().filter_traces(generated)
+    finally:
+        tracemalloc.stop()
+    assert [stat for stat in after.compare_to(before, 'lineno') if stat.count_diff > 0] == []
+    assert all(result is instance for result in results)
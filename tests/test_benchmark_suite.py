@@ -0,0 +1,16 @@
+import json
+from benchmarks.suite import compare, run_suite
+
+def test_suite_reports_every_metric():
+    report = run_suite(keys=30, locales=3, variable_ratio=0.5, missing_ratio=0.2, text_length=64, repeat=1, number=10)
+    report = json.loads(json.dumps(report))
+    results = report['results']
+    for phase in ('parseConfig', 'unmarshal', 'generate'):
+        assert results[phase]['seconds'] > 0
+        assert results[phase]['peakBytes'] > 0
+    assert results['generate']['outputBytes'] > 0
+    assert results['importCold']['seconds'] > 0 and results['importWarm']['seconds'] > 0
+    for lookup in ('lookupOf', 'lookupProperty', 'lookupParameterized', 'lookupParameterizedDefaults'):
+        assert results[lookup]['nanoseconds'] > 0
+    assert report['catalog']['bytes'] > 30 * 3 * 64 * 0.8
+    assert len(compare(report, report)) == 1 + sum(len(metrics) for metrics in results.values())
@@ -0,0 +1,119 @@
+import os
+import struct
+import pytest
+from benchmarks.synthetic import write_catalog
+from l10n.binary import BinaryCatalog, SharedCatalog, write_binary_catalog
+from l10n.generator import Generator, L10nUnmarshalError, OUTPUT_FORMAT_BINARY
+from l10n.runtime import Localization
+
+def variables(l10n_object):
+    if l10n_object.params is None or l10n_object.params.variables is None:
+        return None
+    return [(v.variable_name, v.type, v.default_value) for v in l10n_object.params.variables]
+
+@pytest.mark.parametrize('config', ['tests/configuration.yml', 'synthetic'])
+def test_round_trip(config, tmp_path):
+    if config == 'synthetic':
+        config = write_catalog(str(tmp_path), keys=300, locales=5, missing_ratio=0.2)
+    generator = Generator(config)
+    generator.parse_config()
+    generator.unmarshal()
+    merged = generator.merge()
+    write_binary_catalog(str(tmp_path / 'catalog.l10n'), merged)
+
+    with BinaryCatalog(str(tmp_path / 'catalog.l10n')) as catalog:
+        assert catalog.locales == tuple(generator.registry.language_codes)
+        assert catalog.default_locale == generator.default_language_code
+        assert catalog.key_count == len(merged.table[merged.default_language_code])
+        for language_code, table in merged.table.items():
+            for expected in table:
+                actual = catalog.l10n_object(language_code, expected.value)
+                assert actual.text == expected.text
+                assert variables(actual) == variables(expected)
+
+def test_lookup_through_localization(tmp_path):
+    generator = Generator('tests/configuration.yml', output_format=OUTPUT_FORMAT_BINARY)
+    generator.parse_config()
+    generator.configuration.path_to_out = str(tmp_path / 'app_localization.py')
+    generator.unmarshal()
+    generator.generate()
+
+    with BinaryCatalog(str(tmp_path / 'app_localization.l10n')) as catalog:
+        of = Localization(catalog, 'ru').of()
+        assert of.helloWorld == 'Привет мир'
+        assert of.bye() == 'Пока Мир'
+        assert of.numberOfUsers('x', 3) == 'Number of users: 3'
+        with pytest.raises(AttributeError):
+            of.unknownKey
+        with pytest.raises(ValueError):
+            Localization(catalog, 'xx').of()
+
+def test_unsupported_version_is_rejected(tmp_path):
+    path = tmp_path / 'catalog.l10n'
+    generator = Generator('tests/configuration.yml')
+    generator.parse_config()
+    generator.unmarshal()
+    write_binary_catalog(str(path), generator.merge())
+    data = bytearray(path.read_bytes())
+    struct.pack_into('<H', data, 4, 99)
+    path.write_bytes(bytes(data))
+    with pytest.raises(ValueError):
+        BinaryCatalog(str(path))
+
+def test_shared_catalog_is_used_by_forked_workers(tmp_path):
+    config = write_catalog(str(tmp_path), keys=100, locales=3, missing_ratio=0.2)
+    catalog = SharedCatalog.from_config(config)
+    expected = [Localization(catalog, locale).of()[catalog.key(0)] for locale in catalog.locales]
+
+    read, write = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        texts = [Localization(catalog, locale).of()[catalog.key(0)] for locale in catalog.locales]
+        os.write(write, '\0'.join(texts).encode('utf-8'))
+        os._exit(0)
+    os.close(write)
+    with os.fdopen(read, 'rb') as file:
+        assert file.read().decode('utf-8').split('\0') == expected
+    assert os.waitpid(pid, 0)[1] == 0
+
+    generator = Generator(config, output_format=OUTPUT_FORMAT_BINARY)
+    generator.build()
+    with BinaryCatalog(generator.output_path) as binary, SharedCatalog.from_file(generator.output_path) as shared:
+        assert shared.locales == binary.locales == catalog.locales
+        for position in range(binary.key_count):
+            key = binary.key(position)
+            assert shared.l10n_object('x001', key).text == binary.l10n_object('x001', key).text == catalog.l10n_object('x001', key).text
+    catalog.close()
+
+def test_shared_catalog_reports_errors_of_the_parsing_process(tmp_path):
+    config = write_catalog(str(tmp_path), keys=10, locales=2)
+    with open(tmp_path / 'translates' / 'l10n_x001.json', 'w', encoding='utf-8') as file:
+        file.write('{')
+    with pytest.raises(L10nUnmarshalError) as error:
+        SharedCatalog.from_config(config)
+    assert len(error.value.errors) == 1 and 'l10n_x001.json' in error.value.errors[0]
+
+def test_shared_catalog_selects_plural_forms(tmp_path, write_config):
+    items = {"#items": {"variables": {"n": {"type": "int"}}}}
+    config = write_config(extra="fallbacks:\n  pt_BR: pt\n", locales={
+        'en': {"items": {"one": "{n} item", "other": "{n} items"}, **items},
+        'pt': {"items": {"one": "{n} item", "many": "{n} de itens", "other": "{n} itens"}, **items},
+        'pt_BR': {},
+        'ru': {"items": {"one": "{n} предмет", "few": "{n} предмета", "many": "{n} предметов", "other": "{n} предмета"}, **items},
+    })
+    with SharedCatalog.from_config(config) as catalog:
+        read, write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            texts = [Localization(catalog, locale).of().items(n) for locale in ('ru', 'pt_BR', 'en') for n in (1, 3, 5, 1000000)]
+            os.write(write, '\0'.join(texts).encode('utf-8'))
+            os._exit(0)
+        os.close(write)
+        with os.fdopen(read, 'rb') as file:
+            assert file.read().decode('utf-8').split('\0') == [
+                '1 предмет', '3 предмета', '5 предметов', '1000000 предметов',
+                # Inherited from pt and selected with the pt rule
+                '1 item', '3 itens', '5 itens', '1000000 de itens',
+                '1 item', '3 items', '5 items', '1000000 items',
+            ]
+        assert os.waitpid(pid, 0)[1] == 0
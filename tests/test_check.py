@@ -0,0 +1,117 @@
+import pytest
+from l10n.check import check_file, check_files
+from l10n.generator import Generator, main
+
+EN = {
+    "hello": "Hello {name}",
+    "#hello": {"variables": {"name": {"type": "string"}}},
+    "bye": "Bye {value}",
+    "#bye": {"variables": {"value": {"type": "string", "defaultValue": "World"}, "count": {"type": "int"}}},
+    "users": {"one": "{n} user", "other": "{n} users"},
+    "#users": {"variables": {"n": {"type": "int"}}},
+    "plain": "{{not a placeholder}}",
+}
+RU = {
+    "hello": "Привет {name} {surname}",
+    "#hello": {"variables": {"name": {"type": "string"}}},
+    "bye": "Пока {value}",
+    "users": {"one": "{n} пользователь", "other": "{0} пользователей"},
+    "#users": {"variables": {"n": {"type": "int"}}},
+    "extra": "Лишний",
+}
+DE = {
+    "hello": "Hallo {name",
+    "#hello": {"variables": {"name": {"type": "string"}}},
+    "bye": "Tschüss {value}",
+    "#bye": {"variables": {"value": {"type": "int", "defaultValue": "x"}, "count": {"type": "int"}}},
+    "plain": 5,
+}
+
+def test_check_file_reports_placeholders(tmp_path, write_config):
+    write_config(locales={'en': EN, 'ru': RU})
+    translates = tmp_path / 'translates'
+    assert not check_file(str(translates / 'l10n_en.json')).errors
+    result = check_file(str(translates / 'l10n_ru.json'))
+    assert result.errors == [
+        "l10n_ru.json: hello: placeholder {surname} is not a declared variable, declare it in #hello",
+        "l10n_ru.json: bye: placeholder {value} is not a declared variable, declare it in #bye",
+        "l10n_ru.json: users: placeholder {0} is not a variable name",
+    ]
+    assert result.signatures['users'] == (('n', 'int', False),)
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_check_files_aggregates_every_error(tmp_path, write_config, jobs):
+    write_config(locales={'en': EN, 'ru': RU, 'de': DE})
+    translates = tmp_path / 'translates'
+    report = check_files([str(path) for path in translates.iterdir()], 'en', jobs=jobs)
+    assert not report.ok and report.files == 3
+    # Errors of every file, in file order: parse errors first, then the checks of the keys
+    assert [error.split(':')[0] for error in report.errors] == ['l10n_de.json'] * 4 + ['l10n_ru.json'] * 4
+    assert "l10n_de.json: bye.value: Default type does not match" in report.errors[0]
+    assert report.errors[1:4] == [
+        "l10n_de.json: hello: expected '}' before end of string",
+        # The invalid variable is not declared
+        "l10n_de.json: bye: placeholder {value} is not a declared variable, declare it in #bye",
+        "l10n_de.json: plain: the translation must be a string or an object of plural forms",
+    ]
+    assert report.errors[-1] == "l10n_ru.json: bye: variables () differ from (count: int, value: str = ...) in l10n_en.json"
+    assert "l10n_en.json: bye.count: the variable is not used in the text" in report.warnings
+    assert "l10n_ru.json: extra: the key is not in l10n_en.json, it is not generated" in report.warnings
+    assert report.as_dict()['errors'] == report.errors
+
+def test_locales_must_use_default_schema(tmp_path, write_config):
+    ru = {
+        "hello": "Привет {name}", "#hello": {"variables": {"name": {"type": "int"}}},
+        "bye": "Пока {value}", "#bye": {"variables": {"value": {"type": "string"}, "count": {"type": "int"}}},
+    }
+    write_config(locales={'en': EN, 'ru': ru})
+    translates = tmp_path / 'translates'
+    report = check_files([str(path) for path in translates.iterdir()], 'en')
+    assert report.errors == [
+        "l10n_ru.json: hello: variables (name: int) differ from (name: str) in l10n_en.json",
+        "l10n_ru.json: bye: variables (value: str, count: int) differ from (count: int, value: str = ...) in l10n_en.json",
+    ]
+
+def test_fallbacks_and_default_file(tmp_path, write_config):
+    write_config(locales={'en': EN, 'pt': {}})
+    translates = tmp_path / 'translates'
+    paths = [str(path) for path in translates.iterdir()]
+    assert check_files(paths, 'en', {'pt': 'pt'}).errors == ["fallbacks: Fallback cycle: pt -> pt"]
+    assert check_files(paths, 'fr').errors == ["l10n_fr.json: the default translation file was not found"]
+
+def test_check_option_writes_nothing(tmp_path, write_config, capsys):
+    config = write_config(locales={'en': EN, 'ru': RU}, out=tmp_path / 'app_localization.py')
+    translates = tmp_path / 'translates'
+    assert main([f"--config={config}", "--check"]) == 1
+    out = capsys.readouterr().out
+    assert "error: l10n_ru.json: hello: placeholder {surname}" in out and "2 files, 8 keys" in out
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['configuration.yml', 'translates']
+
+    (translates / 'l10n_ru.json').unlink()
+    assert Generator(config).check().ok
+
+MALFORMED = {
+    "a": "A {x}",
+    "#a": {"variables": ["x"]},
+    "b": "B",
+    "#b": 5,
+    "c": "C {x}",
+    "#c": {"variables": {"x": "string"}},
+    "users": {"one": "{n} user", "other": "{n} users"},
+    "#users": [],
+}
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_malformed_metadata_is_reported(tmp_path, write_config, capsys, jobs):
+    config = write_config(locales={'en': EN, 'ru': MALFORMED})
+    translates = tmp_path / 'translates'
+    report = check_files([str(path) for path in translates.iterdir()], 'en', jobs=jobs)
+    assert [error for error in report.errors if ' placeholder ' not in error and ' differ ' not in error] == [
+        "l10n_ru.json: a: variables must be an object of variable names",
+        "l10n_ru.json: b: the metadata #b must be an object",
+        "l10n_ru.json: c.x: the variable must be an object with its type",
+        "l10n_ru.json: users: the metadata #users must be an object",
+        "l10n_ru.json: users: plural forms need an int variable selecting the form, declare it in #users and name it in \"plural\" if there are several",
+    ]
+    assert main([f"--config={config}", "--check", f"--jobs={jobs}"]) == 1
+    assert "error: l10n_ru.json: b: the metadata #b must be an object" in capsys.readouterr().out
@@ -0,0 +1,137 @@
+import importlib
+import json
+import sys
+import pytest
+from l10n.generator import Generator, L10nFallbackError, L10nLocaleRegistry, merge_locales, parse_translations, resolve_fallbacks
+from l10n.runtime import Catalog, Localization, ReloadingCatalog
+
+LOCALES = {
+    'en': {"hello": "Hello", "bye": "Bye", "color": "color", "truck": "truck",
+           "items": {"one": "{n} item", "other": "{n} items"}, "#items": {"variables": {"n": {"type": "int"}}}},
+    'pt': {"hello": "Olá", "bye": "Tchau", "color": "cor",
+           "items": {"one": "{n} item", "many": "{n} de itens", "other": "{n} itens"}, "#items": {"variables": {"n": {"type": "int"}}}},
+    'pt_BR': {"hello": "Oi"},
+    'ru': {"hello": "Привет"},
+}
+FALLBACKS = "fallbacks:\n  pt_BR: pt\n"
+
+def registry(locales):
+    result = L10nLocaleRegistry()
+    for language_code in sorted(locales):
+        result.add(language_code, parse_translations(locales[language_code], []))
+    return result
+
+@pytest.fixture
+def fallback_config(write_config):
+    return lambda name, extra=FALLBACKS: write_config(name, extra, LOCALES)
+
+def test_resolve_fallbacks():
+    chains = resolve_fallbacks(['en', 'pt', 'pt_BR', 'zh_Hant', 'zh_Hant_HK'], 'en', {'pt_BR': 'pt', 'zh_Hant_HK': 'zh_Hant', 'de': 'en'})
+    assert chains == {'en': [], 'pt': ['en'], 'pt_BR': ['pt', 'en'], 'zh_Hant': ['en'], 'zh_Hant_HK': ['zh_Hant', 'en']}
+
+@pytest.mark.parametrize('fallbacks, error', [
+    ({'pt': 'pt_BR', 'pt_BR': 'pt'}, 'Fallback cycle: pt'),
+    ({'pt_BR': 'pt_BR'}, 'Fallback cycle: pt_BR -> pt_BR'),
+    ({'pt_BR': 'es'}, 'Fallback locale es of pt_BR has no translation file'),
+    ({'en': 'pt'}, 'The default locale en can not fall back to pt'),
+])
+def test_invalid_fallbacks(fallbacks, error):
+    with pytest.raises(L10nFallbackError, match=error):
+        resolve_fallbacks(['en', 'pt', 'pt_BR'], 'en', fallbacks)
+
+def test_merge_follows_chain_and_reports_provenance():
+    merged = merge_locales(registry(LOCALES), 'en', fallbacks={'pt_BR': 'pt'})
+    pt_br = {val.value: val.text for val in merged.table['pt_BR']}
+    assert pt_br['hello'] == 'Oi' and pt_br['bye'] == 'Tchau' and pt_br['truck'] == 'truck'
+    report = merged.report['pt_BR']
+    assert report.chain == ['pt', 'en'] and report.source('hello') == 'pt_BR'
+    assert report.as_dict() == {
+        'chain': ['pt', 'en'],
+        'fallbacks': {'pt': ['bye', 'color', 'items'], 'en': ['truck']},
+        'extra': [],
+    }
+    # Inherited entries share the columns of the fallback locale
+    assert merged.table['pt_BR'].texts[1] is merged.table['pt'].texts[1]
+    assert merged.report['ru'].as_dict()['fallbacks'] == {'en': ['bye', 'color', 'truck', 'items']}
+    assert list(merged.table) == ['en', 'pt', 'pt_BR', 'ru']
+
+@pytest.fixture(params=['module', 'package'])
+def localization(request, tmp_path, monkeypatch, fallback_config):
+    name = f'fallbacks_{request.param}'
+    extra = FALLBACKS + ("outputMode: package\n" if request.param == 'package' else "")
+    Generator(fallback_config(name, extra)).build()
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield importlib.import_module(name)
+    for module in [module for module in sys.modules if module.startswith(name)]:
+        del sys.modules[module]
+
+def test_generated_locales_are_complete(localization):
+    pt_br = localization.AppLocalization('pt_BR').of()
+    assert (pt_br.hello, pt_br.bye, pt_br.truck) == ('Oi', 'Tchau', 'truck')
+    # The pt form is selected with the pt rule
+    assert pt_br.items(1000000) == '1000000 de itens'
+    pt = localization.AppLocalization('pt').of()
+    assert isinstance(pt_br, type(pt)) and 'bye' not in type(pt_br).__dict__
+
+def test_provenance_option(tmp_path, fallback_config):
+    from l10n.generator import main
+
+    path = tmp_path / 'provenance.json'
+    assert main([f"--config={fallback_config('cli')}", f"--provenance={path}"]) == 0
+    provenance = json.loads(path.read_text(encoding='utf-8'))
+    assert provenance['pt_BR']['fallbacks']['en'] == ['truck']
+    assert provenance['en'] == {'chain': [], 'fallbacks': {}, 'extra': []}
+
+def test_provenance_reuses_the_build(fallback_config, monkeypatch):
+    import l10n.generator
+
+    config = fallback_config('reuse')
+    expected = Generator(config).provenance()
+    generator = Generator(config)
+    generator.build()
+    # The translation files are not parsed again
+    monkeypatch.setattr(l10n.generator, 'load_locales', None)
+    assert generator.provenance() == expected
+    assert expected['pt_BR']['chain'] == ['pt', 'en']
+
+def test_changed_fallback_locale_updates_dependent_locales(tmp_path, fallback_config):
+    config = fallback_config('incremental')
+    Generator(config).build()
+    data = dict(LOCALES['pt'], bye='Adeus')
+    (tmp_path / 'translates' / 'l10n_pt.json').write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+
+    generator = Generator(config)
+    assert generator.build()
+    assert sorted(generator.registry.language_codes) == ['en', 'pt', 'pt_BR']
+    incremental = (tmp_path / 'incremental.py').read_text(encoding='utf-8')
+    Generator(config).build(force=True)
+    assert (tmp_path / 'incremental.py').read_text(encoding='utf-8') == incremental
+
+def test_invalid_graph_is_rejected(fallback_config):
+    with pytest.raises(L10nFallbackError, match='cycle'):
+        Generator(fallback_config('cycle', "fallbacks:\n  pt_BR: pt\n  pt: pt_BR\n")).build()
+    with pytest.raises(ValueError, match='fallbacks'):
+        Generator(fallback_config('invalid', "fallbacks: [pt]\n")).build()
+
+def test_runtime_catalog_follows_chain(fallback_config):
+    catalog = Catalog.from_config(fallback_config('runtime'))
+    pt_br = Localization(catalog, 'pt_BR').of()
+    assert (pt_br.hello, pt_br.bye, pt_br.truck) == ('Oi', 'Tchau', 'truck')
+    assert pt_br.items(1000000) == '1000000 de itens'
+    assert catalog.message('pt_BR', 'bye') is catalog.message('pt', 'bye')
+    assert catalog.report['pt_BR'].source('color') == 'pt'
+
+def test_reload_of_fallback_locale_recompiles_dependent_locales(tmp_path, fallback_config):
+    config = fallback_config('reload')
+    catalog = ReloadingCatalog.from_config(config, watch=False)
+    before = catalog.snapshot
+    (tmp_path / 'translates' / 'l10n_pt.json').write_text(json.dumps(dict(LOCALES['pt'], bye='Adeus')), encoding='utf-8')
+
+    assert catalog.reload(['l10n_pt.json'])
+    assert Localization(catalog, 'pt_BR').of().bye == 'Adeus'
+    assert catalog.views['ru'] is before.views['ru']
+    assert catalog.views['pt_BR'] is not before.views['pt_BR']
+    # A locale other locales fall back to can not be removed
+    (tmp_path / 'translates' / 'l10n_pt.json').unlink()
+    assert not catalog.reload(['l10n_pt.json'])
+    assert 'no translation file' in catalog.errors[0]
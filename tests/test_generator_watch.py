@@ -0,0 +1,77 @@
+import os
+import subprocess
+import sys
+import time
+import pytest
+from benchmarks.synthetic import write_catalog
+from l10n.generator import Generator, L10nUnmarshalError, main
+
+@pytest.fixture(params=['module', 'package'])
+def config(request, tmp_path):
+    path = write_catalog(str(tmp_path), keys=20, locales=3, missing_ratio=0.2, variable_ratio=0.5)
+    if request.param == 'package':
+        with open(path, 'a', encoding='utf-8') as file:
+            file.write('outputMode: package\n')
+    return path
+
+def read_output(generator):
+    path = generator.output_path
+    if os.path.isdir(path):
+        return {name: open(os.path.join(path, name), encoding='utf-8').read() for name in sorted(os.listdir(path)) if name.endswith('.py')}
+    return open(path, encoding='utf-8').read()
+
+def test_update_matches_full_build(config, write_locale):
+    generator = Generator(config)
+    generator.build()
+    translates = generator.configuration.path_to_translates
+
+    write_locale(translates, 'x001', {'key0': 'changed'})
+    assert generator.update(['l10n_x001.json'])
+    assert not generator.update(['l10n_x001.json'])
+    write_locale(translates, 'x003', {'key1': 'new locale'})
+    assert generator.update(['l10n_x003.json'])
+    os.remove(os.path.join(translates, 'l10n_x002.json'))
+    assert generator.update(['l10n_x002.json'])
+    updated = read_output(generator)
+
+    rebuilt = Generator(config)
+    assert rebuilt.build(force=True)
+    assert read_output(rebuilt) == updated
+    assert not Generator(config).build()
+
+def test_update_keeps_output_on_errors(config, write_locale):
+    generator = Generator(config)
+    generator.build()
+    before = read_output(generator)
+    path = os.path.join(generator.configuration.path_to_translates, 'l10n_x001.json')
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write('{')
+
+    with pytest.raises(L10nUnmarshalError):
+        generator.update(['l10n_x001.json'])
+    assert read_output(generator) == before
+    assert generator.registry.get('x001') is not None
+
+    write_locale(generator.configuration.path_to_translates, 'x001', {'key0': 'fixed'})
+    assert generator.update(['l10n_x001.json'])
+
+def test_watch_updates_output(config, write_locale):
+    generator = Generator(config)
+    watcher = generator.watch(interval=0.02, use_inotify=False)
+    try:
+        write_locale(generator.configuration.path_to_translates, 'x001', {'key0': 'watched'})
+        deadline = time.monotonic() + 5
+        while 'watched' not in str(read_output(generator)) and time.monotonic() < deadline:
+            time.sleep(0.02)
+    finally:
+        watcher.stop()
+    assert 'watched' in str(read_output(generator))
+
+def test_main_builds(config, capsys):
+    assert main(['--config', config, '--stats']) == 0
+    assert 'keys: 20' in capsys.readouterr().out
+
+def test_import_does_not_load_cli_dependencies():
+    code = "import sys, l10n.generator; print(' '.join(sorted({'yaml', 'argparse', 'concurrent.futures'} & set(sys.modules))))"
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ''
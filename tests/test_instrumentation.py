@@ -0,0 +1,68 @@
+import importlib
+import sys
+import pytest
+from l10n.generator import Generator
+
+@pytest.fixture(params=['module', 'package'])
+def localization(request, tmp_path, monkeypatch, write_config):
+    name = f'instrumented_{request.param}'
+    Generator(write_config(name, f"outputMode: {request.param}\ninstrumentation: true\n")).build()
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield importlib.import_module(name)
+    for module in [module for module in sys.modules if module.startswith(name)]:
+        del sys.modules[module]
+
+def test_counts_hits_fallbacks_and_unknown_locales(localization):
+    ru = localization.AppLocalization('ru').of()
+    assert ru.helloWorld == 'Привет мир'
+    assert ru.helloWorld == 'Привет мир'
+    assert ru.numberOfUsers('a', 3) == 'Number of users: 3'
+    assert localization.AppLocalization('en').of().bye() == 'Bye World'
+    with pytest.raises(ValueError):
+        localization.AppLocalization('xx').of()
+    with pytest.raises(ValueError):
+        localization.set_locale('xx')
+
+    assert localization.snapshot_counters() == {
+        'hits': {'en': {'bye': 1}, 'ru': {'helloWorld': 2, 'numberOfUsers': 1}},
+        'fallbacks': {'en': {}, 'ru': {'numberOfUsers': 1}},
+        'unknownLocales': {'xx': 2},
+    }
+
+def test_reset_counters(localization):
+    localization.of().helloWorld
+    localization.reset_counters()
+    assert localization.snapshot_counters() == {
+        'hits': {'en': {}, 'ru': {}},
+        'fallbacks': {'en': {}, 'ru': {}},
+        'unknownLocales': {},
+    }
+    localization.of().helloWorld
+    assert localization.snapshot_counters()['hits']['en'] == {'helloWorld': 1}
+
+def test_enable_counters(localization):
+    assert localization.counters_enabled()
+    localization.enable_counters(False)
+    assert not localization.counters_enabled()
+    ru = localization.AppLocalization('ru').of()
+    # The plain locale classes are the classes generated without instrumentation
+    assert type(ru) is localization.AppLocalizationRu
+    assert (ru.helloWorld, ru.numberOfUsers('a', 3)) == ('Привет мир', 'Number of users: 3')
+    assert localization.snapshot_counters()['hits'] == {'en': {}, 'ru': {}}
+
+    localization.enable_counters()
+    ru = localization.AppLocalization('ru').of()
+    assert isinstance(ru, localization.AppLocalizationRu) and type(ru) is not localization.AppLocalizationRu
+    assert ru.helloWorld == 'Привет мир'
+    assert localization.of().bye() == 'Bye World'
+    assert localization.snapshot_counters()['hits'] == {'en': {'bye': 1}, 'ru': {'helloWorld': 1}}
+
+def test_disabled_by_default(tmp_path, write_config):
+    Generator(write_config('plain')).build()
+    source = (tmp_path / 'plain.py').read_text(encoding='utf-8')
+    assert '_L10N_' not in source and 'snapshot_counters' not in source
+
+def test_invalid_value(write_config):
+    generator = Generator(write_config('invalid', "instrumentation: sometimes\n"))
+    with pytest.raises(ValueError):
+        generator.parse_config()
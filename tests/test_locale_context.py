@@ -0,0 +1,58 @@
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+import tests.app_localization as localization
+
+def test_default_locale_without_binding():
+    assert localization.get_locale() == 'en'
+    assert localization.of() is localization.AppLocalization().of()
+
+def test_use_locale_restores_previous():
+    with localization.use_locale('ru') as of:
+        assert of.helloWorld == 'Привет мир'
+        assert localization.of() is of
+        with localization.use_locale('en'):
+            assert localization.of().helloWorld == 'Hello World'
+        assert localization.get_locale() == 'ru'
+    assert localization.get_locale() == 'en'
+
+def test_unknown_locale():
+    with pytest.raises(ValueError):
+        localization.set_locale('xx')
+    assert localization.get_locale() == 'en'
+
+def test_asyncio_tasks_are_isolated():
+    async def handler(locale, delay):
+        token = localization.set_locale(locale)
+        try:
+            await asyncio.sleep(delay)
+            return localization.of().helloWorld
+        finally:
+            localization.reset_locale(token)
+
+    async def main():
+        return await asyncio.gather(*(
+            handler('ru' if i % 2 else 'en', (i % 5) / 1000) for i in range(200)
+        ))
+
+    results = asyncio.run(main())
+    assert results == ['Привет мир' if i % 2 else 'Hello World' for i in range(200)]
+    assert localization.get_locale() == 'en'
+
+def test_thread_pool_does_not_leak_locale():
+    def handler(locale):
+        with localization.use_locale(locale) as of:
+            return of.helloWorld
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(handler, ['ru' if i % 3 else 'en' for i in range(300)]))
+        leftovers = list(executor.map(lambda _: localization.get_locale(), range(20)))
+    assert results == ['Привет мир' if i % 3 else 'Hello World' for i in range(300)]
+    assert set(leftovers) == {'en'}
+
+def test_copied_context_follows_into_thread():
+    with localization.use_locale('ru'):
+        context = contextvars.copy_context()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(context.run, lambda: localization.of().helloWorld).result() == 'Привет мир'
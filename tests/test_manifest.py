@@ -0,0 +1,56 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+import pytest
+from l10n.generator import Generator, L10nManifest
+
+@pytest.fixture
+def config(tmp_path, write_config):
+    return write_config(out=tmp_path / 'app_localization.py')
+
+def test_unchanged_inputs_are_not_regenerated(config):
+    assert Generator(str(config)).build()
+    assert not Generator(str(config)).build()
+    assert Generator(str(config)).build(force=True)
+
+def test_changed_locale_replaces_only_its_section(config, tmp_path):
+    Generator(str(config)).build()
+
+    ru_path = tmp_path / 'translates' / 'l10n_ru.json'
+    data = json.loads(ru_path.read_text(encoding='utf-8'))
+    data['helloWorld'] = 'Здравствуй мир'
+    ru_path.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+
+    generator = Generator(str(config))
+    assert generator.build()
+    assert sorted(generator.registry.language_codes) == ['en', 'ru']
+    incremental = (tmp_path / 'app_localization.py').read_text(encoding='utf-8')
+    assert 'Здравствуй мир' in incremental
+
+    Generator(str(config)).build(force=True)
+    assert (tmp_path / 'app_localization.py').read_text(encoding='utf-8') == incremental
+
+def test_edited_output_is_regenerated(config, tmp_path):
+    Generator(str(config)).build()
+    (tmp_path / 'app_localization.py').write_text('')
+    assert Generator(str(config)).build()
+    manifest = L10nManifest.load(L10nManifest.path_for(str(tmp_path / 'app_localization.py')))
+    assert [name for name, _, _ in manifest.sections][0] == 'header'
+
+def test_changed_plural_rules_regenerate_output(tmp_path, write_config):
+    # A copy of the package stands for an upgraded installation
+    shutil.copytree('l10n', tmp_path / 'package' / 'l10n', ignore=shutil.ignore_patterns('__pycache__'))
+    config = write_config(locales={'en': {
+        "items": {"one": "{n} item", "other": "{n} items"}, "#items": {"variables": {"n": {"type": "int"}}},
+    }})
+    build = lambda: subprocess.run(
+        [sys.executable, '-m', 'l10n.generator', f'--config={config}'],
+        cwd=tmp_path / 'package', env=dict(os.environ, PYTHONPATH=str(tmp_path / 'package')), check=True
+    )
+    build()
+    plural = tmp_path / 'package' / 'l10n' / 'plural.py'
+    plural.write_text(plural.read_text(encoding='utf-8').replace("('one', 'n == 1'),)", "('one', 'n == 2'),)", 1), encoding='utf-8')
+    build()
+    assert 'n == 2' in (tmp_path / 'configuration.py').read_text(encoding='utf-8')
@@ -0,0 +1,57 @@
+import pytest
+from l10n.generator import Generator, L10nInternTable, L10nObject, L10nTranslations, parse_translations
+
+@pytest.fixture
+def generator():
+    obj = Generator('tests/configuration.yml')
+    obj.parse_config()
+    obj.unmarshal()
+    return obj
+
+def test_merge_table_follows_default_keys(generator):
+    merged = generator.merge()
+    for language_code in generator.registry.language_codes:
+        assert [val.value for val in merged.table[language_code]] == ['helloWorld', 'bye', 'numberOfUsers']
+
+def test_merge_falls_back_to_default(generator):
+    merged = generator.merge()
+    default_node = generator.registry.get('en')
+    fallback, default = merged.table['ru'][2], default_node.translate[2]
+    assert (fallback.value, fallback.text) == (default.value, default.text)
+    assert fallback.params is default.params
+    assert merged.table['ru'].keys is merged.table['en'].keys
+    assert merged.table['ru'][0].text == 'Привет мир'
+
+def test_merge_report(generator):
+    report = generator.merge().report
+    assert report['en'].is_complete
+    assert report['ru'].missing == ['numberOfUsers']
+    assert report['ru'].extra == []
+
+def test_locale_classes_inherit_missing_keys(generator, tmp_path):
+    generator.configuration.path_to_out = str(tmp_path / 'app_localization.py')
+    generator.generate()
+    namespace = {}
+    exec((tmp_path / 'app_localization.py').read_text(encoding='utf-8'), namespace)
+    ru = namespace['AppLocalizationRu']
+    assert issubclass(ru, namespace['AppLocalizationEn'])
+    assert 'numberOfUsers' not in vars(ru)
+    assert ru().numberOfUsers('x') == 'Number of users: 0'
+    assert generator.merged.deduplicated == 1
+
+def test_locales_share_keys_and_params(generator):
+    default = generator.registry.get('en').translate
+    ru = generator.registry.get('ru').translate
+    assert all(a is b for a, b in zip(ru.keys, default.keys))
+    assert isinstance(ru[0], L10nObject) and ru[0].value == 'helloWorld'
+
+def test_intern_table_shares_equal_schemas():
+    table = L10nInternTable()
+    meta = {'variables': {'count': {'type': 'int', 'defaultValue': 1}}}
+    first = table.translations(L10nTranslations.of(parse_translations({'a': '{count}', '#a': meta}, [])))
+    second = table.translations(L10nTranslations.of(parse_translations({'a': '{count}', '#a': meta}, [])))
+    other = table.translations(L10nTranslations.of(parse_translations(
+        {'a': '{count}', '#a': {'variables': {'count': {'type': 'int', 'defaultValue': True}}}}, []
+    )))
+    assert second.keys is first.keys and second.params[0] is first.params[0]
+    assert other.params[0] is not first.params[0]
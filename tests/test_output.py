@@ -0,0 +1,30 @@
+import pytest
+from l10n.generator import L10nOutputWriter, L10nTemplate
+
+def test_template_renders_slots_once():
+    template = L10nTemplate("def {PropertyName}(self{PropertyArgs}) -> {PropertyType}:")
+    assert template.slots == ['PropertyName', 'PropertyArgs', 'PropertyType']
+    # Values are not substituted again, unknown slots are kept
+    assert template.render({'PropertyName': '{PropertyType}', 'PropertyArgs': ''}) == "def {PropertyType}(self) -> {PropertyType}:"
+
+def test_writer_records_sections(tmp_path):
+    path = tmp_path / 'out.py'
+    with L10nOutputWriter(str(path)) as out:
+        out.begin_section('header')
+        out.write('# Привет\n')
+        out.end_section()
+        out.begin_section('main')
+        out.write('x = 1\n')
+        out.end_section()
+    assert path.read_text(encoding='utf-8') == '# Привет\nx = 1\n'
+    assert out.sections == [['header', 0, 9], ['main', 9, 15]]
+
+def test_writer_keeps_old_output_on_error(tmp_path):
+    path = tmp_path / 'out.py'
+    path.write_text('old')
+    with pytest.raises(RuntimeError):
+        with L10nOutputWriter(str(path)) as out:
+            out.write('new')
+            raise RuntimeError()
+    assert path.read_text() == 'old'
+    assert [p.name for p in tmp_path.iterdir()] == ['out.py']
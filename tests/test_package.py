@@ -0,0 +1,51 @@
+import importlib
+import json
+import sys
+import pytest
+from l10n.generator import Generator
+
+@pytest.fixture
+def config(tmp_path, write_config):
+    return write_config(extra="outputMode: package\n", out=tmp_path / 'pkg_localization')
+
+@pytest.fixture
+def package(config, tmp_path, monkeypatch):
+    Generator(str(config)).build()
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield lambda: importlib.import_module('pkg_localization')
+    for name in [name for name in sys.modules if name.startswith('pkg_localization')]:
+        del sys.modules[name]
+
+def test_locale_modules_are_loaded_on_first_use(package):
+    module = package()
+    assert 'pkg_localization._l10n_en' not in sys.modules
+    assert module.AppLocalization('en').of().helloWorld == 'Hello World'
+    assert 'pkg_localization._l10n_en' in sys.modules
+    assert 'pkg_localization._l10n_ru' not in sys.modules
+    assert module.AppLocalization('ru').of().helloWorld == 'Привет мир'
+    assert module.AppLocalization('ru').of() is module.AppLocalization('ru').of()
+    assert module.AppLocalizationEn().bye() == 'Bye World'
+    with pytest.raises(ValueError):
+        module.AppLocalization('xx').of()
+
+def test_changed_locale_rewrites_only_its_module(package, config, tmp_path):
+    base = tmp_path / 'pkg_localization' / '_l10n_en.py'
+    mtime = base.stat().st_mtime_ns
+    ru_path = tmp_path / 'translates' / 'l10n_ru.json'
+    data = json.loads(ru_path.read_text(encoding='utf-8'))
+    data['helloWorld'] = 'Здравствуй мир'
+    ru_path.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+
+    assert Generator(str(config)).build()
+    assert base.stat().st_mtime_ns == mtime
+    assert package().AppLocalization('ru').of().helloWorld == 'Здравствуй мир'
+
+def test_locale_context_loads_bound_locale(package):
+    module = package()
+    with module.use_locale('ru') as of:
+        assert 'pkg_localization._l10n_ru' in sys.modules
+        assert of.helloWorld == 'Привет мир'
+        assert module.of() is module.AppLocalization('ru').of()
+    assert module.of().helloWorld == 'Hello World'
+    with pytest.raises(ValueError):
+        module.set_locale('xx')
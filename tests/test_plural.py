@@ -0,0 +1,105 @@
+import importlib
+import io
+import json
+import sys
+import pytest
+from l10n.binary import BinaryCatalog
+from l10n.generator import Generator, parse_translations, stream_translations
+from l10n.plural import PLURAL_TABLE_SIZE, plural_rule
+from l10n.runtime import Catalog, Localization
+
+EN = {
+    "users": {"other": "{count} users", "one": "{count} user"},
+    "#users": {"variables": {"count": {"type": "int"}}},
+    "files": {"one": "{n} file in {folder}", "other": "{n} files in {folder}"},
+    "#files": {
+        "plural": "n",
+        "variables": {"n": {"type": "int"}, "size": {"type": "int", "defaultValue": 0}, "folder": {"type": "string", "defaultValue": "home"}},
+    },
+    "hello": "Hello",
+}
+RU = {
+    "users": {"one": "{count} пользователь", "few": "{count} пользователя", "many": "{count} пользователей", "other": "{count} пользователя"},
+    "#users": {"variables": {"count": {"type": "int"}}},
+}
+RU_USERS = {1: "1 пользователь", 2: "2 пользователя", 5: "5 пользователей", 11: "11 пользователей", 21: "21 пользователь", 1002: "1002 пользователя", -5: "-5 пользователей"}
+
+@pytest.mark.parametrize('language_code, numbers, categories', [
+    ('en', [0, 1, 2, 1001], ['other', 'one', 'other', 'other']),
+    ('ru', [1, 3, 5, 11, 21, 111, 1004], ['one', 'few', 'many', 'many', 'one', 'many', 'few']),
+    ('pl', [1, 2, 5, 12, 22, 101], ['one', 'few', 'many', 'many', 'few', 'many']),
+    ('ar', [0, 1, 2, 3, 11, 100, 102], ['zero', 'one', 'two', 'few', 'many', 'other', 'other']),
+    ('fr', [0, 1, 2, 1000000], ['one', 'one', 'other', 'many']),
+    ('pt_PT', [0, 1], ['other', 'one']),
+    ('ja', [1, 2], ['other', 'other']),
+])
+def test_plural_rules(language_code, numbers, categories):
+    rule = plural_rule(language_code)
+    assert [rule.category(n) for n in numbers] == categories
+    assert [rule.categories[rule.select(n)] for n in numbers] == categories
+    assert all(rule.table[n] == rule.select(n) for n in range(PLURAL_TABLE_SIZE))
+
+LOCALES = {'en': EN, 'ru': RU}
+
+@pytest.fixture(params=['module', 'package', 'instrumented'])
+def localization(request, tmp_path, monkeypatch, write_config):
+    extra = "outputMode: package\n" if request.param == 'package' else "instrumentation: true\n" if request.param == 'instrumented' else ""
+    name = f'plural_{request.param}'
+    Generator(write_config(name, extra, LOCALES)).build()
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield importlib.import_module(name)
+    for module in [module for module in sys.modules if module.startswith(name)]:
+        del sys.modules[module]
+
+def test_generated_plural_forms(localization):
+    ru = localization.AppLocalization('ru').of()
+    assert {n: ru.users(n) for n in RU_USERS} == RU_USERS
+    en = localization.AppLocalization('en').of()
+    assert [en.users(n) for n in (0, 1, 2, 1001)] == ['0 users', '1 user', '2 users', '1001 users']
+    # Fallbacks are in the default language and use its rule
+    assert ru.files(1) == '1 file in home' and ru.files(3, folder='docs') == '3 files in docs'
+    assert ru.hello == 'Hello'
+
+def test_runtime_plural_forms(write_config):
+    generator = Generator(write_config('runtime', locales=LOCALES))
+    generator.parse_config()
+    catalog = Catalog.load(generator.configuration.path_to_translates, 'en')
+    ru = Localization(catalog, 'ru').of()
+    assert {n: ru.users(n) for n in RU_USERS} == RU_USERS
+    assert ru.files(1) == '1 file in home'
+    assert catalog.render_many('users', 'ru', [(1,), (2,), (5,)]) == ['1 пользователь', '2 пользователя', '5 пользователей']
+    with pytest.raises(TypeError):
+        ru.users('1')
+
+@pytest.mark.parametrize('data, error', [
+    ({"a": {"one": "{n}"}, "#a": {"variables": {"n": {"type": "int"}}}}, "'other' form"),
+    ({"a": {"single": "{n}", "other": "{n}"}, "#a": {"variables": {"n": {"type": "int"}}}}, "unknown plural categories: single"),
+    ({"a": {"one": 1, "other": "{n}"}, "#a": {"variables": {"n": {"type": "int"}}}}, "must be strings"),
+    ({"a": {"other": "{n}"}}, "int variable"),
+    ({"a": {"other": "{n}"}, "#a": {"variables": {"n": {"type": "string"}}}}, "int variable"),
+    ({"a": {"other": "{n}{m}"}, "#a": {"variables": {"n": {"type": "int"}, "m": {"type": "int"}}}}, "int variable"),
+    ({"a": {"other": "{n}"}, "#a": {"plural": "m", "variables": {"n": {"type": "int"}}}}, "int variable"),
+])
+def test_invalid_plural_forms(data, error):
+    errors = []
+    parse_translations(data, errors, 'l10n_en.json')
+    assert len(errors) == 1 and error in errors[0] and errors[0].startswith('l10n_en.json: a:')
+
+def test_streaming_matches_json_load():
+    data = {"#users": EN["#users"], "users": {"one": "{count} user", "other": "{count} users"}, "files": EN["files"], "#files": EN["#files"]}
+    errors, streamed_errors = [], []
+    parsed = parse_translations(data, errors)
+    streamed = stream_translations(io.StringIO(json.dumps(data)), streamed_errors, chunk_size=16)
+    assert errors == streamed_errors == []
+    assert [(val.value, val.text, val.params.plural) for val in streamed] == [(val.value, val.text, val.params.plural) for val in parsed]
+    assert list(parsed[0].text) == ['one', 'other'] and parsed[1].params.plural == 'n'
+
+def test_binary_plural_forms(tmp_path, write_config):
+    generator = Generator(write_config('binary', locales=LOCALES), output_format='binary')
+    generator.build()
+    with BinaryCatalog(generator.output_path) as catalog:
+        ru = Localization(catalog, 'ru').of()
+        assert {n: ru.users(n) for n in RU_USERS} == RU_USERS
+        assert ru.files(1) == '1 file in home' and ru.files(3, folder='docs') == '3 files in docs'
+        assert catalog.l10n_object('ru', 'files').params.plural == 'n'
+        assert list(catalog.l10n_object('ru', 'users').text) == ['one', 'few', 'many', 'other']
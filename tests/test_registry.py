@@ -0,0 +1,114 @@
+import pytest
+from l10n.generator import L10nLocaleRegistry, L10nNodeOperations
+
+EN = ['en']
+RU = ['ru']
+DE = ['de']
+
+def links(head):
+    codes = []
+    while head is not None:
+        codes.append(head.language_code)
+        head = head.next
+    return codes
+
+@pytest.fixture
+def registry():
+    obj = L10nLocaleRegistry()
+    obj.add('en', EN)
+    obj.add('ru', RU)
+    obj.add('de', DE)
+    return obj
+
+def test_registry_lookups(registry):
+    assert registry.language_codes == ['en', 'ru', 'de']
+    assert len(registry) == 3
+    assert 'ru' in registry and 'fr' not in registry
+    assert registry.get('ru').translate is RU
+    assert registry.get('fr') is None
+    assert registry.at(0).language_code == 'en'
+    assert registry.at(2).language_code == 'de'
+    assert registry.at(3) is None and registry.at(-1) is None
+    assert registry.index_of('de') == 2
+    assert registry.index_of('fr') is None
+    assert registry.head is registry.at(0)
+    assert links(registry.head) == ['en', 'ru', 'de']
+
+def test_registry_add_replaces_duplicate(registry):
+    node = registry.get('ru')
+    replaced = ['ru', 'new']
+    assert registry.add('ru', replaced) is node
+    assert node.translate is replaced
+    assert registry.language_codes == ['en', 'ru', 'de']
+    assert links(registry.head) == ['en', 'ru', 'de']
+
+def test_registry_insert_and_remove(registry):
+    registry.insert(1, 'fr', ['fr'])
+    assert registry.language_codes == ['en', 'fr', 'ru', 'de']
+    assert registry.index_of('ru') == 2
+    # Inserting a registered locale moves it
+    registry.insert(0, 'de', DE)
+    assert registry.language_codes == ['de', 'en', 'fr', 'ru']
+    assert links(registry.head) == ['de', 'en', 'fr', 'ru']
+
+    removed = registry.remove('fr')
+    assert removed.language_code == 'fr' and removed.next is None
+    assert registry.remove('fr') is None
+    assert registry.language_codes == ['de', 'en', 'ru']
+    assert registry.index_of('ru') == 2
+    assert links(registry.head) == ['de', 'en', 'ru']
+
+def test_registry_clear(registry):
+    registry.clear()
+    assert len(registry) == 0
+    assert registry.head is None
+    assert registry.get('en') is None
+
+def test_node_operations_indexes():
+    operations = L10nNodeOperations()
+    assert operations.is_empty() and operations.size == 0 and operations.head is None
+    operations.append('en', EN)
+    operations.append('ru', RU)
+    # get_value_at_index is 1-based, get_index_of_value is 0-based like the linked list was
+    assert operations.get_value_at_index(1).language_code == 'en'
+    assert operations.get_value_at_index(2).language_code == 'ru'
+    assert operations.get_value_at_index(0) is None
+    assert operations.get_value_at_index(3) is None
+    assert operations.get_index_of_value('ru') == 1
+    assert operations.get_index_of_value('de') is None
+    assert not operations.is_empty() and operations.size == 2
+
+def test_node_operations_prepend_and_delete(capsys):
+    operations = L10nNodeOperations()
+    operations.append('en', EN)
+    operations.append('ru', RU)
+    operations.prepend('de', DE)
+    assert links(operations.head) == ['de', 'en', 'ru']
+    # Prepending a registered locale moves it to the front instead of adding a second node
+    operations.prepend('ru', RU)
+    assert links(operations.head) == ['ru', 'de', 'en']
+    assert operations.size == 3
+
+    operations.delete('de')
+    operations.delete('fr')
+    assert links(operations.head) == ['ru', 'en']
+    assert operations.get_index_of_value('en') == 1
+
+    operations.print_list()
+    assert capsys.readouterr().out == 'ru en \n'
+
+def test_node_operations_append_replaces_duplicate():
+    operations = L10nNodeOperations()
+    operations.append('en', EN)
+    operations.append('ru', RU)
+    replaced = ['en', 'new']
+    operations.append('en', replaced)
+    assert operations.size == 2
+    assert links(operations.head) == ['en', 'ru']
+    assert operations.head.translate is replaced
+
+def test_node_operations_share_registry(registry):
+    operations = L10nNodeOperations(registry)
+    operations.delete('ru')
+    assert registry.language_codes == ['en', 'de']
+    assert operations.head is registry.head
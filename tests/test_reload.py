@@ -0,0 +1,71 @@
+import os
+import time
+import pytest
+from benchmarks.synthetic import write_catalog
+from l10n.runtime import Catalog, Localization, ReloadingCatalog
+from l10n.watch import TranslationsWatcher
+
+@pytest.fixture
+def translates(tmp_path):
+    write_catalog(str(tmp_path), keys=20, locales=3, variable_ratio=0.5)
+    return str(tmp_path / 'translates')
+
+def test_reload_replaces_only_changed_locale(translates, write_locale):
+    catalog = ReloadingCatalog(translates, watch=False)
+    before = catalog.snapshot
+    write_locale(translates, 'x001', {'key0': 'changed'})
+
+    assert catalog.reload(['l10n_x001.json'])
+    assert Localization(catalog, 'x001').of().key0 == 'changed'
+    assert Localization(catalog, 'x001').of().key1 == Localization(catalog, 'en').of().key1
+    assert catalog.views['x002'] is before.views['x002']
+    assert catalog.views['x001'] is not before.views['x001']
+    assert before.views['x001'].key0 != 'changed'
+
+def test_reload_keeps_snapshot_on_errors(translates):
+    catalog = ReloadingCatalog(translates, watch=False)
+    before = catalog.snapshot
+    with open(os.path.join(translates, 'l10n_x001.json'), 'w', encoding='utf-8') as file:
+        file.write('{')
+
+    assert not catalog.reload(['l10n_x001.json'])
+    assert catalog.errors
+    assert catalog.snapshot is before
+
+def test_reload_adds_and_removes_locales(translates, write_locale):
+    catalog = ReloadingCatalog(translates, watch=False)
+    write_locale(translates, 'de', {'key0': 'Hallo'})
+    os.remove(os.path.join(translates, 'l10n_x002.json'))
+
+    assert catalog.reload()
+    assert catalog.locales == ('de', 'en', 'x001')
+    assert Localization(catalog, 'de').of().key0 == 'Hallo'
+    with pytest.raises(ValueError):
+        Localization(catalog, 'x002').of()
+
+def test_default_locale_change_recompiles_fallbacks(translates, write_locale):
+    catalog = ReloadingCatalog(translates, watch=False)
+    write_locale(translates, 'en', {'key0': 'new default'})
+
+    assert catalog.reload(['l10n_en.json'])
+    assert Localization(catalog, 'en').of().key0 == 'new default'
+    assert not hasattr(Localization(catalog, 'x001').of(), 'key1')
+    assert catalog.snapshot.messages['en'].keys() == Catalog.load(translates).messages['en'].keys()
+
+@pytest.mark.parametrize('use_inotify', [True, False])
+def test_watcher_reloads_in_background(translates, use_inotify, write_locale):
+    with ReloadingCatalog(translates, interval=0.05, use_inotify=use_inotify) as catalog:
+        of = Localization(catalog, 'x001')
+        write_locale(translates, 'x001', {'key0': 'watched'})
+        deadline = time.monotonic() + 5
+        while of.of().key0 != 'watched' and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert of.of().key0 == 'watched'
+        assert catalog.reloads >= 1
+
+def test_watcher_poll(translates, write_locale):
+    watcher = TranslationsWatcher(translates, lambda names: None)
+    assert watcher.poll() == set()
+    write_locale(translates, 'de', {})
+    os.remove(os.path.join(translates, 'l10n_x001.json'))
+    assert watcher.poll() == {'l10n_de.json', 'l10n_x001.json'}
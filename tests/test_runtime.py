@@ -0,0 +1,71 @@
+import json
+import pytest
+from l10n.runtime import Catalog, Localization
+
+locales = ['en', 'ru']
+
+@pytest.fixture(scope='module')
+def catalog():
+    return Catalog.from_config('tests/configuration.yml')
+
+@pytest.fixture
+def json_data(request):
+    with open(f'tests/translates/l10n_{request.param}.json', encoding='utf-8') as f:
+        return json.load(f)
+
+@pytest.mark.parametrize('locale,json_data', [(loc, loc) for loc in locales], indirect=['json_data'])
+def test_hello_world(catalog, locale, json_data):
+    assert Localization(catalog, locale).of().helloWorld == json_data['helloWorld']
+
+@pytest.mark.parametrize('locale,json_data', [(loc, loc) for loc in locales], indirect=['json_data'])
+def test_bye(catalog, locale, json_data):
+    default = json_data['#bye']['variables']['value']['defaultValue']
+    assert Localization(catalog, locale).of().bye() == json_data['bye'].replace('{value}', default)
+    assert Localization(catalog, locale).of().bye('X') == json_data['bye'].replace('{value}', 'X')
+    assert Localization(catalog, locale).of().bye(value='X') == json_data['bye'].replace('{value}', 'X')
+
+def test_fallback_and_variable_order(catalog):
+    of = Localization(catalog, 'ru').of()
+    assert of.numberOfUsers('a') == 'Number of users: 0'
+    assert of.numberOfUsers('a', 5) == 'Number of users: 5'
+    assert of.numberOfUsers(values='a', number=7) == 'Number of users: 7'
+    assert catalog.message('ru', 'numberOfUsers') is catalog.message('en', 'numberOfUsers')
+
+def test_arguments_are_checked(catalog):
+    of = Localization(catalog).of()
+    with pytest.raises(TypeError):
+        of.numberOfUsers()
+    with pytest.raises(TypeError):
+        of.numberOfUsers('a', number='5')
+    with pytest.raises(TypeError):
+        of.bye(name='x')
+
+def test_localization_api(catalog):
+    localization = Localization(catalog, 'ru')
+    assert localization.default_locale == 'en'
+    assert localization.current_locale == 'ru'
+    assert localization.locales == locales
+    assert localization.of() is Localization(catalog, 'ru').of()
+    assert localization.of()['helloWorld'] == 'Привет мир'
+    with pytest.raises(ValueError):
+        Localization(catalog, 'xx').of()
+
+def test_render_many_keeps_input_order(catalog):
+    locales = ['en', 'ru', 'en', 'ru']
+    rows = [('Ann',), {'value': 'Bob'}, (), ['Dan']]
+    expected = [Localization(catalog, locale).of().bye(*row) if not isinstance(row, dict)
+                else Localization(catalog, locale).of().bye(**row) for locale, row in zip(locales, rows)]
+    assert catalog.render_many('bye', locales, rows) == expected
+    assert list(catalog.render_many('bye', iter(locales), iter(rows), chunk_size=3)) == expected
+    assert catalog.render_many('helloWorld', 'ru', [(), {}]) == ['Привет мир'] * 2
+
+def test_render_many_checks_arguments(catalog):
+    assert catalog.render_many('numberOfUsers', ['ru', 'en'], [('a',), ('a', 5)]) == ['Number of users: 0', 'Number of users: 5']
+    with pytest.raises(TypeError):
+        catalog.render_many('numberOfUsers', 'en', [('a', '5')])
+    with pytest.raises(TypeError):
+        catalog.render_many('numberOfUsers', 'en', [{}])
+    with pytest.raises(ValueError):
+        catalog.render_many('bye', ['en'], [(), ()])
+    with pytest.raises(ValueError):
+        catalog.render_many('bye', ['xx'], [()])
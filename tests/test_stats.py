@@ -0,0 +1,37 @@
+import os
+import time
+import tracemalloc
+from l10n.generator import Generator, L10nStats
+
+def test_build_reports_phases_and_counts(tmp_path, write_config):
+    finished = []
+    stats = L10nStats(trace_memory=True, hooks=[lambda phase: finished.append(phase.name)])
+    generator = Generator(write_config(out=tmp_path / 'app_localization.py'), stats=stats)
+    try:
+        generator.build()
+    finally:
+        tracemalloc.stop()
+
+    assert list(stats.phases) == ['config', 'scan', 'unmarshal', 'merge', 'render', 'write']
+    assert set(finished) == set(stats.phases)
+    assert all(phase.seconds >= 0 and phase.peak_bytes > 0 for phase in stats.phases.values())
+    assert set(stats.files) == {'l10n_en.json', 'l10n_ru.json'}
+    assert stats.files['l10n_en.json']['bytes'] == os.path.getsize('tests/translates/l10n_en.json')
+    assert (stats.keys, stats.locales, stats.variables, stats.fallbacks) == (3, 2, 3, 1)
+    assert stats.output_bytes == os.path.getsize(tmp_path / 'app_localization.py')
+    assert stats.as_dict()['phases']['render']['calls'] == 1
+    assert 'fallbacks: 1' in stats.format()
+
+def test_nested_phases_are_exclusive():
+    stats = L10nStats()
+    start = time.perf_counter()
+    with stats.phase('outer'):
+        time.sleep(0.02)
+        with stats.phase('inner'):
+            time.sleep(0.05)
+    elapsed = time.perf_counter() - start
+    assert stats.phases['inner'].seconds >= 0.05
+    assert stats.phases['outer'].seconds >= 0.02
+    # The outer phase would take the whole time if it included the inner one
+    assert stats.phases['outer'].seconds + stats.phases['inner'].seconds <= elapsed
+    assert stats.phases['outer'].peak_bytes is None
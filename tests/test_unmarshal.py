@@ -0,0 +1,85 @@
+import io
+import json
+import pytest
+from l10n.generator import Generator, L10nUnmarshalError, load_locale_file, parse_translations, stream_translations
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_locales_are_sorted_by_language_code(write_config, jobs):
+    config = write_config(locales={code: {'hello': code} for code in ['ru', 'de', 'en', 'fr']})
+    generator = Generator(config, jobs=jobs)
+    generator.parse_config()
+    generator.unmarshal()
+    assert generator.registry.language_codes == ['de', 'en', 'fr', 'ru']
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_errors_of_all_files_are_aggregated(tmp_path, write_config, jobs):
+    bad_variable = {'bye': 'Bye {value}', '#bye': {'variables': {'value': {'defaultValue': 1, 'type': 'string'}}}}
+    config = write_config(locales={'en': {'bye': 'Bye'}, 'de': bad_variable, 'ru': bad_variable})
+    (tmp_path / 'translates' / 'l10n_fr.json').write_text('{', encoding='utf-8')
+    generator = Generator(config, jobs=jobs)
+    generator.parse_config()
+    with pytest.raises(L10nUnmarshalError) as error:
+        generator.unmarshal()
+    assert [e.split(':')[0] for e in error.value.errors] == ['l10n_de.json', 'l10n_fr.json', 'l10n_ru.json']
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_malformed_metadata_is_a_file_error(tmp_path, write_config, jobs):
+    bad_variable = {'bye': 'Bye {value}', '#bye': {'variables': {'value': {'defaultValue': 1, 'type': 'string'}}}}
+    config = write_config(locales={
+        'en': {'bye': 'Bye'},
+        'de': {'bye': 'Tschüss', '#bye': 5},
+        'fr': {'bye': 'Salut {value}', '#bye': {'variables': ['value']}},
+        'ru': bad_variable,
+    })
+    generator = Generator(config, jobs=jobs)
+    generator.parse_config()
+    with pytest.raises(L10nUnmarshalError) as error:
+        generator.unmarshal()
+    assert error.value.errors[:2] == [
+        "l10n_de.json: bye: the metadata #bye must be an object",
+        "l10n_fr.json: bye: variables must be an object of variable names",
+    ]
+    assert error.value.errors[2].startswith('l10n_ru.json: bye.value: ')
+
+def translations(objects):
+    return [
+        (val.value, val.text, None if val.params is None else (
+            val.params.description,
+            None if val.params.variables is None else [(v.variable_name, v.type, v.default_value) for v in val.params.variables],
+        ))
+        for val in objects
+    ]
+
+STREAMED = (
+    '{"#a": {"description": "before", "variables": {"x": {"type": "int", "defaultValue": 1}}},\n'
+    ' "a": "A {x}", "b": "B \\"quoted\\"", "#b": {"variables": {"y": {"type": "bad"}}},\n'
+    ' "c": "C", "a": "A again {x}", "#c": {"description": "no variables"}, "#orphan": {"variables": {}}}'
+)
+
+@pytest.mark.parametrize('chunk_size', [1, 5, 1 << 16])
+def test_streaming_matches_json_load(chunk_size):
+    expected_errors = []
+    expected = parse_translations(json.loads(STREAMED), expected_errors, 'l10n_en.json')
+    errors = []
+    streamed = stream_translations(io.StringIO(STREAMED), errors, 'l10n_en.json', chunk_size)
+    assert translations(streamed) == translations(expected)
+    assert errors == expected_errors and len(errors) == 1
+    assert translations(streamed)[0] == ('a', 'A again {x}', ('before', [('x', 'int', 1)]))
+
+NUMBERS = '{"a": 1.5e10, "b": -0.25E-3, "c": 12345678, "d": 0, "e": [1.5, 2e3], "f": true, "g": 7}'
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 4, 5, 8, 10])
+def test_streaming_numbers_split_by_chunks(chunk_size):
+    # A chunk boundary inside a number must not end the number
+    errors = []
+    streamed = stream_translations(io.StringIO(NUMBERS), errors, 'l10n_en.json', chunk_size)
+    assert not errors
+    assert [(val.value, val.text) for val in streamed] == list(json.loads(NUMBERS).items())
+
+@pytest.mark.parametrize('content', ['{"a": "b"', '{"a": "b"} []', '["a"]', '{"a": "b",}'])
+def test_streaming_errors(tmp_path, content):
+    path = tmp_path / 'l10n_en.json'
+    path.write_text(content, encoding='utf-8')
+    result = load_locale_file(str(path), streaming=True)
+    assert result.translate == [] and len(result.errors) == 1
+    assert result.errors[0].startswith('l10n_en.json: ')
@@ -0,0 +1,99 @@
+import importlib
+import sys
+import pytest
+from l10n.generator import Generator
+from l10n.usage import L10nUsageError, scan_source_file, scan_sources
+
+SOURCE = '''
+from app_localization import AppLocalization, BaseAppLocalization
+
+def greet(locale):
+    return AppLocalization(locale).of().helloWorld
+
+def farewell(of: BaseAppLocalization, key):
+    return getattr(of, "bye")(), getattr(of, key)
+'''
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / 'app').mkdir()
+    (tmp_path / 'app' / 'handlers.py').write_text(SOURCE)
+    yield tmp_path
+    sys.modules.pop('pruned_localization', None)
+
+@pytest.fixture
+def usage_config(project, write_config):
+    return lambda extra="": write_config(
+        extra=f"usageSources:\n  - {project / 'app'}\n" + extra, out=project / 'app' / 'pruned_localization.py'
+    )
+
+def test_scan_source_file(tmp_path):
+    path = tmp_path / 'handlers.py'
+    path.write_text(SOURCE)
+    usage = scan_source_file(str(path), 'BaseAppLocalization')
+    assert {'helloWorld', 'bye', 'of'} <= usage.names
+    assert usage.dynamic == [f"{path}:8"]
+
+def test_unused_keys_are_not_emitted(project, usage_config):
+    generator = Generator(usage_config())
+    generator.build()
+    assert generator.pruned.pruned == ['numberOfUsers']
+    assert generator.pruned.kept == ['helloWorld', 'bye']
+    assert generator.stats.pruned == 1 and generator.stats.keys == 2
+
+    sys.path.insert(0, str(project / 'app'))
+    try:
+        module = importlib.import_module('pruned_localization')
+    finally:
+        sys.path.remove(str(project / 'app'))
+    assert module.AppLocalization('ru').of().helloWorld == 'Привет мир'
+    assert module.AppLocalization('ru').of().bye() == 'Пока Мир'
+    assert not hasattr(module.BaseAppLocalization, 'numberOfUsers')
+    assert not hasattr(module.AppLocalizationEn, 'numberOfUsers')
+
+def test_keep_keys(project, usage_config):
+    generator = Generator(usage_config("keepKeys:\n  - number*\n"))
+    generator.build()
+    assert generator.pruned.pruned == []
+    assert generator.pruned.kept_by_pattern == ['numberOfUsers']
+
+def test_rebuild_when_used_names_change(project, usage_config):
+    config = usage_config()
+    assert Generator(config).build()
+    output = project / 'app' / 'pruned_localization.py'
+
+    (project / 'app' / 'handlers.py').write_text(SOURCE + "\n# only a comment changed\n")
+    assert not Generator(config).build()
+
+    (project / 'app' / 'handlers.py').write_text(SOURCE + "\ndef count(of):\n    return of.numberOfUsers('a')\n")
+    assert Generator(config).build()
+    assert 'def numberOfUsers' in output.read_text(encoding='utf-8')
+
+def test_unchanged_sources_are_not_scanned_again(project, usage_config, monkeypatch):
+    import l10n.usage
+
+    config = usage_config()
+    assert Generator(config).build()
+    scan = l10n.usage.scan_sources
+    monkeypatch.setattr(l10n.usage, 'scan_sources', None)
+    assert not Generator(config).build()
+
+    # A changed source is scanned once, its new modification time is remembered
+    (project / 'app' / 'handlers.py').write_text(SOURCE + "\n# only a comment changed\n")
+    monkeypatch.setattr(l10n.usage, 'scan_sources', scan)
+    assert not Generator(config).build()
+    monkeypatch.setattr(l10n.usage, 'scan_sources', None)
+    assert not Generator(config).build()
+
+def test_parallel_scan_matches_serial(project):
+    for i in range(5):
+        (project / 'app' / f'module{i}.py').write_text(f"x.name{i}\n")
+    serial = scan_sources([str(project / 'app')])
+    parallel = scan_sources([str(project / 'app')], jobs=2)
+    assert serial.names == parallel.names and serial.files == parallel.files == 6
+
+def test_unparsable_source(project, usage_config):
+    (project / 'app' / 'broken.py').write_text("def broken(:\n")
+    with pytest.raises(L10nUsageError) as error:
+        Generator(usage_config()).build()
+    assert 'broken.py' in str(error.value)